@@ -0,0 +1,167 @@
+"""
+Rerun budget per action (zenith/actions.py).
+
+One session is driven through every button that used to change state and
+then call st.rerun(). For each interaction it reports how many script runs
+it cost (the session's run counter, actions.RUNS_KEY) and how long it took,
+next to a plain rerun of the page it lands on: that is roughly what the old
+second run cost. It fails if an interaction goes over its budget (BUDGET),
+if an action did not take effect, or if any page render was cut short by
+st.rerun() (zenith_page_forced_reruns_total).
+
+A last case clicks RSVP in a session that was spilled while idle
+(zenith.session_spill): the action itself brings the state back. A
+control case renders a page that does call st.rerun(), to check that the
+forced-rerun counter sees it.
+
+Run from the repo root:  python benchmarks/bench_actions.py
+"""
+import logging
+import os
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bench_load  # noqa: E402  (sets up ZENITH_DATA_DIR and sys.path)
+
+from zenith import actions, metrics, session_spill, views  # noqa: E402
+
+BUDGET = 1  # script runs per interaction
+IDLE = 10 ** 6  # seconds "later" passed to sweep(), past any timeout
+
+
+def ss(at):
+    return at.session_state
+
+
+def visit(at, page):
+    return at.radio(key="page").set_value(page)
+
+
+def first_open_rsvp(at):
+    return next(b for b in at.button if b.key.startswith("rsvp_evt") and not b.disabled)
+
+
+def steps(at):
+    """Yields (label, interaction, check) for one session, in order; an interaction returns the widget to run."""
+    picked = {}
+
+    def rsvp():
+        button = first_open_rsvp(at)
+        picked["rsvp"] = button.key[len("rsvp_"):]
+        return button.click()
+
+    def details():
+        button = next(b for b in at.button if b.key.startswith("det_evt")
+                      and b.key[len("det_"):] not in ss(at).my_schedule)
+        picked["details"] = button.key[len("det_"):]
+        return button.click()
+
+    yield "visit Events", lambda: visit(at, "Events"), lambda: ss(at).page == "Events"
+    yield "RSVP", rsvp, lambda: picked["rsvp"] in ss(at).my_schedule
+    yield "open details", lambda: at.button(key="det_featured").click(), \
+        lambda: ss(at).selected_event_details is not None
+    yield "close details", lambda: bench_load.button(at, "Close").click(), \
+        lambda: ss(at).selected_event_details is None
+    yield "open details", details, lambda: ss(at).selected_event_details.id == picked["details"]
+    yield "RSVP in details", lambda: at.button(key=f"rsvp_modal_{picked['details']}").click(), \
+        lambda: picked["details"] in ss(at).my_schedule and ss(at).selected_event_details is None \
+        and [t.value for t in at.toast] == ["Added to your schedule!"]
+    yield "visit My Schedule", lambda: visit(at, "My Schedule"), lambda: True
+    yield "cancel RSVP", lambda: at.button(key=f"cancel_sched_{picked['rsvp']}").click(), \
+        lambda: picked["rsvp"] not in ss(at).my_schedule
+    yield "visit Profile", lambda: visit(at, "Profile"), lambda: True
+    yield "add goal", lambda: (at.text_input(key="new_goal").set_value("Walk daily"),
+                               bench_load.button(at, "Add Goal").click())[1], \
+        lambda: ss(at).user_goals[-1] == "Walk daily"
+    yield "remove goal", lambda: at.button(key="del_0").click(), \
+        lambda: ss(at).user_goals == ["Sleep 8 hours", "Walk daily"]
+    for key, title in [("privacy", "Privacy Policy"), ("help", "Help & Support"), ("logout", "Logout")]:
+        yield f"open {title}", lambda key=key: at.button(key=key).click(), \
+            lambda title=title: ss(at).show_modal == title
+        yield "close modal", lambda: bench_load.button(at, "Close").click(), lambda: ss(at).show_modal is None
+    yield "visit Today", lambda: visit(at, "Today"), lambda: True
+    yield "start breathing", lambda: at.button(key="start_breathing").click(), lambda: ss(at).breathing_active
+    yield "done breathing", lambda: bench_load.button(at, "I'm Done").click(), lambda: not ss(at).breathing_active
+    yield "chat with coach", lambda: at.button(key="chat_coach_home").click(), lambda: ss(at).page == "AI Coach"
+    yield "visit Sleep", lambda: visit(at, "Sleep"), lambda: True
+    yield "start wind-down", lambda: at.button(key="wind_down").click(), lambda: ss(at).wind_down_active
+    yield "close wind-down", lambda: bench_load.button(at, "Close").click(), lambda: not ss(at).wind_down_active
+    yield "visit Focus", lambda: visit(at, "Focus"), lambda: True
+    yield "start focus", lambda: (at.text_input(key="focus_task").set_value("Problem set 4"),
+                                  bench_load.button(at, "Start Focus Session").click())[1], \
+        lambda: ss(at).timer_state.running and ss(at).timer_state.task_name == "Problem set 4"
+    yield "stop focus", lambda: bench_load.button(at, "Stop Session").click(), lambda: not ss(at).timer_state.running
+
+
+def rerunning_page():
+    """A page that still handles a click inline and calls st.rerun() (AppTest script)."""
+    import streamlit as st
+
+    from zenith import metrics
+
+    with metrics.track_page("bench_rerun"):
+        if not st.session_state.get("rerun_done"):
+            st.session_state.rerun_done = True
+            st.rerun()
+        st.markdown("done")
+
+
+def interact(at, act):
+    """Runs one interaction (`act` returns the widget to run). Returns (script runs, ms)."""
+    runs = ss(at)[actions.RUNS_KEY]
+    t = time.perf_counter()
+    act().run()
+    elapsed = (time.perf_counter() - t) * 1000
+    assert not at.exception, at.exception
+    return ss(at)[actions.RUNS_KEY] - runs, elapsed
+
+
+def main():
+    logging.getLogger("streamlit.error_util").disabled = True
+    render = metrics.get_render_metrics()
+    bench_load.drive(list(bench_load.FLOWS))  # warm-up
+    at, = bench_load.drive(["browse"])[0]
+
+    print(f"{'interaction':<22} {'runs':>4} {'ms':>7} {'plain rerun ms':>15}")
+    over = []
+    for label, act, check in steps(at):
+        runs, ms = interact(at, act)
+        assert check(), f"{label}: the action did not take effect"
+        t = time.perf_counter()
+        at.run()  # what a trailing st.rerun() used to add
+        rerun_ms = (time.perf_counter() - t) * 1000
+        print(f"{label:<22} {runs:>4} {ms:>7.1f} {rerun_ms:>15.1f}")
+        if runs > BUDGET:
+            over.append(label)
+
+    forced = {page: render.page_stats(page).forced_reruns for page in views.PAGES if render.page_stats(page)}
+    print(f"\npage renders cut short by st.rerun(): {sum(forced.values())}")
+    print("actions recorded: " + ", ".join(f"{name}={render.action_stats(name).count}"
+                                           for name in sorted(actions.ACTIONS) if render.action_stats(name)))
+
+    # An action in a session spilled while idle.
+    bench_load.goto(at, "Events")
+    session_spill.get_spiller().sweep(time.time() + IDLE)
+    assert "my_schedule" not in ss(at)
+    event_id = first_open_rsvp(at).key[len("rsvp_"):]
+    runs, ms = interact(at, lambda: at.button(key=f"rsvp_{event_id}").click())
+    print(f"\nRSVP after a spill: {runs} run(s), {ms:.1f} ms, in schedule={event_id in ss(at).my_schedule}")
+    assert event_id in ss(at).my_schedule
+
+    # Control: the counter does see a page that calls st.rerun().
+    control = AppTest.from_function(rerunning_page, default_timeout=30).run()
+    assert not control.exception, control.exception
+    stats = render.page_stats("bench_rerun")
+    print(f"control page calling st.rerun(): {stats.latency.count} renders, {stats.forced_reruns} cut short")
+    assert stats.latency.count == 2 and stats.forced_reruns == 1
+
+    assert not over, f"over the rerun budget ({BUDGET}): {', '.join(over)}"
+    assert not any(forced.values()), f"forced reruns: {forced}"
+    print(f"every interaction ran the script at most {BUDGET} time(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Coach chat history (zenith/chat_history.py): cost of a rerun as the
+conversation grows.
+
+For conversations of increasing length, this times window() (what every
+AI Coach rerun reads), a cold load of the user (first visit after a
+restart), and a "load earlier" page. It also reports how many rows stay on
+disk. Then it renders the AI Coach page through AppTest with a short and a
+very long history. All data goes to a temporary DATA_DIR.
+
+Run from the repo root:  python benchmarks/bench_chat_history.py
+"""
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ["ZENITH_DATA_DIR"] = tempfile.mkdtemp(prefix="zenith-bench-")
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from zenith import chat_history, config, stores  # noqa: E402
+
+LENGTHS = [10, 1_000, 10_000, 100_000]
+LOOPS = 2_000
+PROMPTS = ["I'm stressed about my stats exam", "ok thanks", "I keep procrastinating", "can't sleep lately"]
+
+
+def fill(store, user_id, n):
+    start = time.time() - n * 60
+    for i in range(n):
+        role = "user" if i % 2 == 0 else "assistant"
+        store.append(user_id, role, PROMPTS[i // 2 % len(PROMPTS)] if role == "user" else "Here's a tip.", ts=start + i * 60)
+
+
+def timed_us(fn, loops=LOOPS):
+    times = []
+    for _ in range(loops):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1e6)
+    return statistics.median(times)
+
+
+def main():
+    path = config.data_path("bench_chat.db")
+    store = chat_history.ChatHistoryStore(path)
+    print(f"{'turns':>8} {'window us':>9} {'cold ms':>7} {'page us':>7} {'rows':>5} {'summaries':>9}")
+    for n in LENGTHS:
+        user_id = f"user{n}"
+        fill(store, user_id, n)
+        window_us = timed_us(lambda: store.window(user_id))
+        page_us = timed_us(lambda: store.window(user_id, pages=1), loops=200)
+        t = time.perf_counter()
+        chat_history.ChatHistoryStore(path).window(user_id)
+        cold_ms = (time.perf_counter() - t) * 1000
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM chat_turns WHERE user_id = ?", (user_id,)).fetchone()[0]
+        print(f"{n:>8,} {window_us:>9.1f} {cold_ms:>7.2f} {page_us:>7.0f} {rows:>5} {len(store.summaries(user_id)):>9}")
+
+    # The AI Coach page itself, with the demo user's history short vs long.
+    for n in (5, 100_000):
+        fill(stores.get_chat_history(), config.DEMO_USER_ID, n - 5 if n > 5 else 0)
+        at = AppTest.from_file(os.path.join(ROOT, "cs330.py"), default_timeout=60).run()
+        at.session_state.page = "AI Coach"
+        at.run()
+        times = []
+        for _ in range(20):
+            t = time.perf_counter()
+            at.run()
+            times.append((time.perf_counter() - t) * 1000)
+        assert not at.exception, at.exception
+        print(f"AI Coach rerun with {n:,} turns in history: {statistics.median(times):.1f} ms, {len(at.chat_message)} messages drawn")
+
+
+if __name__ == "__main__":
+    main()
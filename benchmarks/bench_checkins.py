@@ -0,0 +1,95 @@
+"""
+Daily Check-In store (zenith/checkins.py) under load.
+
+- Bulk-loads ~2M historical check-ins (2,000 users x ~1,000 days).
+- Measures what the render thread pays for "Log Now" (enqueue latency)
+  while many concurrent sessions log at once.
+- Measures "last 7 / 30 days" reads for random users on the full table.
+
+Run from the repo root:  python benchmarks/bench_checkins.py
+"""
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith.checkins import DAY_SECONDS, CheckinStore  # noqa: E402
+
+USERS = 2_000
+DAYS = 1_000
+SESSIONS = 64
+LOGS_PER_SESSION = 200
+QUERIES = 2_000
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def main():
+    rng = random.Random(330)
+    tmp = tempfile.mkdtemp()
+    store = CheckinStore(os.path.join(tmp, "checkins.db"), batch_size=5_000)
+    now = time.time()
+
+    t0 = time.perf_counter()
+    for u in range(USERS):
+        store.log_many(
+            (f"user{u}", now - d * DAY_SECONDS, rng.randint(1, 5), rng.randint(1, 5), ("Exams",))
+            for d in range(DAYS)
+        )
+    store.flush()
+    load_s = time.perf_counter() - t0
+    print(f"bulk load: {USERS * DAYS:,} rows in {load_s:.1f}s ({USERS * DAYS / load_s:,.0f} rows/s)")
+
+    # Concurrent sessions hitting "Log Now".
+    enqueue_us = []
+    lock = threading.Lock()
+
+    def session(i):
+        local = []
+        for _ in range(LOGS_PER_SESSION):
+            t = time.perf_counter()
+            store.log(f"user{i}", 3, 2, ("Exams", "Sleep"))
+            local.append((time.perf_counter() - t) * 1e6)
+        with lock:
+            enqueue_us.extend(local)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(SESSIONS)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.flush()
+    write_s = time.perf_counter() - t0
+    print(
+        f"{SESSIONS} sessions x {LOGS_PER_SESSION} logs: render-thread cost"
+        f" p50 {statistics.median(enqueue_us):.1f} us, p99 {percentile(enqueue_us, 0.99):.1f} us;"
+        f" all committed in {write_s:.2f}s"
+    )
+
+    for days in (7, 30):
+        samples = []
+        for _ in range(QUERIES):
+            user = f"user{rng.randrange(USERS)}"
+            t = time.perf_counter()
+            rows = store.recent(user, days=days, now=now)
+            samples.append((time.perf_counter() - t) * 1000)
+            assert days - 1 <= len(rows) <= days + LOGS_PER_SESSION + 1
+        print(
+            f"recent({days} days): p50 {statistics.median(samples):.3f} ms,"
+            f" p99 {percentile(samples, 0.99):.3f} ms"
+        )
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
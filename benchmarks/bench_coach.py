@@ -0,0 +1,73 @@
+"""
+AI coach streaming (zenith/coach.py): time to first token and concurrency.
+
+A single chat is timed through stream_reply(), the generator the page hands
+to st.write_stream: first chunk and full reply. The old page showed nothing
+until a 1.5 s sleep on the script thread was over. Then CONCURRENT chats run
+at once, each read by its own thread, the way each session's script thread
+reads its reply. This checks two things: time to first token holds up under
+load, and generation adds one loop thread, not one per chat.
+
+Run from the repo root:  python benchmarks/bench_coach.py
+"""
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from zenith import coach, metrics  # noqa: E402
+
+CONCURRENT = 200
+OLD_REPLY_SEC = 1.5
+PROMPTS = ["I'm stressed about finals", "I keep getting distracted", "I can't sleep", "thanks!"]
+
+
+def timed_reply(backend, loop, registry, prompt):
+    """Returns (seconds to first chunk, seconds to full reply)."""
+    start = time.perf_counter()
+    first = None
+    for _ in coach.stream_reply([("user", prompt)], backend, loop, registry):
+        if first is None:
+            first = time.perf_counter() - start
+    return first, time.perf_counter() - start
+
+
+def main():
+    backend = coach.LocalCoach()
+    loop = coach._LoopThread()
+    registry = metrics.RenderMetrics()
+
+    first, total = timed_reply(backend, loop, registry, PROMPTS[0])
+    print(f"one chat: first token {first * 1000:.0f} ms, full reply {total * 1000:.0f} ms "
+          f"(was {OLD_REPLY_SEC * 1000:.0f} ms before anything showed)")
+
+    results = [None] * CONCURRENT
+    threads_before = threading.active_count()
+
+    def chat(i):
+        results[i] = timed_reply(backend, loop, registry, PROMPTS[i % len(PROMPTS)])
+
+    readers = [threading.Thread(target=chat, args=(i,)) for i in range(CONCURRENT)]
+    start = time.perf_counter()
+    for t in readers:
+        t.start()
+    extra_threads = threading.active_count() - threads_before - CONCURRENT
+    for t in readers:
+        t.join()
+    wall = time.perf_counter() - start
+
+    firsts = sorted(r[0] * 1000 for r in results)
+    totals = sorted(r[1] * 1000 for r in results)
+    print(f"{CONCURRENT} concurrent chats in {wall:.2f} s; threads added besides the readers: {extra_threads}")
+    print(f"  first token: p50 {statistics.median(firsts):.0f} ms, p95 {firsts[int(0.95 * len(firsts))]:.0f} ms")
+    print(f"  full reply:  p50 {statistics.median(totals):.0f} ms, p95 {totals[int(0.95 * len(totals))]:.0f} ms")
+    hist = registry.first_token(backend.name)
+    print(f"  recorded in metrics: {hist.count} replies, p95 {hist.quantile(0.95) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Cold start: time to first render of the Today page in a fresh interpreter.
+
+Each trial is a new Python process, so no module is already imported. The
+process loads Streamlit's AppTest harness (not timed, since a real server has
+Streamlit loaded before any session connects). It then times the first
+script run, which renders Today, and records which heavy packages that run
+pulled in. Next it times the first visit to Sleep, the page that lazily
+imports the chart stack.
+
+Run from the repo root:  python benchmarks/bench_cold_start.py [--trials N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ["altair", "pandas", "pyarrow", "numpy", "PIL"]
+
+
+def trial():
+    from streamlit.testing.v1 import AppTest
+
+    already = {m for m in HEAVY if m in sys.modules}
+    at = AppTest.from_file(os.path.join(ROOT, "cs330.py"), default_timeout=60)
+    t = time.perf_counter()
+    at.run()
+    today_ms = (time.perf_counter() - t) * 1000
+    assert not at.exception, at.exception
+    loaded = [m for m in HEAVY if m in sys.modules and m not in already]
+
+    at.session_state.page = "Sleep"
+    t = time.perf_counter()
+    at.run()
+    sleep_ms = (time.perf_counter() - t) * 1000
+    assert not at.exception, at.exception
+    print(json.dumps({"today_ms": today_ms, "sleep_ms": sleep_ms, "loaded": loaded}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--trial", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.trial:
+        trial()
+        return
+
+    results = []
+    for _ in range(args.trials):
+        out = subprocess.run([sys.executable, __file__, "--trial"], capture_output=True, text=True, check=True, cwd=ROOT)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    print(f"first render of Today: median {statistics.median(r['today_ms'] for r in results):7.1f} ms over {args.trials} fresh processes")
+    print(f"  heavy packages imported by it: {', '.join(results[0]['loaded']) or 'none'}")
+    print(f"first visit to Sleep:  median {statistics.median(r['sleep_ms'] for r in results):7.1f} ms (imports the chart stack)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+EventStore / Schedule (zenith/events.py) vs. the list-based code paths they
+replaced, on catalogs up to 10k events. Only the data access each page does
+per render is timed (no Streamlit):
+
+- Events page: one "already RSVP'd?" check per card;
+- My Schedule page: id -> event lookup for every RSVP (the old code rebuilt
+  event_details_map on each render) and one cancel;
+- category filter: pick out one category's events.
+
+Run from the repo root:  python benchmarks/bench_event_store.py
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith.events import EventStore, Schedule  # noqa: E402
+
+CATALOGS = [100, 1_000, 10_000]
+CATEGORIES = ["Wellness", "Academic", "Social", "Fitness"]
+REPEAT = 5
+
+
+def make_events(n, rng):
+    return [
+        {
+            "id": f"evt{i}", "cat": rng.choice(CATEGORIES), "title": f"Event {i}",
+            "time": f"Fri, Nov {1 + i % 28}, 4:00 PM", "loc": "Main Quad", "dist": "0.1 mi", "cost": "Free",
+        }
+        for i in range(n)
+    ]
+
+
+def old_render(all_events, my_schedule, cancel_id):
+    for event in all_events[1:]:
+        event["id"] in my_schedule
+    event_details_map = {event["id"]: event for event in all_events}
+    for event_id in my_schedule:
+        event_details_map.get(event_id)
+    [e for e in all_events if e["cat"] == "Fitness"]
+    my_schedule.remove(cancel_id)
+    my_schedule.append(cancel_id)
+
+
+def new_render(store, schedule, cancel_id):
+    featured = store.featured()
+    for event in store:
+        if event is featured:
+            continue
+        event.id in schedule
+    for event_id in schedule:
+        store.get(event_id)
+    store.in_category("Fitness")
+    schedule.discard(cancel_id)
+    schedule.add(cancel_id)
+
+
+def timed(fn, *args):
+    samples = []
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - t) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    rng = random.Random(330)
+    print(f"{'events':>7}{'rsvps':>7}{'list ms':>10}{'store ms':>10}{'speedup':>9}")
+    for n in CATALOGS:
+        events = make_events(n, rng)
+        rsvps = [e["id"] for e in rng.sample(events, n // 10)]
+        cancel_id = rsvps[0]
+
+        old_ms = timed(old_render, events, list(rsvps), cancel_id)
+        new_ms = timed(new_render, EventStore(events), Schedule(rsvps), cancel_id)
+        print(f"{n:>7}{len(rsvps):>7}{old_ms:>10.2f}{new_ms:>10.2f}{old_ms / new_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Events page rerun cost as the catalog grows (category filter + paging).
+
+Drives cs330.py headlessly with AppTest on catalogs from 10 to 10k events
+(swapped in as the shared catalog of zenith.stores) and reports the median rerun time and how many elements the page emits,
+for "All" and for one category. Both should stay flat: only one page of
+EVENTS_PER_PAGE cards is built per rerun.
+
+Run from the repo root:  python benchmarks/bench_events_page.py
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from zenith import catalog, stores  # noqa: E402
+
+APP = os.path.join(ROOT, "cs330.py")
+CATALOGS = [10, 100, 1_000, 10_000]
+CATEGORIES = ["Wellness", "Academic", "Social", "Fitness"]
+REPEAT = 10
+
+
+def make_catalog(n, rng):
+    return [
+        {
+            "id": f"evt{i}", "cat": rng.choice(CATEGORIES), "title": f"Event {i}",
+            "time": f"Fri, Nov {1 + i % 28}, 4:00 PM", "loc": "Main Quad", "dist": "0.1 mi",
+            "cost": "Free", "desc": "", "details": "",
+        }
+        for i in range(n)
+    ]
+
+
+def use_catalog(events):
+    """Makes `events` the app's shared event catalog."""
+    catalog.get_default_events = lambda: events
+    stores._event_catalog.clear()
+
+
+def rerun_ms(at):
+    samples = []
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - t) * 1000)
+    assert not at.exception, at.exception
+    return statistics.median(samples)
+
+
+def main():
+    rng = random.Random(330)
+    print(f"{'events':>7}{'All ms':>9}{'elements':>10}{'Fitness ms':>12}{'elements':>10}")
+    for n in CATALOGS:
+        use_catalog(make_catalog(n, rng))
+        at = AppTest.from_file(APP, default_timeout=60)
+        at.session_state["page"] = "Events"
+        at.run()
+        all_ms, all_elements = rerun_ms(at), len(list(at.main))
+        at.selectbox(key="event_category").set_value("Fitness").run()
+        fit_ms, fit_elements = rerun_ms(at), len(list(at.main))
+        print(f"{n:>7}{all_ms:>9.1f}{all_elements:>10}{fit_ms:>12.1f}{fit_elements:>10}")
+
+
+if __name__ == "__main__":
+    main()
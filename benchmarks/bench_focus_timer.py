@@ -0,0 +1,118 @@
+"""
+Script runs per minute for a running Pomodoro timer, before and after the
+countdown moved into a fragment.
+
+Before: page_focus slept for a second and called st.rerun(), so every
+running timer re-ran all of cs330.py about once per second. This is
+emulated around today's app: a wrapper script runs cs330.py and, while the
+timer runs, sleeps TICK_SECONDS and calls st.rerun().
+After: the countdown fragment re-renders on its own once per second and the
+app itself is only re-run when the phase ends. AppTest has no browser to
+fire the fragment's run_every timer, so the driver asks for a
+fragment-scoped run on the same schedule.
+
+Both modes start a focus session with the Start button and are then left
+running for WINDOW_SEC of wall-clock time. App runs are counted by the app
+(actions.RUNS_KEY), fragment runs by the driver. Script time for the
+"after" mode is measured around each AppTest run, so it includes AppTest's
+own overhead.
+
+Run from the repo root:  python benchmarks/bench_focus_timer.py
+"""
+import functools
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("ZENITH_DATA_DIR", tempfile.mkdtemp(prefix="zenith-bench-"))
+
+from zenith import actions  # noqa: E402
+from zenith.focus_timer import TICK_SECONDS  # noqa: E402
+
+APP = os.path.join(ROOT, "cs330.py")
+WINDOW_SEC = 10
+
+
+def _rerun_loop(root, app, tick):
+    """The old page_focus around today's app: rerun everything every tick while the timer runs."""
+    import runpy
+    import sys
+    import time
+
+    import streamlit as st
+
+    sys.path.insert(0, root)
+    start = time.perf_counter()
+    runpy.run_path(app, run_name="__main__")
+    st.session_state.bench_busy_sec = st.session_state.get("bench_busy_sec", 0.0) + time.perf_counter() - start
+    if st.session_state.timer_state.running:
+        time.sleep(tick)
+        st.rerun()
+
+
+def _start(at):
+    """Opens the Focus page and starts a session. Returns the app's run count."""
+    at.session_state["page"] = "Focus"
+    at.run()
+    return at.session_state[actions.RUNS_KEY]
+
+
+def before():
+    """Returns (app runs, fragment runs, busy seconds) over the window."""
+    at = AppTest.from_function(_rerun_loop, args=(ROOT, APP, TICK_SECONDS), default_timeout=30)
+    runs = _start(at)
+    try:
+        next(b for b in at.button if b.label == "Start Focus Session").click().run(timeout=WINDOW_SEC)
+    except RuntimeError:  # the loop never finishes; AppTest stops it at the timeout
+        pass
+    return at.session_state[actions.RUNS_KEY] - runs, 0, at.session_state["bench_busy_sec"]
+
+
+def after():
+    """Returns (app runs, fragment runs, busy seconds) over the window."""
+    at = AppTest.from_file(APP, default_timeout=30)
+    runs = _start(at)
+    next(b for b in at.button if b.label == "Start Focus Session").click().run()
+    assert not at.exception, at.exception
+    runs = at.session_state[actions.RUNS_KEY]
+    fragment_id, = at._fragment_storage._fragments  # the countdown
+    fragment_runs, busy = 0, 0.0
+    # What the browser sends each tick: a rerun of the fragment alone.
+    local_script_runner.RerunData = functools.partial(
+        RerunData, fragment_id_queue=[fragment_id], is_fragment_scoped_rerun=True)
+    try:
+        end = next_tick = time.perf_counter()
+        end += WINDOW_SEC
+        while next_tick < end:
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+            t = time.perf_counter()
+            at.run()
+            busy += time.perf_counter() - t
+            assert not at.exception, at.exception
+            fragment_runs += 1
+            next_tick += TICK_SECONDS
+    finally:
+        local_script_runner.RerunData = RerunData
+    assert at.session_state.timer_state.running
+    return at.session_state[actions.RUNS_KEY] - runs, fragment_runs, busy
+
+
+def main():
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").disabled = True
+    per_min = 60 / WINDOW_SEC
+    print(f"a running 25-min focus session, {WINDOW_SEC} s of wall-clock time per mode\n")
+    print(f"{'mode':<10}{'app runs/min':>14}{'fragment runs/min':>19}{'script ms/min':>15}")
+    for mode, measure in [("before", before), ("after", after)]:
+        app_runs, fragment_runs, busy = measure()
+        print(f"{mode:<10}{app_runs * per_min:>14.0f}{fragment_runs * per_min:>19.0f}{busy * 1000 * per_min:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
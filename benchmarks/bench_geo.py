@@ -0,0 +1,76 @@
+"""
+Nearest-k "near you" lookup (zenith/geo.py) on a 50k-event regional catalog.
+
+Events are scattered over a ~55 x 55 km region with denser clusters around a
+few campuses. Each query asks for the k nearest events from a random point
+in the region; results are checked against a brute-force haversine over the
+whole catalog, which is also timed for comparison. Users far from every
+event (FAR_AWAY) are timed too: their cost must not grow with the distance.
+
+Run from the repo root:  python benchmarks/bench_geo.py
+"""
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith.geo import GeoIndex, haversine_m  # noqa: E402
+
+EVENTS = 50_000
+QUERIES = 2_000
+K = 10
+CENTER = (37.8719, -122.2585)
+FAR_AWAY = {"Los Angeles": (34.0522, -118.2437), "New York": (40.7128, -74.0060),
+            "Anchorage": (61.2181, -149.9003), "Sydney": (-33.8688, 151.2093)}
+
+
+def main():
+    rng = np.random.default_rng(330)
+    spread = rng.uniform(-0.25, 0.25, (EVENTS // 2, 2))
+    hubs = rng.uniform(-0.2, 0.2, (8, 2))
+    clustered = hubs[rng.integers(0, len(hubs), EVENTS - len(spread))] + rng.normal(0, 0.01, (EVENTS - len(spread), 2))
+    points = np.vstack((spread, clustered)) + CENTER
+    ids = [f"evt{i}" for i in range(EVENTS)]
+
+    t0 = time.perf_counter()
+    index = GeoIndex(ids, points[:, 0], points[:, 1])
+    build_ms = (time.perf_counter() - t0) * 1000
+    print(f"build: {EVENTS:,} events in {build_ms:.1f} ms")
+
+    queries = rng.uniform(-0.25, 0.25, (QUERIES, 2)) + CENTER
+    grid_us, brute_us = [], []
+    for lat, lon in queries.tolist():
+        t = time.perf_counter()
+        result = index.nearest(lat, lon, K)
+        grid_us.append((time.perf_counter() - t) * 1e6)
+
+        t = time.perf_counter()
+        dist = haversine_m(lat, lon, points[:, 0], points[:, 1])
+        best = np.argpartition(dist, K)[:K]
+        best = best[np.argsort(dist[best])]
+        brute_us.append((time.perf_counter() - t) * 1e6)
+
+        assert np.allclose([m for _, m in result], dist[best]), (lat, lon)
+
+    grid_us.sort()
+    brute_us.sort()
+    print(f"nearest {K}, grid index:  p50 {statistics.median(grid_us):7.1f} us, p99 {grid_us[int(QUERIES * 0.99)]:7.1f} us")
+    print(f"nearest {K}, brute force: p50 {statistics.median(brute_us):7.1f} us, p99 {brute_us[int(QUERIES * 0.99)]:7.1f} us")
+
+    for city, (lat, lon) in FAR_AWAY.items():
+        times = []
+        for _ in range(20):
+            t = time.perf_counter()
+            result = index.nearest(lat, lon, K)
+            times.append((time.perf_counter() - t) * 1e3)
+        dist = np.sort(haversine_m(lat, lon, points[:, 0], points[:, 1]))[:K]
+        assert np.allclose([m for _, m in result], dist), city
+        print(f"nearest {K} from {city + ':':<13} p50 {statistics.median(times):6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
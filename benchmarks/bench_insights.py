@@ -0,0 +1,98 @@
+"""
+Insight engine (zenith/insights.py): what a page load pays vs. the analysis.
+
+Each user gets HISTORY_DAYS of synthetic check-ins (a few a day), sleep logs
+and focus sessions, with stress tied to short nights. For growing histories
+it times four things:
+- compute(): the background analysis of the last WINDOW_DAYS, reading the
+  whole window (a fresh engine) and incrementally (rows since the last run),
+- get(): what the Today and AI Coach pages call, on a user's first visit
+  (nothing computed yet, must not wait) and once the insight is cached,
+- a refresh round trip: a new log, then the insight is ready again.
+
+Run from the repo root:  python benchmarks/bench_insights.py
+"""
+import datetime
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from zenith import checkins, focus_log, insights, sleep_store  # noqa: E402
+
+HISTORY_DAYS = [30, 365, 3 * 365]
+CHECKINS_PER_DAY = 3
+GET_LOOPS = 100_000
+
+
+def fill(ck, sl, fl, user_id, days, rng):
+    now = time.time()
+    today = datetime.date.today()
+    hours = rng.uniform(5.0, 9.0, days)
+    nights = [sleep_store.to_night(today - datetime.timedelta(days=d + 1)) for d in range(days)]
+    sl.append_many(user_id, night=nights, bed_min=np.full(days, 23 * 60),
+                   wake_min=(23 * 60 + hours * 60).astype(int) % (24 * 60), quality=np.full(days, 3))
+    rows = []
+    for d in range(days):
+        stress = int(np.clip(round(9 - hours[d] + rng.normal(0, 0.7)), 1, 5))
+        for k in range(CHECKINS_PER_DAY):
+            rows.append((user_id, now - d * 86400 - k * 3600, 6 - stress, stress, ["Exams"] if stress > 3 else []))
+    ck.log_many(rows)
+    fl.log_many([(user_id, now - d * 86400 - 5 * 3600, hours[d] * 8) for d in range(days)])
+    ck.flush()
+
+
+def timed(fn, loops):
+    times = []
+    for _ in range(loops):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return times
+
+
+def main():
+    rng = np.random.default_rng(330)
+    root = tempfile.mkdtemp(prefix="zenith-bench-")
+    ck = checkins.CheckinStore(os.path.join(root, "checkins.db"))
+    sl = sleep_store.SleepLogStore(os.path.join(root, "sleep"))
+    fl = focus_log.FocusLog(os.path.join(root, "focus.db"))
+    engine = insights.InsightEngine(ck, sl, fl)
+
+    print(f"{'history':>8} {'full ms':>8} {'incr ms':>8} {'first get us':>12} {'get us':>7} {'refresh ms':>10}  insight")
+    for days in HISTORY_DAYS:
+        user_id = f"user{days}"
+        fill(ck, sl, fl, user_id, days, rng)
+        full_ms = statistics.median(timed(
+            lambda: insights.InsightEngine(ck, sl, fl, start=False).compute(user_id), 20)) * 1000
+        warm = insights.InsightEngine(ck, sl, fl, start=False)
+        warm.compute(user_id)
+        incremental_ms = statistics.median(timed(lambda: warm.compute(user_id), 20)) * 1000
+
+        t = time.perf_counter()
+        first = engine.get(user_id)
+        first_get_us = (time.perf_counter() - t) * 1e6
+        assert first is None and first_get_us < 1000, "get() waited for the first insight"
+        engine.wait(user_id, timeout=5)
+        get_us = statistics.median(timed(lambda: engine.get(user_id), GET_LOOPS)) * 1e6
+
+        # A new check-in arrives; how long until get() has the updated insight?
+        before = engine.get(user_id)
+        t = time.perf_counter()
+        ck.log(user_id, 1, 5, ["Exams"])
+        engine.refresh(user_id)
+        while engine.get(user_id) is before:
+            time.sleep(0.001)
+        refresh_ms = (time.perf_counter() - t) * 1000
+        print(f"{days:>6} d {full_ms:>8.1f} {incremental_ms:>8.1f} {first_get_us:>12.1f} {get_us:>7.2f}"
+              f" {refresh_ms:>10.0f}  {engine.get(user_id).summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Load test: many simulated sessions driven through realistic flows.
+
+Every session is its own AppTest, with its own session state, and shares the
+process-wide caches (stores, metrics, scheduler) the way browser tabs on one
+server do. Sessions are assigned a flow and stepped round-robin, one action
+at a time, so they are all resident at once:
+
+- browse: open the app and visit every page through the sidebar radio
+- rsvp:   RSVP on the Events page, open and close Details, cancel the RSVP
+          from My Schedule
+- focus:  start a Pomodoro, finish it, take the break, stop
+- coach:  open the AI Coach and send a message
+
+An action is one interaction and everything it triggers (st.rerun()
+included). The harness reports throughput, per-flow latency percentiles and
+errors. A second pass runs the same sessions under tracemalloc to get the
+Python heap per session; the AppTest element trees are included, so this
+overstates what a real server keeps. So is each session's last script
+runner, which its idle-spill entry holds (zenith.session_spill): an
+AppTest runner carries its own compiled copy of the script and its
+message queue, where a server's runners share one script cache and keep
+no messages.
+
+Pomodoro phases end on the shared scheduler after minutes; the focus flow
+simulates that by setting timer_state.finished, as the scheduler callback
+does.
+
+Run from the repo root:
+    python benchmarks/bench_load.py                   # report and compare with the baseline
+    python benchmarks/bench_load.py --save-baseline   # record a new baseline
+
+The comparison exits with status 1 if any of these regress by more than
+--tolerance: throughput, a flow's p95 (plus --slack-ms), or memory per
+session. It also fails on any new errors.
+"""
+import argparse
+import functools
+import gc
+import itertools
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ["ZENITH_DATA_DIR"] = tempfile.mkdtemp(prefix="zenith-load-")
+
+from streamlit.components.v2.component_manager import BidiComponentManager  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from zenith import views  # noqa: E402
+
+BASELINE = os.path.join(ROOT, "benchmarks", "load_baseline.json")
+FLOW_MIX = {"browse": 0.4, "rsvp": 0.25, "focus": 0.2, "coach": 0.15}
+
+
+def goto(at, page):
+    at.radio(key="page").set_value(page).run()
+
+
+def button(at, label):
+    return next(b for b in at.button if b.label == label and not b.disabled)
+
+
+def flow_browse(at):
+    at.run()
+    yield "open"
+    for page in views.PAGES:
+        goto(at, page)
+        yield f"visit {page}"
+
+
+def flow_rsvp(at):
+    at.run()
+    yield "open"
+    goto(at, "Events")
+    yield "visit Events"
+    rsvp = next(b for b in at.button if b.key.startswith("rsvp_") and not b.disabled)
+    rsvp.click().run()
+    yield "rsvp"
+    at.button(key="det_featured").click().run()
+    yield "open details"
+    button(at, "Close").click().run()
+    yield "close details"
+    goto(at, "My Schedule")
+    yield "visit My Schedule"
+    next(b for b in at.button if b.key.startswith("cancel_sched_")).click().run()
+    yield "cancel rsvp"
+
+
+def flow_focus(at):
+    at.run()
+    yield "open"
+    goto(at, "Focus")
+    yield "visit Focus"
+    at.text_input[0].set_value("Problem set 4 (CS 330)")
+    button(at, "Start Focus Session").click().run()
+    yield "start focus"
+    at.session_state.timer_state.finished = True
+    at.run()
+    yield "focus finished"
+    next(b for b in at.button if b.label.startswith("Start ") and "Break" in b.label).click().run()
+    yield "start break"
+    at.session_state.timer_state.finished = True
+    at.run()
+    yield "break finished"
+    button(at, "Stop for Now").click().run()
+    yield "stop"
+
+
+def flow_coach(at):
+    at.run()
+    yield "open"
+    goto(at, "AI Coach")
+    yield "visit AI Coach"
+    at.chat_input[0].set_value("I'm feeling overwhelmed about finals.").run()
+    yield "chat"
+
+
+FLOWS = {"browse": flow_browse, "rsvp": flow_rsvp, "focus": flow_focus, "coach": flow_coach}
+
+
+def assign_flows(sessions):
+    """Splits `sessions` between the flows in FLOW_MIX proportions."""
+    counts = {name: int(sessions * share) for name, share in FLOW_MIX.items()}
+    for name in itertools.islice(itertools.cycle(FLOW_MIX), sessions - sum(counts.values())):
+        counts[name] += 1
+    return [name for name, n in counts.items() for _ in range(n)]
+
+
+@functools.cache
+def _components():
+    manager = BidiComponentManager()
+    manager.discover_and_register_components(start_file_watching=False)
+    return manager
+
+
+def drive(flow_names, latencies=None, errors=None):
+    """
+    Runs one AppTest per flow name, round-robin, until every flow is done.
+    Returns the AppTests (still alive) and the number of actions taken.
+    """
+    apps = [AppTest.from_file(os.path.join(ROOT, "cs330.py"), default_timeout=60) for _ in flow_names]
+    for at in apps:
+        # Each AppTest scans every installed package for components on its
+        # first run; a server does that once at startup, so share one scan.
+        at._bidi_component_manager = _components()
+    active = [(name, at, FLOWS[name](at)) for name, at in zip(flow_names, apps)]
+    actions = 0
+    while active:
+        still = []
+        for name, at, steps in active:
+            t = time.perf_counter()
+            try:
+                next(steps)
+            except StopIteration:
+                continue
+            except Exception as exc:  # a widget the flow expected is missing
+                failure = f"{type(exc).__name__}: {exc}"
+            else:
+                failure = at.exception[0].message if at.exception else None
+            elapsed = time.perf_counter() - t
+            actions += 1
+            if latencies is not None:
+                latencies[name].append(elapsed * 1000)
+            if failure:
+                if errors is not None:
+                    errors[name].append(failure)
+                continue  # this session's flow can't go on
+            still.append((name, at, steps))
+        active = still
+    return apps, actions
+
+
+def run(sessions):
+    flow_names = assign_flows(sessions)
+    latencies = {name: [] for name in FLOWS}
+    errors = {name: [] for name in FLOWS}
+    drive(list(FLOWS))  # one session per flow warms the shared caches and imports
+
+    t = time.perf_counter()
+    apps, actions = drive(flow_names, latencies, errors)
+    wall = time.perf_counter() - t
+    del apps
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    apps, _ = drive(flow_names)
+    gc.collect()
+    per_session = (tracemalloc.get_traced_memory()[0] - before) / len(apps)
+    tracemalloc.stop()
+    del apps
+
+    result = {
+        "sessions": sessions,
+        "actions": actions,
+        "throughput": actions / wall,
+        "mem_per_session_kb": per_session / 1024,
+        "flows": {},
+    }
+    for name in FLOWS:
+        lat = np.asarray(latencies[name])
+        result["flows"][name] = {
+            "sessions": flow_names.count(name),
+            "actions": lat.size,
+            "p50_ms": float(np.percentile(lat, 50)) if lat.size else None,
+            "p95_ms": float(np.percentile(lat, 95)) if lat.size else None,
+            "p99_ms": float(np.percentile(lat, 99)) if lat.size else None,
+            "errors": len(errors[name]),
+            "first_error": errors[name][0] if errors[name] else None,
+        }
+    return result
+
+
+def report(result):
+    print(f"{result['sessions']} sessions, {result['actions']:,} actions, "
+          f"{result['throughput']:.1f} actions/s, {result['mem_per_session_kb']:,.0f} KB heap per session")
+    print(f"{'flow':<8} {'sessions':>8} {'actions':>7} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'errors':>6}")
+    for name, flow in result["flows"].items():
+        if not flow["actions"]:
+            continue
+        print(f"{name:<8} {flow['sessions']:>8} {flow['actions']:>7} {flow['p50_ms']:>7.1f} "
+              f"{flow['p95_ms']:>7.1f} {flow['p99_ms']:>7.1f} {flow['errors']:>6}")
+        if flow["first_error"]:
+            print(f"         first error: {flow['first_error']}")
+
+
+def regressions(result, baseline, tolerance, slack_ms):
+    """Returns a description of every metric worse than the baseline allows."""
+    found = []
+    if result["throughput"] < baseline["throughput"] * (1 - tolerance):
+        found.append(f"throughput {result['throughput']:.1f}/s < baseline {baseline['throughput']:.1f}/s")
+    if result["mem_per_session_kb"] > baseline["mem_per_session_kb"] * (1 + tolerance):
+        found.append(f"memory {result['mem_per_session_kb']:.0f} KB/session > baseline {baseline['mem_per_session_kb']:.0f} KB")
+    for name, flow in result["flows"].items():
+        base = baseline["flows"].get(name)
+        if not base or not flow["actions"]:
+            continue
+        if base["p95_ms"] is not None and flow["p95_ms"] > base["p95_ms"] * (1 + tolerance) + slack_ms:
+            found.append(f"{name} p95 {flow['p95_ms']:.1f} ms > baseline {base['p95_ms']:.1f} ms")
+        if flow["errors"] > base["errors"]:
+            found.append(f"{name} errors {flow['errors']} > baseline {base['errors']}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=40)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative slowdown (0.5 = 50%%)")
+    parser.add_argument("--slack-ms", type=float, default=15, help="p95 growth always allowed, for timer noise")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+    logging.getLogger("streamlit.error_util").disabled = True  # failures are counted per flow instead
+
+    result = run(args.sessions)
+    report(result)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+        print(f"baseline saved to {os.path.relpath(args.baseline, ROOT)}")
+        return
+    if not os.path.exists(args.baseline):
+        print("no baseline to compare with (run with --save-baseline)")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["sessions"] != result["sessions"]:
+        sys.exit(f"baseline was recorded with {baseline['sessions']} sessions; rerun with --sessions {baseline['sessions']}")
+    found = regressions(result, baseline, args.tolerance, args.slack_ms)
+    for line in found:
+        print(f"REGRESSION: {line}")
+    if found:
+        sys.exit(1)
+    print(f"no regressions against the baseline (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
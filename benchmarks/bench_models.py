@@ -0,0 +1,129 @@
+"""
+Compact models (zenith/models.py) vs. the dicts they replaced.
+
+Memory: heap bytes per object from tracemalloc, for CATALOG events (old: a
+dict with parsed start/end datetimes; new: a slotted Event with interned
+strings and epoch-second floats), for the resources and for a timer state
+(SimpleNamespace vs. TimerState). Each object's strings are built per object,
+as they would be when decoded from a data file, so interning shows up.
+
+Speed: the field reads of one card in the page_events and page_resources
+render loops, for the old dict reads and the new attribute reads, in ns per
+card. Formatting and the Streamlit calls are left out; they are the same
+either way. An Event builds its `start` datetime once, when it is created;
+"start only" compares that read on its own.
+
+Run from the repo root:  python benchmarks/bench_models.py
+"""
+import datetime
+import gc
+import os
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from zenith import catalog, config, event_times, models  # noqa: E402
+
+CATALOG = 10_000
+CATEGORIES = ["Wellness", "Academic", "Social", "Fitness"]
+LOOPS = 200_000
+
+
+def make_events(n, rng):
+    # "".join(...) gives each event its own copy of the repeated strings.
+    return [
+        {
+            "id": f"evt{i}", "cat": "".join(rng.choice(CATEGORIES)), "title": f"Event {i}",
+            "time": f"Fri, Nov {1 + i % 28}, {1 + i % 11}:00 PM", "duration_min": 60,
+            "loc": "".join(f"Building {i % 40}"), "lat": 37.87 + rng.uniform(-0.01, 0.01),
+            "lon": -122.26 + rng.uniform(-0.01, 0.01), "cost": "".join("Free"),
+            "desc": f"Drop in and meet people ({i}).", "details": f"Hosted by club {i}.",
+        }
+        for i in range(n)
+    ]
+
+
+def as_dict_event(event, now):
+    """The old catalog entry: the dict plus the datetimes EventStore added to it."""
+    start = event_times.parse_event_time(event["time"], now)
+    return {**event, "start": start, "end": start + datetime.timedelta(minutes=event["duration_min"])}
+
+
+def per_object(build, n):
+    """Heap bytes per object for a list of n objects from build()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return size / n
+
+
+def event_card_dict(event):
+    located = "lat" in event and (event["lat"], event["lon"])
+    return event["title"], event["start"], event["loc"], event["cost"], located, event["id"]
+
+
+def event_card_model(event):
+    located = event.lat is not None and (event.lat, event.lon)
+    return event.title, event.start, event.loc, event.cost, located, event.id
+
+
+def resource_card_dict(res):
+    return res["img"], res["title"], res["cat"].upper(), res["read_time"], res["id"]
+
+
+def resource_card_model(res):
+    return res.img, res.title, res.cat.upper(), res.read_time, res.id
+
+
+def ns_per_call(fn, *args):
+    return min(timeit.repeat(lambda: fn(*args), number=LOOPS, repeat=5)) / LOOPS * 1e9
+
+
+def main():
+    rng = random.Random(330)
+    now = datetime.datetime.now(config.CAMPUS_TZ)
+
+    print(f"heap bytes per object ({CATALOG:,} each)")
+    dict_ev = per_object(lambda: [as_dict_event(e, now) for e in make_events(CATALOG, rng)], CATALOG)
+    model_ev = per_object(lambda: [models.Event.from_dict(e, now) for e in make_events(CATALOG, rng)], CATALOG)
+    print(f"  event     dict {dict_ev:6.0f}  Event        {model_ev:6.0f}  ({1 - model_ev / dict_ev:.0%} smaller)")
+
+    resources = catalog.get_default_resources()
+    copies = lambda: [{k: "".join(v) for k, v in resources[i % len(resources)].items()} for i in range(CATALOG)]  # noqa: E731
+    dict_res = per_object(copies, CATALOG)
+    model_res = per_object(lambda: [models.Resource.from_dict(r) for r in copies()], CATALOG)
+    print(f"  resource  dict {dict_res:6.0f}  Resource     {model_res:6.0f}  ({1 - model_res / dict_res:.0%} smaller)")
+
+    fields = dict(running=True, start_time=time.time(), task_name="Essay", duration_min=25,
+                  is_break=False, break_duration_min=5, finished=False)
+    ns_timer = per_object(lambda: [SimpleNamespace(**fields) for _ in range(CATALOG)], CATALOG)
+    slot_timer = per_object(lambda: [models.TimerState(**fields) for _ in range(CATALOG)], CATALOG)
+    print(f"  timer     SimpleNamespace {ns_timer:4.0f}  TimerState {slot_timer:4.0f}  ({1 - slot_timer / ns_timer:.0%} smaller)")
+
+    print(f"\nfield reads per rendered card (ns, best of 5 x {LOOPS:,})")
+    source = make_events(1, rng)[0]
+    old, new = as_dict_event(source, now), models.Event.from_dict(source, now)
+    print(f"  page_events     dict {ns_per_call(event_card_dict, old):6.0f}"
+          f"  Event    {ns_per_call(event_card_model, new):6.0f}"
+          f"  (start only: {ns_per_call(lambda e: e['start'], old):.0f} vs {ns_per_call(lambda e: e.start, new):.0f})")
+    old, new = resources[0], models.Resource.from_dict(resources[0])
+    print(f"  page_resources  dict {ns_per_call(resource_card_dict, old):6.0f}"
+          f"  Resource {ns_per_call(resource_card_model, new):6.0f}")
+    ts_ns, ts_slot = SimpleNamespace(**fields), models.TimerState(**fields)
+    read = lambda ts: (ts.running, ts.start_time, ts.duration_min, ts.is_break, ts.finished)  # noqa: E731
+    print(f"  countdown       SimpleNamespace {ns_per_call(read, ts_ns):4.0f}  TimerState {ns_per_call(read, ts_slot):4.0f}")
+
+
+if __name__ == "__main__":
+    main()
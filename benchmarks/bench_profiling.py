@@ -0,0 +1,61 @@
+"""
+Rerun profiling (zenith/profiling.py): what the hook costs when off and on.
+
+Off, profile_rerun() should add nothing but a call per rerun; that is timed
+directly. On, every rerun of a page runs under cProfile and dumps a .prof
+file; the rerun time is compared with profiling off, page by page, through
+AppTest. Profiles go to a temporary DATA_DIR.
+
+Run from the repo root:  python benchmarks/bench_profiling.py
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ["ZENITH_DATA_DIR"] = tempfile.mkdtemp(prefix="zenith-bench-")
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from zenith import config, profiling, views  # noqa: E402
+
+RERUNS = 20
+OFF_LOOPS = 1_000_000
+
+
+def rerun_ms(at, page):
+    at.session_state.page = page
+    at.run()
+    times = []
+    for _ in range(RERUNS):
+        t = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t) * 1000)
+        assert not at.exception, at.exception
+    return statistics.median(times)
+
+
+def main():
+    t = time.perf_counter()
+    for _ in range(OFF_LOOPS):
+        with profiling.profile_rerun("Today", "bench", enabled=False):
+            pass
+    print(f"off: {(time.perf_counter() - t) / OFF_LOOPS * 1e9:.0f} ns per rerun")
+
+    at = AppTest.from_file(os.path.join(ROOT, "cs330.py"), default_timeout=60).run()
+    print(f"{'page':<12} {'off ms':>7} {'on ms':>7} {'x':>5} {'.prof KB':>8}")
+    for page in views.PAGES:
+        config.PROFILE_ENABLED = False
+        off = rerun_ms(at, page)
+        config.PROFILE_ENABLED = True
+        on = rerun_ms(at, page)
+        out_dir = config.data_dir("profiles", profiling._slug(page))
+        sizes = [e.stat().st_size for e in os.scandir(out_dir)]
+        print(f"{page:<12} {off:>7.1f} {on:>7.1f} {on / off:>5.1f} {statistics.median(sizes) / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
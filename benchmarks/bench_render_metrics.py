@@ -0,0 +1,62 @@
+"""
+Render metrics (zenith/metrics.py): per-page p50/p95 under repeated reruns,
+and what the instrumentation itself costs.
+
+Every page is re-run RERUNS times through AppTest. The p50/p95 latency,
+mean elements per render and card count are then read back from the
+histograms, the same numbers /metrics and metrics.prom expose. The
+overhead part times track_page() and a card_started()/card_finished()
+pair around empty bodies.
+
+Run from the repo root:  python benchmarks/bench_render_metrics.py
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from zenith import metrics, views  # noqa: E402
+
+RERUNS = 30
+OVERHEAD_LOOPS = 100_000
+
+
+def main():
+    registry = metrics.get_render_metrics()
+    at = AppTest.from_file(os.path.join(ROOT, "cs330.py"), default_timeout=60).run()
+    for page in views.PAGES:
+        at.session_state.page = page
+        for _ in range(RERUNS):
+            at.run()
+
+    print(f"{'page':<12} {'reruns':>6} {'p50 ms':>7} {'p95 ms':>7} {'elements':>8} {'cards':>5} {'errors':>6}")
+    for page in views.PAGES:
+        stats = registry.page_stats(page)
+        print(
+            f"{page:<12} {stats.latency.count:>6} {stats.latency.quantile(0.5) * 1000:>7.1f} "
+            f"{stats.latency.quantile(0.95) * 1000:>7.1f} {stats.elements.sum / max(stats.elements.count, 1):>8.0f} "
+            f"{stats.cards.count / stats.latency.count:>5.1f} {stats.errors:>6}"
+        )
+    print(f"exposition: {len(registry.render_text()):,} bytes")
+
+    scratch = metrics.RenderMetrics()
+    t = time.perf_counter()
+    for _ in range(OVERHEAD_LOOPS):
+        with metrics.track_page("bench", scratch):
+            pass
+    page_us = (time.perf_counter() - t) / OVERHEAD_LOOPS * 1e6
+    with metrics.track_page("bench", scratch):
+        t = time.perf_counter()
+        for _ in range(OVERHEAD_LOOPS):
+            metrics.card_started()
+            metrics.card_finished()
+        card_us = (time.perf_counter() - t) / OVERHEAD_LOOPS * 1e6
+    print(f"overhead: track_page {page_us:.1f} us per render, card pair {card_us:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Bytes of element payload the server sends per rerun, page by page.
+
+Each page is rendered with Streamlit's AppTest, and the serialized size of
+every element and block in the resulting tree (sidebar included) is summed.
+That is what goes over the websocket for one script run. The theme's share
+is reported separately, next to what the same theme costs when inlined as
+a <style> block on every rerun (the old load_css()).
+
+Run from the repo root:  python benchmarks/bench_rerun_bytes.py
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.proto.Markdown_pb2 import Markdown  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from zenith import config  # noqa: E402
+
+PAGES = ["Today", "Focus", "Sleep", "Events", "My Schedule", "Resources", "AI Coach", "Profile"]
+
+
+def tree_bytes(node):
+    """Returns (total bytes, bytes of the theme element) for an AppTest tree."""
+    total = theme = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        proto = getattr(node, "proto", None)
+        if proto is not None:
+            size = proto.ByteSize()
+            total += size
+            if 'rel="stylesheet"' in str(getattr(node, "value", "")):
+                theme += size
+        stack.extend(getattr(node, "children", {}).values())
+    return total, theme
+
+
+def main():
+    with open(config.THEME_SOURCE, encoding="utf-8") as f:
+        inline = Markdown(body=f"<style>\n{f.read()}</style>", allow_html=True).ByteSize()
+
+    at = AppTest.from_file(os.path.join(ROOT, "cs330.py"), default_timeout=30).run()
+    print(f"{'page':<12} {'rerun bytes':>11} {'theme':>6} {'inlined':>8}")
+    for page in PAGES:
+        at.session_state.page = page
+        at.run()
+        if at.exception:
+            print(f"{page:<12} {'error':>11}  {at.exception[0].message}")
+            continue
+        total, theme = tree_bytes(at._tree)
+        print(f"{page:<12} {total:>11,} {theme:>6,} {total - theme + inline:>8,}")
+    print(f"theme: {theme} B link per rerun vs {inline:,} B inline <style>")
+
+
+if __name__ == "__main__":
+    main()
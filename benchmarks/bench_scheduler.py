@@ -0,0 +1,103 @@
+"""
+Stress test for the shared TimerScheduler (zenith/scheduler.py).
+
+1. Inserts N timers with random deadlines, cancels half of them at random,
+   reschedules a slice, and checks the heap/index invariants; reports the
+   per-operation cost so O(log n) growth is visible across sizes.
+2. Schedules N timers due within ~2s on the live worker thread and checks
+   every non-cancelled timer fires exactly once, reporting firing lag.
+
+Run from the repo root:  python benchmarks/bench_scheduler.py
+"""
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith.scheduler import TimerScheduler, check_heap  # noqa: E402
+
+SIZES = [1_000, 10_000, 50_000, 100_000]
+
+
+def bench_operations(n, rng):
+    sched = TimerScheduler(start=False)
+    now = time.time()
+    noop = lambda key: None  # noqa: E731
+
+    t0 = time.perf_counter()
+    for i in range(n):
+        sched.schedule(("session", i), now + rng.uniform(60, 3600), noop)
+    insert_us = (time.perf_counter() - t0) / n * 1e6
+
+    victims = rng.sample(range(n), n // 2)
+    t0 = time.perf_counter()
+    for i in victims:
+        assert sched.cancel(("session", i))
+    cancel_us = (time.perf_counter() - t0) / len(victims) * 1e6
+
+    survivors = sorted(set(range(n)) - set(victims))
+    moved = rng.sample(survivors, min(len(survivors), n // 10))
+    t0 = time.perf_counter()
+    for i in moved:
+        sched.schedule(("session", i), now + rng.uniform(60, 3600), noop)
+    resched_us = (time.perf_counter() - t0) / max(1, len(moved)) * 1e6
+
+    check_heap(sched)
+    assert len(sched) == n - len(victims)
+    due = sched.pop_due(now + 3601)
+    assert [k for k, _ in due] and len(due) == n - len(victims)
+    return insert_us, cancel_us, resched_us
+
+
+def bench_live_firing(n, rng):
+    sched = TimerScheduler(start=False)
+    fired = {}
+    lock = threading.Lock()
+
+    def on_fire(key):
+        with lock:
+            assert key not in fired, f"{key} fired twice"
+            fired[key] = time.time() - deadlines[key]
+
+    now = time.time()
+    deadlines = {}
+    for i in range(n):
+        key = ("session", i)
+        deadlines[key] = now + 1.0 + rng.uniform(0, 1.0)
+        sched.schedule(key, deadlines[key], on_fire)
+    cancelled = {("session", i) for i in rng.sample(range(n), n // 4)}
+    for key in cancelled:
+        sched.cancel(key)
+    sched.start()
+
+    expected = n - len(cancelled)
+    deadline = time.time() + 10
+    while len(fired) < expected and time.time() < deadline:
+        time.sleep(0.05)
+    sched.stop()
+
+    assert len(fired) == expected, (len(fired), expected)
+    assert not cancelled & fired.keys()
+    lags_ms = sorted(v * 1000 for v in fired.values())
+    return statistics.median(lags_ms), lags_ms[int(len(lags_ms) * 0.99) - 1]
+
+
+def main():
+    rng = random.Random(330)
+    print(f"{'timers':>8}{'insert us':>12}{'cancel us':>12}{'resched us':>12}")
+    for n in SIZES:
+        insert_us, cancel_us, resched_us = bench_operations(n, rng)
+        print(f"{n:>8}{insert_us:>12.2f}{cancel_us:>12.2f}{resched_us:>12.2f}")
+
+    n = 50_000
+    p50, p99 = bench_live_firing(n, rng)
+    print()
+    print(f"live worker: {n} timers, all fired once; lag p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Resources full-text search (zenith/search.py) over a 100k-article library.
+
+Articles are synthetic: titles and ~150-word bodies drawn from a Zipf-like
+vocabulary, so a few terms appear in most articles (the hard case for an
+inverted index) and most are rare. Queries mix one to three terms, including
+very common ones, with and without a category filter. Results are checked
+against a straightforward dict-based BM25 for a sample of queries. Also
+times incremental add/remove while the index is live.
+
+Run from the repo root:  python benchmarks/bench_search.py
+"""
+import collections
+import math
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith.resources import FIELD_WEIGHTS, ResourceLibrary  # noqa: E402
+from zenith.search import tokenize  # noqa: E402
+
+ARTICLES = 100_000
+VOCAB = 20_000
+BODY_WORDS = 150
+QUERIES = 1_000
+CHECKED = 50
+CATEGORIES = ["Mental Health", "Study", "Campus", "Sleep", "Fitness", "Nutrition"]
+
+
+def make_articles(rng):
+    words = np.array([f"w{i}" for i in range(VOCAB)])
+    weights = 1.0 / np.arange(1, VOCAB + 1) ** 1.05
+    weights /= weights.sum()
+    title_words = rng.choice(VOCAB, (ARTICLES, 6), p=weights)
+    body_words = rng.choice(VOCAB, (ARTICLES, BODY_WORDS), p=weights)
+    cats = rng.integers(0, len(CATEGORIES), ARTICLES)
+    for i in range(ARTICLES):
+        yield {
+            "id": f"res{i}",
+            "cat": CATEGORIES[cats[i]],
+            "title": " ".join(words[title_words[i]]),
+            "body": " ".join(words[body_words[i]]),
+        }
+
+
+def reference_docs(articles):
+    docs = {}
+    for art in articles:
+        tf = collections.Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(art[field]):
+                tf[term] += weight
+        docs[art["id"]] = tf
+    return docs
+
+
+def reference_search(docs, query, k, k1=1.2, b=0.75):
+    """Plain BM25 over dicts, for checking results."""
+    n = len(docs)
+    avgdl = sum(sum(tf.values()) for tf in docs.values()) / n
+    scores = collections.Counter()
+    for term in set(tokenize(query)):
+        matching = [(doc_id, tf[term]) for doc_id, tf in docs.items() if term in tf]
+        idf = math.log(1 + (n - len(matching) + 0.5) / (len(matching) + 0.5))
+        for doc_id, f in matching:
+            dl = sum(docs[doc_id].values())
+            scores[doc_id] += idf * f * (k1 + 1) / (f + k1 * (1 - b + b * dl / avgdl))
+    return scores.most_common(k)
+
+
+def main():
+    rng = np.random.default_rng(330)
+    articles = list(make_articles(rng))
+
+    t0 = time.perf_counter()
+    library = ResourceLibrary(articles)
+    print(f"build: {ARTICLES:,} articles in {time.perf_counter() - t0:.1f} s")
+
+    # Term ranks 0-4 occur in most articles; 50-500 are mid-frequency; 5000+ are rare.
+    ranks = np.concatenate((rng.integers(0, 5, QUERIES), rng.integers(50, 500, QUERIES), rng.integers(5000, VOCAB, QUERIES)))
+    queries = []
+    for i in range(QUERIES):
+        terms = rng.choice(ranks, rng.integers(1, 4), replace=False)
+        queries.append(" ".join(f"w{t}" for t in terms))
+
+    # Warm pass (the index itself needs none: postings are kept as arrays).
+    for query in queries:
+        library.search(query)
+
+    for label, category in (("all", None), ("category", "Sleep")):
+        ms = []
+        for query in queries:
+            t = time.perf_counter()
+            library.search(query, category)
+            ms.append((time.perf_counter() - t) * 1000)
+        ms.sort()
+        print(f"search ({label:8}): p50 {statistics.median(ms):5.2f} ms, p99 {ms[int(QUERIES * 0.99)]:5.2f} ms, max {ms[-1]:5.2f} ms")
+
+    docs = reference_docs(articles)
+    for query in queries[:CHECKED]:
+        got = library.index.search(query, k=20)
+        want = reference_search(docs, query, 20)
+        assert np.allclose([s for _, s in got], [s for _, s in want]), query
+    print(f"checked {CHECKED} queries against a reference BM25")
+
+    add_us, remove_us = [], []
+    for art in articles[:1000]:
+        t = time.perf_counter()
+        library.remove(art["id"])
+        remove_us.append((time.perf_counter() - t) * 1e6)
+        t = time.perf_counter()
+        library.add(art)
+        add_us.append((time.perf_counter() - t) * 1e6)
+    print(f"incremental: add p50 {statistics.median(add_us):.0f} us, remove p50 {statistics.median(remove_us):.0f} us")
+
+    ms = []
+    for query in queries[:200]:
+        t = time.perf_counter()
+        library.search(query)
+        ms.append((time.perf_counter() - t) * 1000)
+    print(f"search after updates: p50 {statistics.median(ms):.2f} ms, max {max(ms):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Memory for SESSIONS concurrent sessions over a CATALOG-event catalog:
+a private EventStore per session (the old cs330.py) vs. one shared, frozen
+catalog plus a small per-session overlay (zenith.stores.get_event_catalog).
+
+Sizes are Python heap bytes from tracemalloc. A private copy per session is
+measured on SAMPLE sessions and scaled up, since 5k of them do not fit in
+memory. The shared layout is measured in full: one catalog and SESSIONS
+overlays. Each overlay holds a few RSVPs, a couple of read markers, a page
+number and an open event, the per-session data keys in cs330.py.
+
+Run from the repo root:  python benchmarks/bench_session_memory.py
+"""
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from zenith import events  # noqa: E402
+
+SESSIONS = 5_000
+CATALOG = 10_000
+SAMPLE = 20
+CATEGORIES = ["Wellness", "Academic", "Social", "Fitness"]
+
+
+def make_events(n, rng):
+    return [
+        {
+            "id": f"evt{i}", "cat": rng.choice(CATEGORIES), "title": f"Event {i}",
+            "time": f"Fri, Nov {1 + i % 28}, {1 + i % 11}:00 PM", "duration_min": 60,
+            "loc": f"Building {i % 40}", "lat": 37.87 + rng.uniform(-0.01, 0.01), "lon": -122.26 + rng.uniform(-0.01, 0.01),
+            "cost": "Free", "desc": "Drop in and meet people.", "details": "Hosted by the wellness center.",
+        }
+        for i in range(n)
+    ]
+
+
+def overlay(store, rng):
+    ids = [f"evt{rng.randrange(CATALOG)}" for _ in range(5)]
+    return {
+        "my_schedule": events.Schedule(ids[:3]),
+        "read_resources": {"res1", "res5"},
+        "events_page": rng.randrange(5),
+        "selected_event_details": store.get(ids[3]),
+    }
+
+
+def traced(build):
+    """Returns (result, heap bytes it holds) for build()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    rng = random.Random(330)
+    source = make_events(CATALOG, rng)
+
+    # Old: every session built its own EventStore from a fresh catalog copy.
+    def private_session():
+        store = events.EventStore(dict(e) for e in source)
+        return {"all_events": store, **overlay(store, rng)}
+
+    t = time.perf_counter()
+    private_session()
+    build_ms = (time.perf_counter() - t) * 1000
+    _, private = traced(lambda: [private_session() for _ in range(SAMPLE)])
+    per_private = private / SAMPLE
+
+    # New: one frozen catalog, built once; sessions hold only an overlay.
+    t = time.perf_counter()
+    events.EventStore(dict(e) for e in source).freeze()
+    freeze_ms = (time.perf_counter() - t) * 1000
+    shared, catalog_bytes = traced(lambda: events.EventStore(dict(e) for e in source).freeze())
+    _, overlays = traced(lambda: [overlay(shared, rng) for _ in range(SESSIONS)])
+    per_overlay = overlays / SESSIONS
+
+    mb = 1024 * 1024
+    print(f"{SESSIONS:,} sessions, {CATALOG:,}-event catalog")
+    print(f"private copy per session: {per_private / mb:6.2f} MB each, {build_ms:.0f} ms to build at session start"
+          f" -> {per_private * SESSIONS / mb / 1024:,.1f} GB total")
+    print(f"shared catalog:           {catalog_bytes / mb:6.2f} MB once, {freeze_ms:.0f} ms to build per process")
+    print(f"overlay per session:      {per_overlay:6.0f} B each"
+          f" -> {(catalog_bytes + overlays) / mb:,.1f} MB total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Idle-session spill (zenith/session_spill.py): memory given back and the
+cost of coming back.
+
+SESSIONS sessions are driven through the load-test flows (bench_load.py)
+and left resident, then one sweep spills them all as if they had been idle
+past the timeout. Reported:
+- the app state dropped per session (deep size of the spilled keys and
+  state_store's state_saved), the heap freed by the sweep (tracemalloc)
+  and spill file sizes. Under AppTest the heap figure also includes the
+  last script runner, which the session entry holds until the spill; each
+  AppTest runner has its own compiled script and message queue, which a
+  server shares or does not keep,
+- restore latency: the time the first run after a spill spends bringing
+  state back (the zenith_session_restore_seconds histogram),
+- the first interaction's full rerun time, spilled vs. still resident.
+
+Two Pomodoro cases check that an in-flight timer survives a spill: a phase
+still running is re-armed on restore, and one that ended while the session
+was spilled comes back finished. Two wind-down cases do the same for the
+wind-down timer: it is re-armed, or fires (the toast) right after restore.
+
+Run from the repo root:  python benchmarks/bench_session_spill.py
+"""
+import gc
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bench_load  # noqa: E402  (sets up ZENITH_DATA_DIR and sys.path)
+
+from zenith import metrics, session_spill, timers  # noqa: E402
+
+SESSIONS = 40
+IDLE = 10 ** 6  # seconds "later" passed to sweep(), past any timeout
+
+
+def deep_size(obj, seen=None):
+    """Bytes held by obj and everything it references (containers and slotted objects)."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(deep_size(getattr(obj, name, None), seen) for name in obj.__slots__ if name != "__weakref__")
+    elif hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen)
+    return size
+
+
+def app_state_bytes(at):
+    keys = session_spill.SPILLED + session_spill.DROPPED
+    return deep_size({key: at.session_state[key] for key in keys if key in at.session_state})
+
+
+def first_rerun_ms(apps, page="Today"):
+    samples = []
+    for at in apps:
+        t = time.perf_counter()
+        bench_load.goto(at, page)
+        samples.append((time.perf_counter() - t) * 1000)
+        assert not at.exception, at.exception
+    return samples
+
+
+def resident_apps(n):
+    """Sessions that were never spilled, for comparison: same flows, fresh."""
+    apps, _ = bench_load.drive(bench_load.assign_flows(n))
+    return apps
+
+
+def timer_case(spiller, phase_left_sec):
+    """Starts a focus phase, leaves the Focus page, spills, comes back."""
+    at, = bench_load.drive(["browse"])[0]
+    bench_load.goto(at, "Focus")
+    bench_load.button(at, "Start Focus Session").click().run()
+    ts = at.session_state.timer_state
+    ts.start_time = time.time() - ts.duration_min * 60 + phase_left_sec  # the spill re-arms from this
+    bench_load.goto(at, "Today")
+    spiller.sweep(time.time() + IDLE)
+    key = (at.session_state.session_id, "focus")
+    assert "timer_state" not in at.session_state and key not in timers.get_scheduler()
+    bench_load.goto(at, "Focus")
+    ts = at.session_state.timer_state
+    return ts.running, ts.finished, key in timers.get_scheduler()
+
+
+def wind_down_case(spiller, left_sec):
+    """Starts a wind-down timer, spills, comes back. Returns (armed, toasts, wind_down_until)."""
+    at, = bench_load.drive(["browse"])[0]
+    bench_load.goto(at, "Sleep")
+    at.button(key="wind_down").click().run()
+    bench_load.button(at, "Start 30-Min Timer").click().run()
+    assert at.sidebar.caption[0].value == f"Wind-down timer: {timers.WIND_DOWN_MINUTES} min left"
+    at.session_state.wind_down_until = time.time() + left_sec  # the spill re-arms from this
+    at.run()
+    spiller.sweep(time.time() + IDLE)
+    key = (at.session_state.session_id, "wind_down")
+    assert "wind_down_until" not in at.session_state and key not in timers.get_scheduler()
+    at.run()
+    armed = key in timers.get_scheduler()
+    toasts = [t.value for t in at.toast]
+    time.sleep(0.1)  # a deadline already past fires on the scheduler thread, maybe during that run
+    at.run()
+    return armed, toasts + [t.value for t in at.toast], at.session_state.wind_down_until
+
+
+def main():
+    logging.getLogger("streamlit.error_util").disabled = True
+    spiller = session_spill.get_spiller()
+    restore = metrics.get_render_metrics().restore
+    bench_load.drive(list(bench_load.FLOWS))  # warm-up
+
+    # tracemalloc only sees frees of blocks allocated while it was on.
+    tracemalloc.start()
+    apps, _ = bench_load.drive(bench_load.assign_flows(SESSIONS))
+    gc.collect()
+    app_state = statistics.mean(app_state_bytes(at) for at in apps)
+    before = tracemalloc.get_traced_memory()[0]
+    spilled = spiller.sweep(time.time() + IDLE)
+    gc.collect()
+    freed = before - tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    baseline = first_rerun_ms(resident_apps(SESSIONS))
+    sizes = [entry.stat().st_size for entry in os.scandir(spiller.directory)]
+
+    count, total = restore.count, restore.sum
+    t = time.perf_counter()
+    after = first_rerun_ms(apps)
+    wall = time.perf_counter() - t
+    restores = restore.count - count
+
+    print(f"{SESSIONS} sessions, {spilled} spilled")
+    print(f"app state dropped:       {app_state:,.0f} B per session"
+          f" (spill files {statistics.median(sizes):.0f} B median, {max(sizes)} B max)")
+    print(f"heap freed by the sweep: {freed / spilled:,.0f} B per session (incl. the AppTest script runner)")
+    print(f"restore:                 {(restore.sum - total) / restores * 1e6:,.0f} us mean over {restores} restores,"
+          f" p95 <= {restore.quantile(0.95) * 1e3:.2f} ms")
+    print(f"first rerun after idle:  p50 {np.percentile(after, 50):.1f} ms, p95 {np.percentile(after, 95):.1f} ms"
+          f"  (resident: p50 {np.percentile(baseline, 50):.1f} ms, p95 {np.percentile(baseline, 95):.1f} ms)"
+          f"  [{wall:.1f} s]")
+    print(f"sessions now: resident={spiller.counts()[0]}, spilled={spiller.counts()[1]}")
+
+    running, finished, armed = timer_case(spiller, phase_left_sec=600)
+    print(f"\ntimer with 10 min left:  running={running} finished={finished} rescheduled={armed}")
+    assert running and not finished and armed
+    running, finished, armed = timer_case(spiller, phase_left_sec=-60)
+    print(f"timer that ended while spilled: running={running} finished={finished} rescheduled={armed}")
+    assert finished and not armed
+
+    armed, toasts, until = wind_down_case(spiller, left_sec=600)
+    print(f"wind-down with 10 min left: rescheduled={armed} toasts={toasts}")
+    assert armed and not toasts and until
+    armed, toasts, until = wind_down_case(spiller, left_sec=-60)
+    print(f"wind-down that ended while spilled: toasts={toasts}")
+    assert toasts == ["Wind-down timer finished. Time for bed!"] and until is None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Sleep Trends chart cost per rerun (zenith/sleep_chart.py).
+
+For histories from one week to five years, compares:
+- before: build a DataFrame, melt it, construct the layered Altair chart and
+  serialize it, as page_sleep did on every rerun with the full history;
+- after, cold: LTTB downsample + build the spec (first view / after a log);
+- after, warm: cache hit (every other rerun).
+and reports the Vega-Lite payload size of each.
+
+Run from the repo root:  python benchmarks/bench_sleep_chart.py
+"""
+import datetime
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith.sleep_chart import SleepChartCache, build_spec  # noqa: E402
+from zenith.sleep_store import SleepLogStore, to_night  # noqa: E402
+
+HISTORIES = [7, 90, 365, 3 * 365, 5 * 365]
+REPEAT = 20
+
+
+def melted_chart(history):
+    """The per-rerun chart construction page_sleep used before caching."""
+    df = pd.DataFrame({"Night": history.dates(), "Hours": history.hours(), "Target": 8.0})
+    df_melted = df.melt('Night', var_name='Metric', value_name='Sleep Duration')
+    base = alt.Chart(df_melted).encode(
+        x=alt.X('Night:T', title=None),
+        y=alt.Y('Sleep Duration', title='Hours of Sleep', scale=alt.Scale(zero=False)),
+        color=alt.Color('Metric',
+                        scale=alt.Scale(domain=['Hours', 'Target'], range=['#6A11CB', '#D1C4E9']),
+                        legend=alt.Legend(title="Legend"))
+    ).properties(title="Sleep Duration vs. Target")
+    hours_line = base.transform_filter(alt.datum.Metric == 'Hours').mark_line(point=True)
+    target_line = base.transform_filter(alt.datum.Metric == 'Target').mark_line(point=True, strokeDash=[5, 5])
+    return (hours_line + target_line).interactive().to_dict()
+
+
+def timed(fn):
+    samples = []
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    rng = np.random.default_rng(330)
+    tmp = tempfile.mkdtemp()
+    store = SleepLogStore(tmp)
+    today = to_night(datetime.date.today())
+
+    print(f"{'nights':>7}{'before ms':>11}{'before KB':>11}{'cold ms':>9}{'warm ms':>9}{'after KB':>10}")
+    for nights in HISTORIES:
+        user = f"user{nights}"
+        store.append_many(
+            user,
+            night=np.arange(today - nights, today, dtype=np.int32),
+            bed_min=(rng.normal(23.5 * 60, 45, nights) % 1440).astype(np.int16),
+            wake_min=(rng.normal(7.25 * 60, 40, nights) % 1440).astype(np.int16),
+            quality=rng.integers(1, 6, nights, dtype=np.int8),
+        )
+        history = store.load(user)
+
+        before_ms, before_spec = timed(lambda: melted_chart(history))
+        cold_ms, after_spec = timed(lambda: build_spec(store.load(user)))
+        cache = SleepChartCache(store)
+        cache.spec(user)
+        warm_ms, _ = timed(lambda: cache.spec(user))
+
+        before_kb = len(json.dumps(before_spec, default=str)) / 1024
+        after_kb = len(json.dumps(after_spec, default=str)) / 1024
+        print(f"{nights:>7}{before_ms:>11.2f}{before_kb:>11.1f}{cold_ms:>9.2f}{warm_ms:>9.4f}{after_kb:>10.1f}")
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Columnar sleep-log store (zenith/sleep_store.py) at 5 years of nightly logs
+for 50k users (~91M nights, ~820 MB on disk).
+
+Reports bulk-load throughput, the latency of saving one night, and the time
+to load a user's full history for the trend chart: the memory-mapped load
+itself, and the load plus the DataFrame the chart is built from. A
+row-by-row rebuild of the same history is timed for comparison.
+
+Run from the repo root:  python benchmarks/bench_sleep_store.py [--users N]
+"""
+import argparse
+import datetime
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith.sleep_store import SleepLogStore, to_night  # noqa: E402
+
+NIGHTS = 5 * 365 + 1
+SAMPLES = 500
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=50_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(330)
+    tmp = tempfile.mkdtemp()
+    store = SleepLogStore(tmp)
+    first_night = to_night(datetime.date.today()) - NIGHTS
+    nights = np.arange(first_night, first_night + NIGHTS, dtype=np.int32)
+
+    t0 = time.perf_counter()
+    for u in range(args.users):
+        store.append_many(
+            f"user{u}",
+            night=nights,
+            bed_min=(rng.normal(23.5 * 60, 45, NIGHTS) % 1440).astype(np.int16),
+            wake_min=(rng.normal(7.25 * 60, 40, NIGHTS) % 1440).astype(np.int16),
+            quality=rng.integers(1, 6, NIGHTS, dtype=np.int8),
+        )
+    load_s = time.perf_counter() - t0
+    total = args.users * NIGHTS
+    print(f"bulk load: {args.users:,} users x {NIGHTS} nights = {total:,} rows in {load_s:.1f}s")
+
+    picks = random.Random(330).sample(range(args.users), min(SAMPLES, args.users))
+
+    save_us = []
+    for u in picks:
+        t = time.perf_counter()
+        store.append(f"user{u}", datetime.date.today(), datetime.time(23, 30), datetime.time(7, 15), 4)
+        save_us.append((time.perf_counter() - t) * 1e6)
+    print(f"save one night: p50 {statistics.median(save_us):.0f} us")
+
+    mmap_ms, chart_ms, rows_ms = [], [], []
+    for u in picks:
+        t = time.perf_counter()
+        history = store.load(f"user{u}")
+        mmap_ms.append((time.perf_counter() - t) * 1000)
+        assert len(history) == NIGHTS + 1
+
+        t = time.perf_counter()
+        history = store.load(f"user{u}")
+        pd.DataFrame({"Night": history.dates(), "Hours": history.hours(), "Target": 8.0})
+        chart_ms.append((time.perf_counter() - t) * 1000)
+
+        # Row-by-row rebuild of the same data, for comparison.
+        t = time.perf_counter()
+        rows = [
+            {"Night": int(n), "Hours": ((int(w) - int(b)) % 1440) / 60, "Target": 8.0}
+            for n, b, w in zip(history.night, history.bed_min, history.wake_min)
+        ]
+        pd.DataFrame(rows)
+        rows_ms.append((time.perf_counter() - t) * 1000)
+
+    print(f"full-history load (memmap):          p50 {statistics.median(mmap_ms):.3f} ms")
+    print(f"full-history load + chart DataFrame: p50 {statistics.median(chart_ms):.3f} ms")
+    print(f"row-by-row rebuild (comparison):     p50 {statistics.median(rows_ms):.3f} ms")
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Externalized session state (zenith/state_store.py).
+
+1. Backend costs for the SQLite and file backends: restoring a session,
+   writing one changed key, and the per-rerun sync() when nothing changed
+   (encoding the persisted keys only, no write).
+2. Writes per action: a session is driven through a few actions with
+   AppTest, counting which keys each run's sync() writes.
+3. Worker hop: one worker process starts a session (RSVP, a new goal, a
+   running focus timer), then a second worker process opens the same URL
+   from the same browser and must show the same state. Both share
+   ZENITH_DATA_DIR, as workers behind a load balancer would share a
+   database. AppTest sends no cookies, so each worker is handed the
+   browser's cookie (state_store.BROWSER_COOKIE) directly. Then the URL is
+   opened from another browser, which must start over under a new session
+   key, and twice at once in one worker (a duplicated tab), where the
+   second tab must continue from a copy under a new key.
+
+Run from the repo root:  python benchmarks/bench_state_store.py
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("ZENITH_DATA_DIR", tempfile.mkdtemp(prefix="zenith-bench-"))
+
+APP = os.path.join(ROOT, "cs330.py")
+SESSIONS = 2_000
+LOOPS = 2_000
+
+
+def sample_state():
+    from zenith import events, models
+
+    return {
+        "page": "Focus", "user_location": [37.8719, -122.2585],
+        "user_goals": ["Meditate 5 mins/day", "Sleep 8 hours", "Walk daily"],
+        "timer_state": models.TimerState(running=True, start_time=time.time(), task_name="Essay"),
+        "my_schedule": events.Schedule(["evt1", "evt4", "evt7"]),
+        "read_resources": {"res1", "res5"}, "events_page": 2, "coach_pages": 0,
+    }
+
+
+def median_us(fn, loops=LOOPS):
+    samples = []
+    for i in range(loops):
+        t = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - t)
+    return statistics.median(samples) * 1e6
+
+
+def bench_backends():
+    from zenith import config, state_store
+
+    state = sample_state()
+    blobs = {key: state_store.encode(value) for key, value in state.items()}
+    saved = dict(blobs)
+    print(f"{'backend':>8} {'restore us':>10} {'save 1 key us':>13} {'idle sync us':>12}  ({SESSIONS:,} sessions stored)")
+    for name, backend in [("sqlite", state_store.SQLiteStateBackend(config.data_path("bench_sessions.db"))),
+                          ("file", state_store.FileStateBackend(config.data_dir("bench_sessions")))]:
+        sids = [os.urandom(16).hex() for _ in range(SESSIONS)]
+        for sid in sids:
+            backend.save(sid, blobs)
+        restore = median_us(lambda i: {k: state_store.decode(v) for k, v in backend.load(sids[i % SESSIONS]).items()})
+        save = median_us(lambda i: backend.save(sids[i % SESSIONS], {"events_page": str(i % 5).encode()}))
+        # What sync() does on a rerun that changed nothing.
+        idle = median_us(lambda i: [k for k, v in state.items() if state_store.encode(v) != saved[k]], LOOPS * 10)
+        print(f"{name:>8} {restore:>10.0f} {save:>13.0f} {idle:>12.1f}")
+
+
+def bench_writes():
+    from streamlit.testing.v1 import AppTest
+
+    from zenith import state_store
+
+    written = []
+    backend = state_store.get_backend()
+    save = backend.save
+    backend.save = lambda sid, changes: (written.append(sorted(changes)), save(sid, changes))
+
+    at = AppTest.from_file(APP, default_timeout=30)
+    actions = [
+        ("first visit", lambda: at),
+        ("idle rerun", lambda: at),
+        ("open Events", lambda: at.radio(key="page").set_value("Events")),
+        ("RSVP", lambda: next(b for b in at.button if b.key.startswith("rsvp_evt")).click()),
+        ("next rerun", lambda: at),
+        ("open Focus", lambda: at.radio(key="page").set_value("Focus")),
+        ("start timer", lambda: next(b for b in at.button if b.label == "Start Focus Session").click()),
+    ]
+    print("\nkeys written per action")
+    for label, act in actions:
+        del written[:]
+        act().run()
+        assert not at.exception, at.exception
+        keys = [k for batch in written for k in batch]
+        print(f"  {label:<12} {', '.join(keys) or '-'}")
+    backend.save = save
+
+
+def _worker(step, sid, cookie):
+    """One worker process: runs a session and prints what it shows as JSON."""
+    from streamlit.testing.v1 import AppTest
+
+    from zenith import state_store
+
+    state_store._browser_cookie = lambda: cookie
+
+    def open_tab():
+        at = AppTest.from_file(APP, default_timeout=30)
+        if sid:
+            at.query_params["sid"] = sid
+        return at.run()
+
+    at = open_tab()
+    if step == "duplicate":
+        first, at = at, open_tab()
+        assert first.query_params["sid"] == sid != at.query_params["sid"], "the duplicated tab kept the key"
+    if step == "start":
+        at.radio(key="page").set_value("Events").run()
+        next(b for b in at.button if b.key.startswith("rsvp_evt")).click().run()
+        at.session_state.user_goals.append("Walk daily")
+        at.radio(key="page").set_value("Focus").run()
+        next(b for b in at.button if b.label == "Start Focus Session").click().run()
+    ss = at.session_state
+    print(json.dumps({"sid": at.query_params["sid"], "pid": os.getpid(), "page": ss.page,
+                      "rsvps": list(ss.my_schedule), "goals": list(ss.user_goals),
+                      "timer": [ss.timer_state.running, ss.timer_state.start_time]}))
+
+
+def bench_hop():
+    browser, other = os.urandom(16).hex(), os.urandom(16).hex()
+    seen = {}
+    for step, cookie in [("start", browser), ("resume", browser), ("other browser", other), ("duplicate", browser)]:
+        sid = seen["start"]["sid"] if seen else ""
+        t = time.perf_counter()
+        out = subprocess.run([sys.executable, __file__, "--worker", step, sid, cookie],
+                             capture_output=True, text=True, check=True, timeout=300).stdout
+        s = seen[step] = json.loads(out.strip().splitlines()[-1])
+        print(f"\nworker {s['pid']} ({step}): page={s['page']} rsvps={s['rsvps']} goals={len(s['goals'])}"
+              f" timer running={s['timer'][0]}  [{time.perf_counter() - t:.1f} s incl. process start]")
+    first, second, copy = ({k: v for k, v in seen[step].items() if k not in ("pid", "sid")}
+                           for step in ("start", "resume", "duplicate"))
+    assert seen["start"]["pid"] != seen["resume"]["pid"] and seen["start"]["sid"] == seen["resume"]["sid"] \
+        and first == second, "state did not follow the user"
+    print("state followed the user to the second worker")
+    stranger = seen["other browser"]
+    assert stranger["sid"] != seen["start"]["sid"] and not stranger["rsvps"], "another browser got the user's state"
+    print("another browser opening the link started over")
+    assert first == copy, "the duplicated tab did not start from a copy"
+    print("a duplicated tab continued from a copy under its own key")
+
+
+def main():
+    bench_backends()
+    bench_writes()
+    bench_hop()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        _worker(*sys.argv[2:5])
+    else:
+        main()
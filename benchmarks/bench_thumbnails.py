@@ -0,0 +1,78 @@
+"""
+Thumbnail cache (zenith/thumbnails.py): render cost, hit latency and hit rate.
+
+A library of placehold.co-style images is requested with a Zipf-skewed
+popularity (a few resources are viewed far more than the rest), through a
+cache capped well below the full set, so LRU eviction kicks in. Also times
+the fallback for an unreachable remote image, which must not stall for long,
+and the next request for it, which must not try the network again. The
+counts are checked against what the render metrics export.
+Everything runs offline, in a temporary directory.
+
+Run from the repo root:  python benchmarks/bench_thumbnails.py
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zenith import metrics  # noqa: E402
+from zenith.thumbnails import ThumbnailCache  # noqa: E402
+
+IMAGES = 500
+REQUESTS = 10_000
+SIZE = (1440, 300)
+MAX_BYTES = 2 * 1024 * 1024
+
+
+def main():
+    rng = np.random.default_rng(330)
+    sources = [f"https://placehold.co/600x400/EDE7F6/4A148C?text=Article+{i}&font=inter" for i in range(IMAGES)]
+    popularity = 1.0 / np.arange(1, IMAGES + 1)
+    requests = rng.choice(IMAGES, REQUESTS, p=popularity / popularity.sum())
+
+    with tempfile.TemporaryDirectory() as root:
+        registry = metrics.RenderMetrics()
+        cache = ThumbnailCache(root, "app/static/thumbs/", max_bytes=MAX_BYTES, metrics=registry)
+        hit_us, miss_ms = [], []
+        for i in requests.tolist():
+            before = cache.misses
+            t = time.perf_counter()
+            cache.url(sources[i], SIZE)
+            elapsed = time.perf_counter() - t
+            if cache.misses == before:
+                hit_us.append(elapsed * 1e6)
+            else:
+                miss_ms.append(elapsed * 1000)
+
+        stats = cache.stats()
+        on_disk = sum(e.stat().st_size for e in os.scandir(root))
+        print(f"{REQUESTS:,} requests over {IMAGES:,} images, cache capped at {MAX_BYTES // 1024} KB")
+        print(f"hit rate {stats['hit_rate']:.1%}  ({stats['hits']:,} hits, {stats['misses']:,} misses, {stats['evictions']:,} evictions)")
+        print(f"hit:  p50 {statistics.median(hit_us):6.1f} us")
+        print(f"miss: p50 {statistics.median(miss_ms):6.1f} ms (render + write PNG, {stats['bytes'] / stats['entries'] / 1024:.1f} KB avg)")
+        print(f"on disk: {stats['entries']:,} files, {on_disk / 1024:.0f} KB")
+        assert on_disk <= MAX_BYTES
+        assert registry.thumbnails == (stats["hits"], stats["misses"], stats["evictions"])
+        assert f'zenith_thumbnail_lookups_total{{result="hit"}} {stats["hits"]}' in registry.render_text()
+
+        # Reopening the cache picks up the files and their LRU order from disk.
+        t = time.perf_counter()
+        reopened = ThumbnailCache(root, "app/static/thumbs/", max_bytes=MAX_BYTES)
+        print(f"reopen: {(time.perf_counter() - t) * 1000:.1f} ms for {reopened.stats()['entries']:,} files")
+
+        for attempt in ("first", "next"):
+            t = time.perf_counter()
+            url = cache.url("http://127.0.0.1:9/unreachable.png", SIZE)
+            elapsed = time.perf_counter() - t
+            print(f"unreachable remote image ({attempt} request): fallback in {elapsed * 1000:.2f} ms -> {url}")
+        assert elapsed < 0.01, "a failed fetch was retried within its TTL"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Supporting modules for the Zenith Wellness app (cs330.py)."""
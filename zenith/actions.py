@@ -0,0 +1,86 @@
+import functools
+import threading
+import time
+
+import streamlit as st
+
+from zenith import metrics, session_spill, state_store
+
+# --- Actions ---
+# A button that changes state used to do it inline and then call st.rerun(),
+# so every click ran the script twice: once to handle the click, once more
+# to draw the new state. Handlers are now actions, passed as the button's
+# on_click. Streamlit runs callbacks before the script, so the one run that
+# follows the click already sees the change.
+#
+# Every action goes through dispatch(), which makes sure the session is
+# resident (callbacks run before the script's own ensure_resident(), see
+# zenith.session_spill), writes what the action changed to the state
+# backend (zenith.state_store) and records the action's count and latency
+# in zenith.metrics. The write does not wait for the run that follows: a
+# click in a dialog runs only the dialog. An action that calls another
+# runs it inline.
+#
+# count_run() at the top of cs330.py counts this session's script runs
+# (RUNS_KEY), so tests can check that an interaction costs one run.
+# Renders cut short by st.rerun() are counted per page in zenith.metrics.
+#
+# Buttons inside a dialog run the dialog alone (it is a fragment). An
+# action that closes the dialog leaves it nothing to show, and the dialog
+# then asks for the one app run that dismisses it (see zenith.ui). Elements
+# drawn by a callback in a fragment run would land at the top of the app,
+# so actions queue their toasts with notify(); the app shows them.
+
+RUNS_KEY = "script_runs"
+NOTICES_KEY = "action_notices"
+ACTIONS = {}  # name -> handler
+_local = threading.local()  # set while an action runs on this thread
+
+
+def action(handler):
+    """
+    Registers `handler` as an action under its function name. Returns a
+    function with the same signature that dispatches to it, for use as
+    a widget's on_click / on_change.
+    """
+    name = handler.__name__
+    ACTIONS[name] = handler  # a module reloaded in development re-registers its actions
+
+    @functools.wraps(handler)
+    def dispatcher(*args, **kwargs):
+        return dispatch(name, *args, **kwargs)
+
+    return dispatcher
+
+
+def dispatch(name, *args, **kwargs):
+    """Runs the action `name` with the given arguments."""
+    handler = ACTIONS[name]
+    if getattr(_local, "active", False):
+        return handler(*args, **kwargs)
+    session_spill.ensure_resident()
+    _local.active = True
+    start = time.perf_counter()
+    try:
+        result = handler(*args, **kwargs)
+        state_store.sync()
+        return result
+    finally:
+        _local.active = False
+        metrics.get_render_metrics().record_action(name, time.perf_counter() - start)
+
+
+def notify(message):
+    """Queues a toast for the next run to show."""
+    st.session_state.setdefault(NOTICES_KEY, []).append(message)
+
+
+def drain_notices():
+    """Returns the toasts queued by actions since the last call."""
+    return st.session_state.pop(NOTICES_KEY, [])
+
+
+def count_run():
+    """Counts a script run for this session. Returns the session's run count."""
+    st.session_state[RUNS_KEY] = st.session_state.get(RUNS_KEY, 0) + 1
+    return st.session_state[RUNS_KEY]
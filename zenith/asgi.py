@@ -0,0 +1,44 @@
+"""
+ASGI entry point: runs cs330.py under Streamlit's App (Streamlit versions
+that provide st.App), replacing the app/static/ route with one that serves
+with long-lived, immutable cache headers. Everything the app writes under
+static/ (thumbnails, the theme stylesheet) has a content-derived name.
+Streamlit's own static route only sends ETag/Last-Modified, so browsers
+still revalidate on every visit. Also serves the render metrics
+(zenith.metrics) at /metrics for Prometheus to scrape, summed over every
+worker process sharing DATA_DIR.
+
+    uvicorn zenith.asgi:app --port 8501
+"""
+import os
+
+import streamlit as st
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, PlainTextResponse
+from starlette.routing import Route
+
+from zenith import config, metrics
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+_STATIC_ROOT = os.path.realpath(config.STATIC_DIR)
+
+
+async def static_file(request):
+    path = os.path.realpath(os.path.join(_STATIC_ROOT, request.path_params["path"]))
+    if os.path.commonpath((path, _STATIC_ROOT)) != _STATIC_ROOT or not os.path.isfile(path):
+        raise HTTPException(status_code=404)
+    return FileResponse(path, headers={"Cache-Control": IMMUTABLE})
+
+
+async def render_metrics(request):
+    text = metrics.collect(config.data_dir("metrics"), metrics.get_render_metrics())
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+
+
+app = st.App(
+    os.path.join(os.path.dirname(config.STATIC_DIR), "cs330.py"),
+    routes=[
+        Route("/" + config.STATIC_URL + "{path:path}", static_file),
+        Route("/metrics", render_metrics),
+    ],
+)
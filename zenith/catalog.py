@@ -0,0 +1,70 @@
+# --- App Data ---
+# Encapsulating all default data in one place for easier management.
+
+
+def get_default_events():
+    """Returns a list of all available events."""
+    return [
+        {
+            "id": "evt1", "cat": "Fitness",
+            "title": "Wellness Week Yoga", "time": "Today, 6:00 PM", "duration_min": 60,
+            "loc": "Rec Center, Main Gym", "lat": 37.87265, "lon": -122.25308, "cost": "Free",
+            "desc": "Join us for a relaxing evening yoga session. All levels welcome!",
+            "details": "This session is part of Wellness Week and focuses on vinyasa flow. Mats are provided, but you can bring your own. Please arrive 10 minutes early."
+        },
+        {
+            "id": "evt2", "cat": "Wellness",
+            "title": "Mindful Meditation Drop-in", "time": "Tomorrow, 12:00 PM", "duration_min": 60,
+            "loc": "Student Union, Rm 302", "lat": 37.86509, "lon": -122.26164, "cost": "Free",
+            "desc": "A 30-minute guided meditation to de-stress during your day.",
+            "details": "No experience necessary. This is a guided audio meditation led by a campus wellness professional. Feel free to drop in anytime during the 12-1 PM hour."
+        },
+        {
+            "id": "evt3", "cat": "Academic",
+            "title": "Nutrition & Brain Food", "time": "Fri, Nov 22, 4:00 PM", "duration_min": 90,
+            "loc": "Health Services Bldg.", "lat": 37.87697, "lon": -122.26963, "cost": "Free (w/ RSVP)",
+            "desc": "Learn how to fuel your body and mind for finals week.",
+            "details": "A nutritionist will discuss foods that boost memory and focus, and healthy snack ideas for late-night study sessions. Free samples provided!"
+        },
+        {
+            "id": "evt4", "cat": "Social",
+            "title": "Therapy Dogs @ The Library", "time": "Mon, Nov 25, 2:00 PM", "duration_min": 120,
+            "loc": "Main Library, 1st Floor", "lat": 37.87462, "lon": -122.25724, "cost": "Free",
+            "desc": "Take a break from studying and pet some friendly dogs!",
+            "details": "Certified therapy dogs will be available in the main lobby. Take 15 minutes to de-stress and cuddle with a furry friend. Hosted by 'Paws for a Cause'."
+        },
+        {
+            "id": "evt5", "cat": "Fitness",
+            "title": "Campus 5K Fun Run", "time": "Sat, Nov 30, 9:00 AM", "duration_min": 120,
+            "loc": "Main Quad", "lat": 37.87079, "lon": -122.25732, "cost": "$5 Entry",
+            "desc": "Join the annual Turkey Trot 5K! All proceeds go to the campus food pantry.",
+            "details": "Check-in starts at 8:00 AM. The first 100 runners get a free t-shirt. This is a fun run, so all speeds (walking or running) are welcome!"
+        }
+    ]
+
+
+def get_default_resources():
+    """Returns a list of all available resources."""
+    return [
+        {"id": "res1", "cat": "Mental Health", "title": "5 Ways to Beat Exam Stress", "read_time": "4 min read", "body": "Exams pile up fast. Break revision into short blocks, sleep before the test instead of cramming, move your body for ten minutes a day, eat regular meals, and talk to a friend or counselor when worry starts to feel unmanageable.", "img": "https://placehold.co/600x400/EDE7F6/4A148C?text=Mental+Health&font=inter"},
+        {"id": "res2", "cat": "Study", "title": "The Pomodoro Technique: Explained", "read_time": "3 min read", "body": "Work for 25 minutes on a single task, then take a 5-minute break. After four rounds, take a longer 15 to 30 minute break. The timer keeps focus high, makes procrastination easier to beat and helps you estimate how long tasks really take.", "img": "https://placehold.co/600x400/EDE7F6/4A148C?text=Study+Tips&font=inter"},
+        {"id": "res3", "cat": "Campus", "title": "Contact Campus Counseling Services", "read_time": "1 min read", "body": "Counseling and Psychological Services offers free, confidential short-term counseling, drop-in consultations and a 24/7 crisis line for all enrolled students. Appointments can be booked online or by phone at the Health Services building.", "img": "https://placehold.co/600x400/EDE7F6/4A148C?text=Campus&font=inter"},
+        {"id": "res4", "cat": "Mental Health", "title": "Understanding Burnout vs. Stress", "read_time": "5 min read", "body": "Stress is too much: too many pressures that demand too much of you. Burnout is not enough: feeling empty, unmotivated and exhausted. Learn the warning signs of each, and recovery strategies such as rest, boundaries and asking for support.", "img": "https://placehold.co/600x400/EDE7F6/4A148C?text=Wellness&font=inter"},
+        {"id": "res5", "cat": "Sleep", "title": "Why 8 Hours is Non-Negotiable", "read_time": "4 min read", "body": "Sleep consolidates memory, regulates mood and keeps your immune system strong. Students who sleep less than seven hours score lower on exams. Keep a consistent bedtime, limit screens and caffeine late at night, and protect your eight hours.", "img": "https://placehold.co/600x400/EDE7F6/4A148C?text=Sleep&font=inter"},
+        # fixed img URL here:
+        {"id": "res6", "cat": "Study", "title": "Active Recall: How to Really Learn", "read_time": "6 min read", "body": "Rereading notes feels productive but rarely sticks. Active recall means testing yourself: close the book, write down what you remember, use flashcards and practice questions, and combine it with spaced repetition for long-term learning.", "img": "https://placehold.co/600x400/EDE7F6/4A148C?text=Academics&font=inter"},
+    ]
+
+
+def get_default_chat():
+    """Returns the opening coach conversation as (role, text) pairs."""
+    return [
+        ("assistant", "Hi Alex, how can I help you today? Are you looking for study tips, stress management, or something else?"),
+        ("user", "I'm feeling overwhelmed about finals."),
+        ("assistant", "That's completely understandable. It's a high-stress time. Let's break it down.\n\n"
+                      "1. **Prioritize:** What are your top 3 most urgent tasks?\n\n"
+                      "2. **Time-block:** Have you tried the 'Focus Hub' Pomodoro timer? It can help make large tasks feel more manageable.\n\n"
+                      "3. **Rest:** Don't forget to protect your sleep. It's when you consolidate memories!"),
+        ("user", "Okay, I'll try the timer. I just feel like I don't have enough time."),
+        ("assistant", "It's a common feeling. But 25 minutes of *true* focus is often more effective than 2 hours of distracted studying. You've got this!"),
+    ]
@@ -0,0 +1,296 @@
+import collections
+import datetime
+import sqlite3
+import threading
+import time
+
+from zenith import config
+
+# --- Coach Chat History ---
+# Each user's conversation with the coach is persisted in SQLite, keyed by
+# (user_id, seq). It is bounded in two ways.
+# - Ring buffer: at most KEEP_TURNS raw turns are kept per user. Once a user
+#   passes that, the oldest COMPACT_TURNS are folded into one summary row
+#   (turn count, date range, topics, opening message) and deleted.
+# - Summaries: at most MAX_SUMMARIES are kept; the two oldest are merged.
+# The newest RECENT_TURNS of each active user are kept in memory. A rerun
+# renders those plus however many PAGE_TURNS pages the user asked to "load
+# earlier". Page cost and session memory are therefore independent of how
+# long the conversation has run.
+#
+# Several worker processes may share the database (zenith.state_store), and
+# all demo sessions share one user id. A turn's seq is therefore assigned in
+# SQL, under the database's write lock (BEGIN IMMEDIATE), not from this
+# process's cache, and seeding a new user checks for existing turns under
+# the same lock. Reads check the user's newest seq (one indexed lookup); if
+# another process wrote turns since, the in-memory view is reloaded first.
+
+KEEP_TURNS = 500
+COMPACT_TURNS = 100
+MAX_SUMMARIES = 20
+RECENT_TURNS = 20
+PAGE_TURNS = 20
+MAX_CACHED_USERS = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_turns (
+    user_id TEXT NOT NULL,
+    seq     INTEGER NOT NULL,
+    ts      REAL NOT NULL,
+    role    TEXT NOT NULL,
+    text    TEXT NOT NULL,
+    PRIMARY KEY (user_id, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS chat_summaries (
+    user_id   TEXT NOT NULL,
+    first_seq INTEGER NOT NULL,
+    last_seq  INTEGER NOT NULL,
+    first_ts  REAL NOT NULL,
+    last_ts   REAL NOT NULL,
+    turns     INTEGER NOT NULL,
+    topics    TEXT NOT NULL,
+    opener    TEXT NOT NULL,
+    PRIMARY KEY (user_id, first_seq)
+) WITHOUT ROWID;
+"""
+
+# Topic -> words that mark it in a user's message (matched as substrings).
+TOPICS = {
+    "sleep": ("sleep", "tired", "insomnia", "bed"),
+    "focus": ("focus", "procrastinat", "distract", "timer", "study"),
+    "exams": ("exam", "final", "midterm", "test", "deadline"),
+    "stress": ("stress", "overwhelm", "anxious", "anxiety", "panic", "worried"),
+}
+
+Turn = collections.namedtuple("Turn", "seq ts role text")
+
+
+class Summary(collections.namedtuple("Summary", "first_seq last_seq first_ts last_ts turns topics opener")):
+    """A compacted run of turns."""
+
+    __slots__ = ()
+
+    def describe(self):
+        """Returns a one-line description, e.g. for an 'Earlier' expander."""
+        start, end = (
+            datetime.datetime.fromtimestamp(ts, config.CAMPUS_TZ).strftime("%b %d")
+            for ts in (self.first_ts, self.last_ts)
+        )
+        when = start if start == end else f"{start} – {end}"
+        about = f" about {', '.join(self.topics.split(','))}" if self.topics else ""
+        opener = f' It started with "{self.opener}"' if self.opener else ""
+        return f"{when}: {self.turns} messages{about}.{opener}"
+
+
+def _topics(texts):
+    found = {topic for text in texts for topic, words in TOPICS.items() if any(w in text.lower() for w in words)}
+    return ",".join(sorted(found))
+
+
+def summarize(turns):
+    """Compacts consecutive turns (oldest first) into a Summary."""
+    user_texts = [t.text for t in turns if t.role == "user"]
+    opener = user_texts[0] if user_texts else ""
+    if len(opener) > 80:
+        opener = opener[:79].rstrip() + "…"
+    return Summary(turns[0].seq, turns[-1].seq, turns[0].ts, turns[-1].ts, len(turns), _topics(user_texts), opener)
+
+
+def merge(older, newer):
+    """Merges two adjacent summaries into one."""
+    topics = ",".join(sorted(set(filter(None, older.topics.split(",") + newer.topics.split(",")))))
+    return Summary(older.first_seq, newer.last_seq, older.first_ts, newer.last_ts,
+                   older.turns + newer.turns, topics, older.opener or newer.opener)
+
+
+class _UserLog:
+    """In-memory state for one user: newest turns and sequence bookkeeping."""
+
+    __slots__ = ("recent", "next_seq", "first_seq", "count", "lock")
+
+    def __init__(self, recent, next_seq, first_seq, count):
+        self.recent = collections.deque(recent, maxlen=RECENT_TURNS)
+        self.next_seq = next_seq
+        self.first_seq = first_seq  # oldest raw turn still stored
+        self.count = count  # raw turns stored
+        self.lock = threading.Lock()
+
+
+class ChatHistoryStore:
+    """Per-user coach conversations, persisted and bounded."""
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+        self._local = threading.local()
+        self._users = collections.OrderedDict()  # user_id -> _UserLog, LRU order
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _load(self, conn, user_id):
+        """Reads a user's (recent turns, next seq, first seq, count) from the database."""
+        first, last, count = conn.execute(
+            "SELECT MIN(seq), MAX(seq), COUNT(*) FROM chat_turns WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        if last is None:
+            summarized = conn.execute(
+                "SELECT MAX(last_seq) FROM chat_summaries WHERE user_id = ?", (user_id,)
+            ).fetchone()[0]
+            first = last = -1 if summarized is None else summarized
+            first += 1
+        recent = conn.execute(
+            "SELECT seq, ts, role, text FROM chat_turns WHERE user_id = ? ORDER BY seq DESC LIMIT ?",
+            (user_id, RECENT_TURNS),
+        ).fetchall()
+        return map(Turn._make, reversed(recent)), last + 1, first, count
+
+    def _reload(self, conn, user_id, log):
+        recent, log.next_seq, log.first_seq, log.count = self._load(conn, user_id)
+        log.recent.clear()
+        log.recent.extend(recent)
+
+    def _current(self, user_id):
+        """Returns the user's log, reloaded if another process has appended since."""
+        log = self._user(user_id)
+        conn = self._conn()
+        last = conn.execute("SELECT MAX(seq) FROM chat_turns WHERE user_id = ?", (user_id,)).fetchone()[0]
+        if last is not None and last >= log.next_seq:
+            with log.lock:
+                self._reload(conn, user_id, log)
+        return log
+
+    def _user(self, user_id):
+        with self._lock:
+            log = self._users.get(user_id)
+            if log is not None:
+                self._users.move_to_end(user_id)
+                return log
+        log = _UserLog(*self._load(self._conn(), user_id))
+        with self._lock:
+            log = self._users.setdefault(user_id, log)
+            self._users.move_to_end(user_id)
+            while len(self._users) > MAX_CACHED_USERS:
+                self._users.popitem(last=False)
+        return log
+
+    # --- Write path ---
+    def append(self, user_id, role, text, ts=None):
+        """Adds a turn, compacting the oldest turns if the user is over KEEP_TURNS."""
+        ts = time.time() if ts is None else ts
+        log = self._user(user_id)
+        with log.lock:
+            conn = self._conn()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")  # other processes append to the same user
+                return self._insert(conn, user_id, log, role, text, ts)
+
+    def seed(self, user_id, turns):
+        """Writes `(role, text)` turns for a user who has no history yet, in any process."""
+        log = self._user(user_id)
+        if log.next_seq:  # seqs only grow, so a cached non-empty log is final
+            return
+        with log.lock:
+            conn = self._conn()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                if conn.execute(
+                    "SELECT EXISTS (SELECT 1 FROM chat_turns WHERE user_id = ?)"
+                    " OR EXISTS (SELECT 1 FROM chat_summaries WHERE user_id = ?)",
+                    (user_id, user_id),
+                ).fetchone()[0]:
+                    self._reload(conn, user_id, log)
+                    return
+                ts = time.time()
+                for role, text in turns:
+                    self._insert(conn, user_id, log, role, text, ts)
+
+    def _insert(self, conn, user_id, log, role, text, ts):
+        """Adds a turn inside the caller's write transaction, holding log.lock."""
+        seq = conn.execute(
+            "SELECT MAX(COALESCE((SELECT MAX(seq) FROM chat_turns WHERE user_id = ?),"
+            " (SELECT MAX(last_seq) FROM chat_summaries WHERE user_id = ?), -1) + 1, 0)",
+            (user_id, user_id),
+        ).fetchone()[0]
+        turn = Turn(seq, ts, role, text)
+        conn.execute("INSERT INTO chat_turns VALUES (?, ?, ?, ?, ?)", (user_id, *turn))
+        if seq == log.next_seq:
+            log.count += 1
+            log.recent.append(turn)
+            log.next_seq = seq + 1
+        else:  # another process wrote turns since this one last looked
+            self._reload(conn, user_id, log)
+        if log.count > KEEP_TURNS:
+            self._compact(conn, user_id, log)
+        return turn
+
+    def _compact(self, conn, user_id, log):
+        """Folds the oldest turns into a summary, inside the caller's transaction."""
+        oldest = [Turn._make(row) for row in conn.execute(
+            "SELECT seq, ts, role, text FROM chat_turns WHERE user_id = ? ORDER BY seq LIMIT ?",
+            (user_id, COMPACT_TURNS),
+        )]
+        summary = summarize(oldest)
+        conn.execute("INSERT INTO chat_summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (user_id, *summary))
+        conn.execute("DELETE FROM chat_turns WHERE user_id = ? AND seq <= ?", (user_id, summary.last_seq))
+        summaries = self.summaries(user_id)
+        if len(summaries) > MAX_SUMMARIES:
+            older, newer = summaries[0], summaries[1]
+            conn.execute("DELETE FROM chat_summaries WHERE user_id = ? AND first_seq IN (?, ?)",
+                         (user_id, older.first_seq, newer.first_seq))
+            conn.execute("INSERT INTO chat_summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         (user_id, *merge(older, newer)))
+        log.first_seq = summary.last_seq + 1
+        log.count -= len(oldest)
+
+    # --- Read path ---
+    def recent(self, user_id):
+        """Returns the newest RECENT_TURNS turns, oldest first, from memory."""
+        return list(self._current(user_id).recent)
+
+    def before(self, user_id, seq, limit=PAGE_TURNS):
+        """Returns up to `limit` turns older than `seq`, oldest first."""
+        rows = self._conn().execute(
+            "SELECT seq, ts, role, text FROM chat_turns WHERE user_id = ? AND seq < ? ORDER BY seq DESC LIMIT ?",
+            (user_id, seq, limit),
+        ).fetchall()
+        return [Turn._make(row) for row in reversed(rows)]
+
+    def window(self, user_id, pages=0):
+        """
+        Returns (turns, has_earlier): the recent turns plus `pages` pages of
+        older ones, and whether even older raw turns exist.
+        """
+        log = self._current(user_id)
+        turns = list(log.recent)
+        if pages and turns:
+            turns = self.before(user_id, turns[0].seq, pages * PAGE_TURNS) + turns
+        return turns, bool(turns) and turns[0].seq > log.first_seq
+
+    def summaries(self, user_id):
+        """Returns the user's compacted summaries, oldest first."""
+        rows = self._conn().execute(
+            "SELECT first_seq, last_seq, first_ts, last_ts, turns, topics, opener"
+            " FROM chat_summaries WHERE user_id = ? ORDER BY first_seq",
+            (user_id,),
+        ).fetchall()
+        return [Summary._make(row) for row in rows]
+
+    def context(self, user_id, turns=RECENT_TURNS):
+        """
+        Returns the conversation as (role, text) pairs for a coach backend:
+        summaries (role "summary") followed by the newest turns.
+        """
+        recent = self.recent(user_id)[-turns:]
+        return [("summary", s.describe()) for s in self.summaries(user_id)] + [(t.role, t.text) for t in recent]
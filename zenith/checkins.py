@@ -0,0 +1,172 @@
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+# --- Daily Check-In Store ---
+# Check-ins are appended to SQLite (WAL mode) by one background writer that
+# batches rows into a single transaction. Sessions only enqueue, so "Log Now"
+# never waits on disk. Reads use per-thread connections and the
+# (user_id, ts) index, so "last N days" stays an index range scan no matter
+# how many rows the table holds. A batch that fails to commit is retried
+# once and then dropped (and logged), so the writer thread never dies and
+# flush() always returns. flush() waits only for the rows queued before it
+# was called, so it also returns under a steady stream of new check-ins.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkins (
+    user_id TEXT NOT NULL,
+    ts      REAL NOT NULL,
+    mood    INTEGER NOT NULL,
+    stress  INTEGER NOT NULL,
+    tags    TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_checkins_user_ts ON checkins (user_id, ts);
+"""
+
+DAY_SECONDS = 24 * 60 * 60
+WRITE_ATTEMPTS = 2
+RETRY_DELAY_SEC = 0.5
+
+logger = logging.getLogger(__name__)
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class CheckinStore:
+    """SQLite-backed check-in log with a buffered, batching writer."""
+
+    def __init__(self, path, batch_size=500, flush_interval=0.25):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        with _connect(path) as conn:
+            conn.executescript(SCHEMA)
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._queued = self._written = 0  # rows put on / taken off the queue so far
+        self._progress = threading.Condition()
+        self._writer = threading.Thread(target=self._write_loop, name="zenith-checkin-writer", daemon=True)
+        self._writer.start()
+
+    # --- Write path ---
+    def log(self, user_id, mood, stress, tags=(), ts=None):
+        """Queues one check-in for writing. Never blocks on the database."""
+        ts = time.time() if ts is None else ts
+        with self._progress:
+            self._queued += 1
+        self._queue.put((user_id, ts, int(mood), int(stress), ",".join(tags)))
+
+    def log_many(self, rows):
+        """Queues `(user_id, ts, mood, stress, tags)` rows in bulk."""
+        rows = [(user_id, ts, int(mood), int(stress), ",".join(tags)) for user_id, ts, mood, stress, tags in rows]
+        with self._progress:
+            self._queued += len(rows)
+        for row in rows:
+            self._queue.put(row)
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every check-in queued before the call is committed, or
+        `timeout` seconds pass. Returns whether they were.
+        """
+        with self._progress:
+            target = self._queued
+            return self._progress.wait_for(lambda: self._written >= target, timeout=timeout)
+
+    def _write_loop(self):
+        conn = _connect(self.path)
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            try:
+                for attempt in range(1, WRITE_ATTEMPTS + 1):
+                    try:
+                        with conn:
+                            conn.executemany("INSERT INTO checkins VALUES (?, ?, ?, ?, ?)", batch)
+                        break
+                    except Exception:
+                        if attempt == WRITE_ATTEMPTS:
+                            logger.exception("Dropping %d check-ins that could not be written", len(batch))
+                        else:
+                            logger.warning("Check-in write failed; retrying", exc_info=True)
+                            time.sleep(RETRY_DELAY_SEC)
+            finally:
+                with self._progress:
+                    self._written += len(batch)
+                    self._progress.notify_all()
+
+    # --- Read path ---
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.path)
+        return conn
+
+    def between(self, user_id, start_ts, end_ts):
+        """Returns the user's check-ins with start_ts <= ts < end_ts, oldest first."""
+        rows = self._reader().execute(
+            "SELECT ts, mood, stress, tags FROM checkins"
+            " WHERE user_id = ? AND ts >= ? AND ts < ? ORDER BY ts",
+            (user_id, start_ts, end_ts),
+        ).fetchall()
+        return [
+            {"ts": ts, "mood": mood, "stress": stress, "tags": tags.split(",") if tags else []}
+            for ts, mood, stress, tags in rows
+        ]
+
+    def arrays(self, user_id, start_ts, end_ts):
+        """
+        Returns the user's check-ins with start_ts <= ts < end_ts as columns:
+        (ts, mood, stress) float arrays and a list of tag lists.
+        """
+        rows = self._reader().execute(
+            "SELECT ts, mood, stress, tags FROM checkins"
+            " WHERE user_id = ? AND ts >= ? AND ts < ? ORDER BY ts",
+            (user_id, start_ts, end_ts),
+        ).fetchall()
+        data = np.array([row[:3] for row in rows], dtype=np.float64).reshape(-1, 3)
+        tags = [row[3].split(",") if row[3] else [] for row in rows]
+        return data[:, 0], data[:, 1], data[:, 2], tags
+
+    def arrays_after(self, user_id, start_ts, rowid):
+        """
+        Like arrays(), for check-ins with ts >= start_ts that were written
+        after row `rowid`, in write order. Returns (last rowid, ts, mood,
+        stress, tags), so the caller can ask again for the rows after those.
+        """
+        rows = self._reader().execute(
+            "SELECT rowid, ts, mood, stress, tags FROM checkins"
+            " WHERE user_id = ? AND ts >= ? AND rowid > ? ORDER BY rowid",
+            (user_id, start_ts, rowid),
+        ).fetchall()
+        data = np.array([row[1:4] for row in rows], dtype=np.float64).reshape(-1, 3)
+        tags = [row[4].split(",") if row[4] else [] for row in rows]
+        return (rows[-1][0] if rows else rowid), data[:, 0], data[:, 1], data[:, 2], tags
+
+    def recent(self, user_id, days=7, now=None):
+        """Returns the user's check-ins from the last `days` days, oldest first."""
+        now = time.time() if now is None else now
+        return self.between(user_id, now - days * DAY_SECONDS, now + 1)
+
+    def averages(self, user_id, start_ts, end_ts):
+        """Returns (avg mood, avg stress, count) for a time window."""
+        mood, stress, count = self._reader().execute(
+            "SELECT AVG(mood), AVG(stress), COUNT(*) FROM checkins"
+            " WHERE user_id = ? AND ts >= ? AND ts < ?",
+            (user_id, start_ts, end_ts),
+        ).fetchone()
+        return mood, stress, count
@@ -0,0 +1,154 @@
+import abc
+import asyncio
+import queue
+import re
+import threading
+import time
+
+import streamlit as st
+
+from zenith import config, metrics
+
+# --- AI Coach Backend ---
+# A coach backend turns the conversation so far into a reply. It does this as
+# an async generator of text chunks, so a real model client can be dropped in
+# behind the same interface. Every session's reply runs as a task on one
+# shared asyncio loop thread, so any number of concurrent chats costs tasks,
+# not threads. The page pulls chunks through stream_reply() and hands them
+# to st.write_stream, and the user sees the first words as soon as the model
+# produces them. Time to first token is recorded in zenith.metrics.
+
+REPLY_TIMEOUT_SEC = 30  # max wait for the next chunk before giving up
+_DONE = object()
+
+
+class CoachBackend(abc.ABC):
+    """Interface for coach models."""
+
+    name = "base"  # label for the backend's metrics
+
+    @abc.abstractmethod
+    async def reply(self, messages):
+        """
+        Yields the reply to `messages` (a list of (role, text) pairs, oldest
+        first) as text chunks. Roles are "user", "assistant" and "summary";
+        summaries (see zenith.chat_history) stand in for older turns.
+        """
+        raise NotImplementedError
+        yield
+
+
+class LocalCoach(CoachBackend):
+    """
+    Stand-in model with no external dependencies: picks a canned reply by
+    topic and emits it a word at a time, with model-like latencies.
+    """
+
+    name = "local"
+
+    REPLIES = [
+        (("sleep", "tired", "insomnia", "bed"),
+         "Sleep is when your brain consolidates what you studied, so it's worth protecting. "
+         "Try the 10-minute wind-down routine on the Sleep page about 30 minutes before your target bedtime, "
+         "and keep screens out of the last stretch."),
+        (("focus", "procrastinat", "distract", "timer", "study"),
+         "Let's make the next step small. Pick one task, start a 25-minute session in the Focus Hub, "
+         "and put your phone in another room. When the timer ends, take the full 5-minute break."),
+        (("exam", "final", "midterm", "test", "overwhelm", "deadline"),
+         "That's a lot at once, and it's normal to feel it. Write down your three most urgent tasks, "
+         "time-block the first one with a focus session, and schedule a short walk after it. "
+         "Progress beats perfection this week."),
+        (("stress", "anxious", "anxiety", "panic", "worried"),
+         "Let's bring the stress down a notch first. Try the one-minute breathing exercise on the Today page: "
+         "in for 4, hold for 4, out for 6. Then we can plan what's next together."),
+    ]
+    DEFAULT_REPLY = (
+        "That's a great next step. Remember to take your 5-minute breaks! "
+        "Let me know how that first session goes."
+    )
+
+    def __init__(self, first_token_delay=0.35, token_delay=0.03):
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+
+    def choose(self, messages):
+        """Returns the canned reply for the latest user message."""
+        prompt = next((text for role, text in reversed(messages) if role == "user"), "").lower()
+        for keywords, reply in self.REPLIES:
+            if any(word in prompt for word in keywords):
+                return reply
+        return self.DEFAULT_REPLY
+
+    async def reply(self, messages):
+        await asyncio.sleep(self.first_token_delay)  # "prompt processing"
+        for i, word in enumerate(re.findall(r"\S+\s*", self.choose(messages))):
+            if i:
+                await asyncio.sleep(self.token_delay)
+            yield word
+
+
+BACKENDS = {"local": LocalCoach}
+
+
+class _LoopThread:
+    """An asyncio event loop running forever on a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="zenith-coach-loop", daemon=True).start()
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+@st.cache_resource
+def get_loop():
+    """Returns the event loop thread shared by every session's coach replies."""
+    return _LoopThread()
+
+
+@st.cache_resource
+def get_backend():
+    """Returns the configured coach backend (ZENITH_COACH_BACKEND)."""
+    return BACKENDS[config.COACH_BACKEND]()
+
+
+def stream_reply(messages, backend=None, loop=None, render_metrics=None):
+    """
+    Generates the coach's reply on the shared loop and yields its chunks as
+    they arrive, for st.write_stream. If the consumer stops early (the
+    rerun was interrupted), generation is cancelled.
+    """
+    backend = backend or get_backend()
+    loop = loop or get_loop()
+    chunks = queue.SimpleQueue()
+
+    async def pump():
+        try:
+            async for chunk in backend.reply(messages):
+                chunks.put(chunk)
+        except Exception as exc:
+            chunks.put(exc)
+        finally:
+            chunks.put(_DONE)
+
+    start = time.perf_counter()
+    future = loop.submit(pump())
+    first = True
+    try:
+        while True:
+            try:
+                chunk = chunks.get(timeout=REPLY_TIMEOUT_SEC)
+            except queue.Empty:
+                yield "Sorry, I'm taking too long to answer right now. Please try again in a moment."
+                return
+            if chunk is _DONE:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            if first:
+                first = False
+                (render_metrics or metrics.get_render_metrics()).record_first_token(backend.name, time.perf_counter() - start)
+            yield chunk
+    finally:
+        future.cancel()
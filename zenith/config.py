@@ -0,0 +1,65 @@
+import os
+from zoneinfo import ZoneInfo
+
+# --- App Config ---
+# Where the app keeps its on-disk data (databases, caches). Override with
+# ZENITH_DATA_DIR, e.g. to point several workers at shared storage.
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.environ.get("ZENITH_DATA_DIR", os.path.join(_REPO_ROOT, ".zenith_data"))
+
+# Files under static/ (next to cs330.py) are served by Streamlit at
+# app/static/ (server.enableStaticServing in .streamlit/config.toml).
+# Everything written there has a content-derived name, so zenith/asgi.py
+# can serve it with long-lived cache headers.
+STATIC_DIR = os.path.join(_REPO_ROOT, "static")
+STATIC_URL = "app/static/"
+THUMBS_DIR = os.path.join(STATIC_DIR, "thumbs")
+THUMBS_URL = STATIC_URL + "thumbs/"
+
+# Source of the app theme, built into a hashed stylesheet under STATIC_DIR.
+THEME_SOURCE = os.path.join(_REPO_ROOT, "assets", "custom.css")
+
+# The prototype has a single demo student; every session logs as this user.
+DEMO_USER_ID = "alex"
+
+# Campus time zone: event times in the catalog are local campus times.
+CAMPUS_TZ = ZoneInfo(os.environ.get("ZENITH_TZ", "America/Los_Angeles"))
+
+# Where "near you" is measured from until a session shares its own location.
+CAMPUS_LOCATION = (37.8719, -122.2585)
+
+# Opt-in rerun profiling (zenith.profiling). ZENITH_PROFILE=1 profiles every
+# session; ZENITH_ADMIN=1 adds a sidebar toggle to profile just your own.
+# ZENITH_PROFILE_RATE is the fraction of eligible reruns that get profiled.
+PROFILE_ENABLED = os.environ.get("ZENITH_PROFILE", "") == "1"
+PROFILE_SAMPLE_RATE = float(os.environ.get("ZENITH_PROFILE_RATE", "1.0"))
+PROFILE_KEEP = int(os.environ.get("ZENITH_PROFILE_KEEP", "200"))  # newest files kept per page
+ADMIN_MODE = os.environ.get("ZENITH_ADMIN", "") == "1"
+
+# Which zenith.coach backend answers the AI Coach chat.
+COACH_BACKEND = os.environ.get("ZENITH_COACH_BACKEND", "local")
+
+# Where session state lives between runs, so any worker can serve any user
+# (zenith.state_store): "sqlite" or "file" under DATA_DIR, or "redis" at
+# ZENITH_REDIS_URL. Sessions untouched for ZENITH_STATE_TTL_DAYS are dropped.
+STATE_BACKEND = os.environ.get("ZENITH_STATE_BACKEND", "sqlite")
+REDIS_URL = os.environ.get("ZENITH_REDIS_URL", "redis://localhost:6379/0")
+STATE_TTL_SEC = float(os.environ.get("ZENITH_STATE_TTL_DAYS", "30")) * 24 * 60 * 60
+
+# A session with no reruns for ZENITH_IDLE_TIMEOUT_MIN has its state spilled
+# to disk and dropped from memory until it is used again (zenith.session_spill).
+IDLE_TIMEOUT_SEC = float(os.environ.get("ZENITH_IDLE_TIMEOUT_MIN", "30")) * 60
+
+
+def data_path(*parts):
+    """Returns a path under DATA_DIR, creating parent directories."""
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def data_dir(*parts):
+    """Returns a directory under DATA_DIR, creating it if needed."""
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,96 @@
+import bisect
+import datetime
+
+from zenith.config import CAMPUS_TZ
+
+# --- Event Times ---
+# Catalog times are display strings ("Today, 6:00 PM", "Fri, Nov 22, 4:00 PM").
+# They are parsed once, when an event enters the EventStore, into numeric
+# start/end times (zenith.models.Event; `start`/`end` read back as
+# timezone-aware datetimes). IntervalIndex keeps events sorted by
+# start so "what's next" is a binary search and schedule conflicts are found
+# with one sweep over the RSVP'd events instead of comparing every pair.
+
+DEFAULT_DURATION_MIN = 60
+_RELATIVE_DAYS = {"today": 0, "tomorrow": 1}
+
+
+def parse_event_time(text, now):
+    """
+    Parses a catalog time string into an aware datetime in CAMPUS_TZ.
+    "Today"/"Tomorrow" are relative to `now`; "Fri, Nov 22" is the next
+    Nov 22 on or after today (the weekday is informational only), and
+    "Feb 29" the next one in a leap year.
+    """
+    day, clock = text.rsplit(",", 1)
+    day = day.strip()
+    clock = datetime.datetime.strptime(clock.strip(), "%I:%M %p").time()
+    today = now.astimezone(CAMPUS_TZ).date()
+    if day.lower() in _RELATIVE_DAYS:
+        date = today + datetime.timedelta(days=_RELATIVE_DAYS[day.lower()])
+    else:
+        month_day = day.rsplit(",", 1)[-1].strip()
+        # Parse with the year: strptime's default year (1900) has no Feb 29.
+        for year in range(today.year, today.year + 9):  # the next Feb 29 is at most 8 years away
+            try:
+                date = datetime.datetime.strptime(f"{month_day} {year}", "%b %d %Y").date()
+            except ValueError:
+                continue
+            if date >= today:
+                break
+        else:
+            raise ValueError(f"no date {month_day!r} on or after {today}")
+    return datetime.datetime.combine(date, clock, tzinfo=CAMPUS_TZ)
+
+
+def format_event_time(start, now=None):
+    """Formats a start time for display: 'Today, 6:00 PM' or 'Fri, Nov 22, 4:00 PM'."""
+    now = datetime.datetime.now(CAMPUS_TZ) if now is None else now.astimezone(CAMPUS_TZ)
+    start = start.astimezone(CAMPUS_TZ)
+    days = (start.date() - now.date()).days
+    if days == 0:
+        day = "Today"
+    elif days == 1:
+        day = "Tomorrow"
+    else:
+        day = f"{start:%a, %b} {start.day}"
+    return f"{day}, {start.hour % 12 or 12}:{start:%M %p}"
+
+
+class IntervalIndex:
+    """Events sorted by (start, end) for O(log n) lookups by time. Works on epoch seconds."""
+
+    def __init__(self, events):
+        ordered = sorted(events, key=lambda e: (e.start_ts, e.end_ts))
+        self._events = ordered
+        self._starts = [e.start_ts for e in ordered]
+        self._rank = {e.id: i for i, e in enumerate(ordered)}
+
+    def next_after(self, now):
+        """Returns the first event starting at or after `now`, or None."""
+        i = bisect.bisect_left(self._starts, now.timestamp())
+        return self._events[i] if i < len(self._events) else None
+
+    def upcoming(self, now, limit=None):
+        """Returns events starting at or after `now`, soonest first."""
+        i = bisect.bisect_left(self._starts, now.timestamp())
+        return self._events[i:None if limit is None else i + limit]
+
+    def sort_ids(self, event_ids):
+        """Returns the given (indexed) event ids ordered by start time."""
+        return sorted((i for i in event_ids if i in self._rank), key=self._rank.__getitem__)
+
+    def conflicts(self, event_ids):
+        """
+        Returns the ids among `event_ids` that overlap another one of them.
+        Single sweep in start order, tracking the latest end seen so far.
+        """
+        clashing = set()
+        latest_end, latest_id = None, None
+        for event_id in self.sort_ids(event_ids):
+            event = self._events[self._rank[event_id]]
+            if latest_end is not None and event.start_ts < latest_end:
+                clashing.update((event_id, latest_id))
+            if latest_end is None or event.end_ts > latest_end:
+                latest_end, latest_id = event.end_ts, event_id
+        return clashing
@@ -0,0 +1,187 @@
+import collections
+import datetime
+
+from zenith.config import CAMPUS_TZ
+from zenith.event_times import IntervalIndex
+from zenith.geo import GeoIndex
+from zenith.models import Event
+
+# --- Event Catalog & Schedule ---
+# EventStore holds the event catalog with an id index and secondary indexes
+# by category and by day, built once when events are added (that is also when
+# each catalog dict becomes a compact zenith.models.Event, with its display
+# time parsed into numeric start/end times). Ordered lists per
+# category are cached for paging, so showing one page is a list slice no
+# matter how big the catalog is. Schedule holds a session's RSVPs as an
+# insertion-ordered set, so "already RSVP'd?" checks and cancels are O(1)
+# instead of scanning a list.
+#
+# The app's catalog is built once per process and frozen (see
+# zenith.stores.get_event_catalog): events are immutable Event records and every
+# lazy index is built up front, so all sessions can read it concurrently.
+# A session keeps only its own overlay: its Schedule and the ids it has
+# opened.
+
+
+class EventStore:
+    """Event catalog with id, category and day indexes. Preserves catalog order."""
+
+    def __init__(self, events=(), now=None):
+        self._now = datetime.datetime.now(CAMPUS_TZ) if now is None else now
+        self._by_id = {}
+        self._by_category = collections.defaultdict(dict)
+        self._by_day = collections.defaultdict(dict)
+        self._lists = {}  # category (None = all) -> ordered list, for slicing
+        self._intervals = None  # IntervalIndex, rebuilt after the catalog changes
+        self._geo = None  # GeoIndex over events with lat/lon, likewise
+        self._frozen = False
+        for event in events:
+            self.add(event)
+
+    def add(self, event):
+        """Adds (or replaces) an event and indexes it. Accepts an Event or a catalog dict."""
+        self._check_writable()
+        if not isinstance(event, Event):
+            event = Event.from_dict(event, self._now)
+        if event.id in self._by_id:
+            self.remove(event.id)
+        self._by_id[event.id] = event
+        self._lists.clear()
+        self._intervals = None
+        self._geo = None
+        self._by_category[event.cat][event.id] = event
+        self._by_day[event.start.date()][event.id] = event
+
+    def remove(self, event_id):
+        """Removes an event and its index entries. Returns the event or None."""
+        self._check_writable()
+        event = self._by_id.pop(event_id, None)
+        if event is not None:
+            self._lists.clear()
+            self._intervals = None
+            self._geo = None
+            self._drop(self._by_category, event.cat, event_id)
+            self._drop(self._by_day, event.start.date(), event_id)
+        return event
+
+    def _check_writable(self):
+        if self._frozen:
+            raise TypeError("This event catalog is frozen and shared between sessions; it can't be changed.")
+
+    def freeze(self):
+        """
+        Makes the store read-only so it can be shared between sessions (the
+        events themselves are already immutable): the paging lists, interval
+        index and geo index are built now instead of on first use.
+        """
+        self._by_category.default_factory = self._by_day.default_factory = None
+        self._lists.clear()
+        for category in [None, *self._by_category]:
+            self._list(category)
+        self.intervals()
+        self._geo_index()
+        self._frozen = True
+        return self
+
+    @property
+    def frozen(self):
+        return self._frozen
+
+    @staticmethod
+    def _drop(index, key, event_id):
+        bucket = index[key]
+        del bucket[event_id]
+        if not bucket:
+            del index[key]
+
+    def get(self, event_id):
+        """Returns the event with this id, or None."""
+        return self._by_id.get(event_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, event_id):
+        return event_id in self._by_id
+
+    def featured(self):
+        """Returns the first event in the catalog, or None."""
+        return next(iter(self._by_id.values()), None)
+
+    def in_category(self, category):
+        """Returns the events in a category, in catalog order."""
+        return list(self._by_category.get(category, {}).values())
+
+    def _list(self, category):
+        events = self._lists.get(category)
+        if events is None:
+            source = self._by_id if category is None else self._by_category.get(category, {})
+            events = self._lists[category] = list(source.values())
+        return events
+
+    def count(self, category=None):
+        """Returns how many events are in a category (None = all)."""
+        if category is None:
+            return len(self._by_id)
+        return len(self._by_category.get(category, ()))
+
+    def slice(self, category=None, start=0, stop=None):
+        """Returns events[start:stop] of a category (None = all), in catalog order."""
+        return self._list(category)[start:stop]
+
+    def on_day(self, date):
+        """Returns the events starting on a (campus-local) date, in catalog order."""
+        return list(self._by_day.get(date, {}).values())
+
+    def intervals(self):
+        """Returns the IntervalIndex over the catalog's start/end times."""
+        if self._intervals is None:
+            self._intervals = IntervalIndex(self._by_id.values())
+        return self._intervals
+
+    def next_event(self, now):
+        """Returns the next event starting at or after `now`, or None. O(log n)."""
+        return self.intervals().next_after(now)
+
+    def nearest(self, lat, lon, k=5):
+        """Returns [(event, meters)] for the k events closest to (lat, lon)."""
+        return [(self._by_id[event_id], meters) for event_id, meters in self._geo_index().nearest(lat, lon, k)]
+
+    def _geo_index(self):
+        if self._geo is None:
+            located = [e for e in self._by_id.values() if e.lat is not None and e.lon is not None]
+            self._geo = GeoIndex([e.id for e in located], [e.lat for e in located], [e.lon for e in located])
+        return self._geo
+
+    def conflicts(self, event_ids):
+        """Returns the ids among `event_ids` whose times overlap another of them."""
+        return self.intervals().conflicts(event_ids)
+
+    def categories(self):
+        """Returns the categories present in the catalog, sorted."""
+        return sorted(self._by_category)
+
+
+class Schedule:
+    """A session's RSVP'd event ids: an insertion-ordered set."""
+
+    def __init__(self, event_ids=()):
+        self._ids = dict.fromkeys(event_ids)
+
+    def add(self, event_id):
+        self._ids[event_id] = None
+
+    def discard(self, event_id):
+        self._ids.pop(event_id, None)
+
+    def __contains__(self, event_id):
+        return event_id in self._ids
+
+    def __iter__(self):
+        return iter(list(self._ids))
+
+    def __len__(self):
+        return len(self._ids)
@@ -0,0 +1,73 @@
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+# --- Focus Session Log ---
+# One row per completed Pomodoro focus phase. Phases end a few times a day
+# per user at most, so rows are written synchronously. Reads return NumPy
+# columns for the insight engine (zenith.insights).
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS focus_sessions (
+    user_id TEXT NOT NULL,
+    ts      REAL NOT NULL,
+    minutes REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_focus_user_ts ON focus_sessions (user_id, ts);
+"""
+
+
+class FocusLog:
+    """SQLite-backed log of completed focus sessions."""
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def log(self, user_id, minutes, ts=None):
+        """Records a finished focus session of `minutes` ending at `ts`."""
+        ts = time.time() if ts is None else ts
+        with self._conn() as conn:
+            conn.execute("INSERT INTO focus_sessions VALUES (?, ?, ?)", (user_id, ts, float(minutes)))
+
+    def log_many(self, rows):
+        """Records `(user_id, ts, minutes)` rows in one transaction."""
+        with self._conn() as conn:
+            conn.executemany("INSERT INTO focus_sessions VALUES (?, ?, ?)", rows)
+
+    def arrays(self, user_id, start_ts, end_ts):
+        """Returns (ts, minutes) arrays for start_ts <= ts < end_ts, oldest first."""
+        rows = self._conn().execute(
+            "SELECT ts, minutes FROM focus_sessions WHERE user_id = ? AND ts >= ? AND ts < ? ORDER BY ts",
+            (user_id, start_ts, end_ts),
+        ).fetchall()
+        data = np.array(rows, dtype=np.float64).reshape(-1, 2)
+        return data[:, 0], data[:, 1]
+
+    def arrays_after(self, user_id, start_ts, rowid):
+        """
+        Returns (last rowid, ts, minutes) for sessions with ts >= start_ts
+        written after row `rowid`, in write order.
+        """
+        rows = self._conn().execute(
+            "SELECT rowid, ts, minutes FROM focus_sessions WHERE user_id = ? AND ts >= ? AND rowid > ? ORDER BY rowid",
+            (user_id, start_ts, rowid),
+        ).fetchall()
+        data = np.array([row[1:] for row in rows], dtype=np.float64).reshape(-1, 2)
+        return (rows[-1][0] if rows else rowid), data[:, 0], data[:, 1]
@@ -0,0 +1,77 @@
+import time
+
+import streamlit as st
+
+from zenith import actions, session_spill, timers
+
+# --- Pomodoro Countdown ---
+# The countdown lives in a fragment so that each tick only re-renders the
+# timer display instead of re-running all of cs330.py once per second.
+# When a phase ends is decided by the shared timer scheduler (zenith.timers),
+# which sets `ts.finished`; the fragment only draws the clock.
+
+TICK_SECONDS = 1
+
+
+def current_duration_sec(ts):
+    """Returns the length of the current phase (focus or break) in seconds."""
+    return (ts.break_duration_min if ts.is_break else ts.duration_min) * 60
+
+
+def remaining_seconds(ts, now=None):
+    """Returns how many seconds are left in the current phase."""
+    now = time.time() if now is None else now
+    return current_duration_sec(ts) - (now - ts.start_time)
+
+
+@actions.action
+def start_focus():
+    """Starts (or restarts) a focus phase for the current task."""
+    ts = st.session_state.timer_state
+    ts.is_break = False
+    ts.running = True
+    ts.start_time = time.time()
+    timers.schedule_focus_phase(ts)
+
+
+@actions.action
+def start_break():
+    """Starts the break phase that follows a finished focus phase."""
+    ts = st.session_state.timer_state
+    ts.is_break = True
+    ts.running = True
+    ts.start_time = time.time()
+    timers.schedule_focus_phase(ts)
+
+
+@st.fragment(run_every=TICK_SECONDS)
+def countdown():
+    """
+    Renders the big timer and progress bar.
+    Re-runs on its own every TICK_SECONDS; hands control back to the full
+    app (one rerun) only when the phase is over. While it ticks, the
+    session counts as active and is never spilled.
+    """
+    session_spill.ensure_resident()
+    ts = st.session_state.timer_state
+    if not ts.running:
+        return
+
+    if ts.finished:
+        # Phase finished: let page_focus render the finish/break screen.
+        st.rerun()
+
+    remaining = max(0, remaining_seconds(ts))
+    timer_title = "Focusing on:" if not ts.is_break else "On a Break"
+    task_display = f"**{ts.task_name}**" if not ts.is_break else "Time to relax!"
+    st.markdown(f"{timer_title} {task_display}")
+
+    mins, secs = divmod(int(remaining), 60)
+    timer_display = f"{mins:02d}:{secs:02d}"
+
+    # Display big timer
+    st.markdown(f"<h1 style='text-align: center; color: #4A148C; font-size: 5rem; margin-bottom: 0;'>{timer_display}</h1>", unsafe_allow_html=True)
+
+    # Progress bar
+    percent_complete = min(1.0, 1 - remaining / current_duration_sec(ts))
+    st.progress(percent_complete, text=f"{int(percent_complete * 100)}% complete")
@@ -0,0 +1,111 @@
+import math
+
+import numpy as np
+
+# --- Near-You Lookup ---
+# Events with coordinates are bucketed into a fixed lat/lon grid (cells of
+# CELL_DEG degrees, ~1 km). A nearest-k query scans rings of cells outward
+# from the user's cell and stops once the k-th best distance is closer than
+# anything an unscanned ring could hold, so it only touches a few hundred
+# candidates even in a 50k-event regional catalog. Ring r has 8r cells, so a
+# query far from every event (another city) would walk thousands of empty
+# rings. Past MAX_RINGS the query scans all points instead, which costs the
+# same wherever the user is. Distances are vectorized haversine over each
+# candidate batch.
+
+EARTH_RADIUS_M = 6_371_000.0
+METERS_PER_MILE = 1609.344
+CELL_DEG = 0.01
+MAX_RINGS = 32  # rings walked before falling back to a scan of every point
+
+
+def haversine_m(lat, lon, lats, lons):
+    """Great-circle distance in meters from (lat, lon) to arrays of points."""
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def format_miles(meters):
+    """Formats a distance for event cards, e.g. '0.3 mi'."""
+    return f"{meters / METERS_PER_MILE:.1f} mi"
+
+
+class GeoIndex:
+    """Grid-bucketed points for nearest-k queries. Immutable once built."""
+
+    def __init__(self, ids, lats, lons, cell_deg=CELL_DEG):
+        self.cell_deg = cell_deg
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        rows = np.floor(lats / cell_deg).astype(np.int64)
+        cols = np.floor(lons / cell_deg).astype(np.int64)
+        # Sort points by cell so each cell is one contiguous slice.
+        order = np.lexsort((cols, rows))
+        self.ids = np.asarray(ids, dtype=object)[order]
+        self.lats, self.lons = lats[order], lons[order]
+        rows, cols = rows[order], cols[order]
+        self._cells = {}
+        if len(order):
+            breaks = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 0)) + 1
+            starts = np.concatenate(([0], breaks))
+            ends = np.concatenate((breaks, [len(order)]))
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self._cells[(int(rows[start]), int(cols[start]))] = (start, end)
+            self._bounds = (int(rows.min()), int(rows.max()), int(cols.min()), int(cols.max()))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _ring(self, row, col, r):
+        """Yields the (start, end) slices of the non-empty cells at ring distance r."""
+        if r == 0:
+            cells = [(row, col)]
+        else:
+            cells = [(row + dr, col + dc) for dr in (-r, r) for dc in range(-r, r + 1)]
+            cells += [(row + dr, col + dc) for dc in (-r, r) for dr in range(-r + 1, r)]
+        for cell in cells:
+            span = self._cells.get(cell)
+            if span is not None:
+                yield span
+
+    def nearest(self, lat, lon, k=5):
+        """Returns [(id, meters)] for the k nearest points, closest first."""
+        if not len(self.ids) or k <= 0:
+            return []
+        row, col = math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+        row_min, row_max, col_min, col_max = self._bounds
+        # Rings closer than the grid's bounding box are empty; rings past the
+        # farthest corner hold nothing new.
+        r = max(0, row_min - row, row - row_max, col_min - col, col - col_max)
+        r_last = max(abs(row - row_min), abs(row - row_max), abs(col - col_min), abs(col - col_max))
+        cell_rad = math.radians(self.cell_deg)
+
+        idx = np.empty(0, dtype=np.int64)
+        dist = np.empty(0)
+        while r <= r_last:
+            if r > MAX_RINGS:
+                return self._scan(lat, lon, k)
+            spans = list(self._ring(row, col, r))
+            if spans:
+                new_idx = np.concatenate([np.arange(s, e) for s, e in spans])
+                idx = np.concatenate((idx, new_idx))
+                dist = np.concatenate((dist, haversine_m(lat, lon, self.lats[new_idx], self.lons[new_idx])))
+            # Anything in ring r+1 or beyond is at least r cells away: r rows
+            # north or south, or r columns east or west within the ring's
+            # rows, where a column is narrowest at the ring's largest |lat|.
+            max_lat = min(90.0, max(abs(row - r), abs(row + r + 1)) * self.cell_deg)
+            cell_m = cell_rad * EARTH_RADIUS_M * math.cos(math.radians(max_lat))
+            if len(idx) >= k and np.partition(dist, k - 1)[k - 1] <= r * cell_m:
+                break
+            r += 1
+        top = np.argsort(dist, kind="stable")[:k]
+        return [(self.ids[idx[i]], float(dist[i])) for i in top]
+
+    def _scan(self, lat, lon, k):
+        """nearest() by computing the distance to every point."""
+        dist = haversine_m(lat, lon, self.lats, self.lons)
+        top = np.argpartition(dist, k - 1)[:k] if k < len(dist) else np.arange(len(dist))
+        top = top[np.argsort(dist[top], kind="stable")]
+        return [(self.ids[i], float(dist[i])) for i in top]
@@ -0,0 +1,328 @@
+import collections
+import datetime
+import itertools
+import logging
+import math
+import queue
+import threading
+import time
+import warnings
+
+import numpy as np
+
+from zenith import config
+from zenith.sleep_stats import durations_min
+
+# --- Weekly Insight Engine ---
+# Finds patterns in a user's last WINDOW_DAYS of data:
+# - check-in stress and mood,
+# - sleep duration of the night before,
+# - minutes of completed focus sessions.
+# Each source is binned into one value per day with np.bincount. The engine
+# then looks for:
+# - correlations between the daily series (Pearson r over the days that
+#   have both values),
+# - check-in tags that come with higher stress,
+# - days in the last RECENT_DAYS that sit far outside the window's usual
+#   range (z-score).
+# The strongest finding becomes the user's Insight.
+#
+# None of this runs while a page renders. Write paths call refresh(user_id)
+# after new logs arrive. A background worker recomputes that user's insight
+# from a bounded window, so the cost doesn't grow with history, and caches
+# it. The window's raw check-ins and focus sessions are kept per user, and
+# each recompute reads only the rows written since the last one and drops
+# those that aged out. Pages call get(), which returns the cached insight
+# (recomputed when the day rolls over) and never waits: before a user's
+# first insight is ready it returns None and the page says so.
+
+WINDOW_DAYS = 28
+RECENT_DAYS = 7
+MIN_DAYS = 5  # days with both values before a correlation is reported
+MIN_R = 0.4
+MIN_TAGGED = 3  # check-ins with a tag before its stress effect is reported
+MIN_TAG_GAP = 1.0  # stress points between tagged and untagged check-ins
+ANOMALY_Z = 1.5
+SHORT_SLEEP_H = 7
+DAY_SECONDS = 24 * 60 * 60
+FLUSH_WAIT_SEC = 2  # longest wait for queued check-ins before a recompute
+
+logger = logging.getLogger(__name__)
+
+Insight = collections.namedtuple("Insight", "kind summary detail suggestion day")
+
+SUGGESTIONS = {
+    "sleep": "Try a 10-minute wind-down routine 30 minutes before your target bedtime tonight.",
+    "focus": "Start one 25-minute session in the Focus Hub before checking your phone.",
+    "stress": "Take a 60-second breathing reset when your stress starts climbing.",
+    "log": "Log a check-in today so your coach can spot what helps.",
+}
+
+
+def _local_day(ts, offset):
+    """Days since 1970-01-01 in campus time for epoch seconds `ts`."""
+    return np.floor((np.asarray(ts, dtype=np.float64) + offset) / DAY_SECONDS).astype(np.int64)
+
+
+def _daily_mean(idx, values, days):
+    """Mean of `values` per day index in [0, days); NaN for days with none."""
+    keep = (idx >= 0) & (idx < days)
+    counts = np.bincount(idx[keep], minlength=days)
+    sums = np.bincount(idx[keep], weights=np.asarray(values, dtype=np.float64)[keep], minlength=days)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+def _daily_sum(idx, values, days):
+    keep = (idx >= 0) & (idx < days)
+    return np.bincount(idx[keep], weights=np.asarray(values, dtype=np.float64)[keep], minlength=days)
+
+
+def pearson(x, y):
+    """Returns (r, n) over positions where both are finite; r is None if undefined."""
+    both = np.isfinite(x) & np.isfinite(y)
+    n = int(both.sum())
+    if n < MIN_DAYS:
+        return None, n
+    x, y = x[both], y[both]
+    if x.std() == 0 or y.std() == 0:
+        return None, n
+    return float(np.corrcoef(x, y)[0, 1]), n
+
+
+DailySeries = collections.namedtuple("DailySeries", "first_day stress mood sleep_h focus_min")
+
+
+def daily_series(first_day, days, checkin_ts, mood, stress, sleep_night, sleep_hours, focus_ts, focus_min, offset):
+    """
+    Bins raw logs into one value per day, starting at `first_day` (days
+    since epoch). A night's sleep counts towards the day after it started.
+    Focus minutes are 0 on days without a session, or NaN throughout if the
+    user has none in the window.
+    """
+    checkin_idx = _local_day(checkin_ts, offset) - first_day
+    sleep_idx = np.asarray(sleep_night, dtype=np.int64) + 1 - first_day
+    focus_idx = _local_day(focus_ts, offset) - first_day
+    focus = _daily_sum(focus_idx, focus_min, days) if len(focus_ts) else np.full(days, np.nan)
+    return DailySeries(
+        first_day,
+        _daily_mean(checkin_idx, stress, days),
+        _daily_mean(checkin_idx, mood, days),
+        _daily_mean(sleep_idx, sleep_hours, days),
+        focus,
+    )
+
+
+def _weekday(day):
+    return (datetime.date(1970, 1, 1) + datetime.timedelta(days=int(day))).strftime("%a")
+
+
+def _findings(series, stress, tags):
+    """Yields (strength, kind, summary, detail) for every pattern found."""
+    sleep, short = series.sleep_h, series.sleep_h < SHORT_SLEEP_H
+    long_ = series.sleep_h >= SHORT_SLEEP_H
+
+    r, n = pearson(sleep, series.stress)
+    if r is not None and r <= -MIN_R:
+        a, b = np.nanmean(series.stress[short]), np.nanmean(series.stress[long_])
+        if math.isfinite(a) and math.isfinite(b):
+            yield -r, "sleep", "Your stress runs higher after short nights.", (
+                f"Over {n} days, your stress averaged **{a:.1f}/5 after nights under {SHORT_SLEEP_H} hours** "
+                f"of sleep, vs {b:.1f}/5 after longer ones.")
+
+    r, n = pearson(sleep, series.mood)
+    if r is not None and r >= MIN_R:
+        a, b = np.nanmean(series.mood[long_]), np.nanmean(series.mood[short])
+        if math.isfinite(a) and math.isfinite(b):
+            yield r, "sleep", "Your mood is better after a full night's sleep.", (
+                f"Over {n} days, your mood averaged **{a:.1f}/5 after {SHORT_SLEEP_H}+ hours** of sleep, "
+                f"vs {b:.1f}/5 after shorter nights.")
+
+    r, n = pearson(sleep, series.focus_min)
+    if r is not None and r >= MIN_R:
+        a, b = np.nanmean(series.focus_min[long_]), np.nanmean(series.focus_min[short])
+        if math.isfinite(a) and math.isfinite(b):
+            yield r, "sleep", "You focus longer after a good night's sleep.", (
+                f"Over {n} days, you logged **{a:.0f} focus minutes a day after {SHORT_SLEEP_H}+ hours** "
+                f"of sleep, vs {b:.0f} after shorter nights.")
+
+    r, n = pearson(series.stress, series.focus_min)
+    if r is not None and r <= -MIN_R:
+        yield -r, "stress", "High-stress days are your least focused.", (
+            f"Over {n} days, the more stressed you felt, the fewer focus minutes you logged (r = {r:.2f}).")
+
+    if tags:
+        names = sorted({t for row in tags for t in row})
+        for name in names:
+            tagged = np.fromiter((name in row for row in tags), dtype=bool, count=len(tags))
+            if tagged.sum() < MIN_TAGGED or tagged.all():
+                continue
+            gap = stress[tagged].mean() - stress[~tagged].mean()
+            if gap >= MIN_TAG_GAP:
+                yield min(1.0, gap / 2), "stress", f"Your stress is highest on days you tag {name}.", (
+                    f"Check-ins tagged **{name}** averaged **{stress[tagged].mean():.1f}/5 stress**, "
+                    f"vs {stress[~tagged].mean():.1f}/5 for the rest.")
+
+    recent = slice(len(sleep) - RECENT_DAYS, None)
+    for values, kind, low in ((sleep, "sleep", True), (series.stress, "stress", False)):
+        base = values[np.isfinite(values)]
+        if len(base) < MIN_DAYS or base.std() == 0:
+            continue
+        with np.errstate(invalid="ignore"):
+            z = (values[recent] - base.mean()) / base.std()
+        odd = np.flatnonzero(z <= -ANOMALY_Z) if low else np.flatnonzero(z >= ANOMALY_Z)
+        if not len(odd):
+            continue
+        days = [series.first_day + len(sleep) - RECENT_DAYS + i for i in odd]
+        when = " and ".join(_weekday(d) for d in days[-2:])
+        level = float(np.mean(values[recent][odd]))
+        if low:
+            yield min(1.0, abs(np.nanmin(z)) / 3), kind, f"Your sleep dipped to ~{level:.1f} hours on {when}.", (
+                f"That's well under your usual {base.mean():.1f} hours. Short nights tend to pile up before deadlines.")
+        else:
+            yield min(1.0, np.nanmax(z) / 3), kind, f"Your stress spiked to {level:.1f}/5 on {when}.", (
+                f"Your usual level is {base.mean():.1f}/5. Let's look at what was going on those days.")
+
+
+def build_insight(series, stress, tags, day):
+    """Picks the strongest finding, or sums up the week if there is none."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # means of days with no data are NaN
+        best = max(_findings(series, stress, tags), key=lambda f: f[0], default=None)
+        week = slice(len(series.stress) - RECENT_DAYS, None)
+        stress_avg, sleep_avg = np.nanmean(series.stress[week]), np.nanmean(series.sleep_h[week])
+    if best is not None:
+        _, kind, summary, detail = best
+        return Insight(kind, summary, detail, SUGGESTIONS[kind], day)
+
+    parts = []
+    if math.isfinite(stress_avg):
+        parts.append(f"stress averaged **{stress_avg:.1f}/5**")
+    if math.isfinite(sleep_avg):
+        parts.append(f"sleep averaged **{sleep_avg:.1f} hours**")
+    if np.isfinite(series.focus_min[week]).any():
+        parts.append(f"you logged **{np.nansum(series.focus_min[week]):.0f} focus minutes**")
+    if not parts:
+        return Insight("log", "Your coach doesn't have enough logs yet to spot patterns.",
+                       "Log check-ins and sleep for a few days and I'll point out what affects your stress, sleep and focus.",
+                       SUGGESTIONS["log"], day)
+    return Insight("log", "No strong patterns this week. Keep logging!",
+                   "This week " + ", ".join(parts) + ". Nothing stands out yet.", SUGGESTIONS["log"], day)
+
+
+class _Window:
+    """One user's raw check-ins and focus sessions from `start_ts` on, read incrementally."""
+
+    __slots__ = ("start_ts", "checkin_rowid", "checkin_ts", "mood", "stress", "tags",
+                 "focus_rowid", "focus_ts", "focus_min")
+
+    def __init__(self, start_ts):
+        self.start_ts = start_ts
+        self.checkin_rowid = self.focus_rowid = 0
+        self.checkin_ts = self.mood = self.stress = self.focus_ts = self.focus_min = np.empty(0)
+        self.tags = []
+
+    def update(self, checkins, focus_log, user_id, start_ts):
+        """Drops rows from before `start_ts`, then appends the rows written since the last update."""
+        self.start_ts = start_ts
+        keep = self.checkin_ts >= start_ts
+        if not keep.all():
+            self.checkin_ts, self.mood, self.stress = self.checkin_ts[keep], self.mood[keep], self.stress[keep]
+            self.tags = list(itertools.compress(self.tags, keep))
+        keep = self.focus_ts >= start_ts
+        if not keep.all():
+            self.focus_ts, self.focus_min = self.focus_ts[keep], self.focus_min[keep]
+
+        self.checkin_rowid, ts, mood, stress, tags = checkins.arrays_after(user_id, start_ts, self.checkin_rowid)
+        if len(ts):
+            self.checkin_ts = np.concatenate((self.checkin_ts, ts))
+            self.mood = np.concatenate((self.mood, mood))
+            self.stress = np.concatenate((self.stress, stress))
+            self.tags = self.tags + tags
+        self.focus_rowid, ts, minutes = focus_log.arrays_after(user_id, start_ts, self.focus_rowid)
+        if len(ts):
+            self.focus_ts = np.concatenate((self.focus_ts, ts))
+            self.focus_min = np.concatenate((self.focus_min, minutes))
+
+
+class InsightEngine:
+    """Per-user cached insights, recomputed off the render path."""
+
+    def __init__(self, checkins, sleep_store, focus_log, clock=time.time, start=True):
+        self.checkins = checkins
+        self.sleep_store = sleep_store
+        self.focus_log = focus_log
+        self._clock = clock
+        self._insights = {}
+        self._windows = {}  # user_id -> _Window
+        self._windows_lock = threading.Lock()
+        self._pending = set()
+        self._cond = threading.Condition()
+        self._queue = queue.Queue()
+        if start:
+            threading.Thread(target=self._work, name="zenith-insights", daemon=True).start()
+
+    def _today(self, now):
+        return datetime.datetime.fromtimestamp(now, config.CAMPUS_TZ).date().toordinal()
+
+    def compute(self, user_id, now=None):
+        """Computes the user's insight now, from the last WINDOW_DAYS of logs."""
+        now = self._clock() if now is None else now
+        offset = datetime.datetime.fromtimestamp(now, config.CAMPUS_TZ).utcoffset().total_seconds()
+        last_day = int(_local_day(now, offset))
+        first_day = last_day - WINDOW_DAYS + 1
+        start_ts = first_day * DAY_SECONDS - offset
+
+        with self._windows_lock:
+            window = self._windows.get(user_id)
+            if window is None or window.start_ts > start_ts:  # new user, or the clock moved back
+                window = self._windows[user_id] = _Window(start_ts)
+            window.update(self.checkins, self.focus_log, user_id, start_ts)
+            ts, mood, stress, tags = window.checkin_ts, window.mood, window.stress, window.tags
+            focus_ts, focus_min = window.focus_ts, window.focus_min
+        history = self.sleep_store.load(user_id)
+        recent = history.night >= first_day - 1
+        sleep_hours = durations_min(history.bed_min[recent], history.wake_min[recent]) / 60
+        series = daily_series(first_day, WINDOW_DAYS, ts, mood, stress,
+                              history.night[recent], sleep_hours, focus_ts, focus_min, offset)
+        return build_insight(series, stress, tags, self._today(now))
+
+    def refresh(self, user_id):
+        """Queues a recompute of the user's insight (e.g. after new logs)."""
+        with self._cond:
+            if user_id in self._pending:
+                return
+            self._pending.add(user_id)
+        self._queue.put(user_id)
+
+    def get(self, user_id):
+        """
+        Returns the cached insight, refreshing it in the background when the
+        day has rolled over. Returns None until a user's first insight is
+        ready; a later run picks it up.
+        """
+        insight = self._insights.get(user_id)
+        if insight is None or insight.day != self._today(self._clock()):
+            self.refresh(user_id)
+        return insight
+
+    def wait(self, user_id, timeout=None):
+        """Blocks until the user has an insight (or `timeout` passes) and returns it."""
+        with self._cond:
+            self._cond.wait_for(lambda: user_id in self._insights, timeout=timeout)
+            return self._insights.get(user_id)
+
+    def _work(self):
+        while True:
+            user_id = self._queue.get()
+            with self._cond:
+                self._pending.discard(user_id)
+            self.checkins.flush(timeout=FLUSH_WAIT_SEC)  # include check-ins still in the write queue
+            try:
+                insight = self.compute(user_id)
+            except Exception:
+                logger.exception("Could not compute the insight for %s", user_id)
+                continue  # keep serving the last insight; the next log retries
+            with self._cond:
+                self._insights[user_id] = insight
+                self._cond.notify_all()
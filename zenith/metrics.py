@@ -0,0 +1,393 @@
+import bisect
+import contextlib
+import os
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.exceptions import RerunException, ScriptControlException
+
+from zenith import config
+
+# --- Render Metrics ---
+# Per-page render latency, rerun counts and elements emitted, plus the time
+# spent inside each card (card_start .. card_end), the AI coach's time to
+# first token, how long spilled idle sessions take to restore
+# (zenith.session_spill), and the count and latency of each button action
+# (zenith.actions). The data lives in
+# process-wide histograms with fixed buckets, so recording is O(1) and the
+# memory used does not grow with traffic. It is exposed in the Prometheus
+# text format in two ways:
+# - A file rewritten every FLUSH_INTERVAL_SEC, which node_exporter's
+#   textfile collector can pick up.
+# - The /metrics route of zenith/asgi.py.
+# Several worker processes may share DATA_DIR (zenith.state_store). Each
+# writes its own snapshot, DATA_DIR/metrics/<pid>.prom, and both outputs
+# are the sum over every live worker's snapshot (merge_text). A snapshot
+# not refreshed for STALE_AFTER_SEC belongs to a worker that is gone and is
+# removed.
+# p95 per page is histogram_quantile(0.95, ...) on the Prometheus side, or
+# Histogram.quantile() here.
+#
+# Element counts wrap the script run context's private _enqueue; without it
+# only time is recorded. requirements.txt pins the Streamlit release these
+# internals were tested against.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ELEMENT_BUCKETS = (10, 25, 50, 100, 250, 500, 1000)
+RESTORE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+FLUSH_INTERVAL_SEC = 15
+STALE_AFTER_SEC = 4 * FLUSH_INTERVAL_SEC  # snapshots are touched every flush, even when unchanged
+_local = threading.local()  # the page being rendered on this script thread
+
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus semantics: upper bounds, +Inf implied)."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Estimates the q-quantile by interpolating within its bucket, like histogram_quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+    def lines(self, name, labels):
+        """Yields the histogram's exposition lines."""
+        cumulative = 0
+        prefix = f"{labels}," if labels else ""
+        for bound, n in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            yield f'{name}_bucket{{{prefix}le="{le}"}} {cumulative}'
+        labels = f"{{{labels}}}" if labels else ""
+        yield f"{name}_sum{labels} {self.sum!r}"
+        yield f"{name}_count{labels} {self.count}"
+
+
+class PageStats:
+    __slots__ = ("latency", "elements", "cards", "errors", "forced_reruns")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.elements = Histogram(ELEMENT_BUCKETS)
+        self.cards = Histogram(LATENCY_BUCKETS)
+        self.errors = 0
+        self.forced_reruns = 0
+
+
+class RenderMetrics:
+    """Process-wide render metrics, keyed by page."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pages = {}
+        self._first_token = {}  # coach backend -> Histogram of time to first token
+        self._actions = {}  # action name -> Histogram of handler time
+        self.restore = Histogram(RESTORE_BUCKETS)  # spilled session -> resident again
+        self.sessions = (0, 0)  # (resident, spilled), set by the spill sweeper
+        self.thumbnails = (0, 0, 0)  # (hits, misses, evictions), set by the thumbnail cache
+        self.version = 0  # bumped on every record, so flushes can skip idle periods
+
+    def _page(self, page):
+        stats = self._pages.get(page)
+        if stats is None:
+            stats = self._pages[page] = PageStats()
+        return stats
+
+    def record_page(self, page, seconds, elements=None, error=False, rerun=False):
+        with self._lock:
+            stats = self._page(page)
+            stats.latency.observe(seconds)
+            if elements is not None:
+                stats.elements.observe(elements)
+            stats.errors += error
+            stats.forced_reruns += rerun
+            self.version += 1
+
+    def record_card(self, page, seconds):
+        with self._lock:
+            self._page(page).cards.observe(seconds)
+            self.version += 1
+
+    def record_first_token(self, backend, seconds):
+        with self._lock:
+            hist = self._first_token.get(backend)
+            if hist is None:
+                hist = self._first_token[backend] = Histogram(LATENCY_BUCKETS)
+            hist.observe(seconds)
+            self.version += 1
+
+    def record_action(self, action, seconds):
+        with self._lock:
+            hist = self._actions.get(action)
+            if hist is None:
+                hist = self._actions[action] = Histogram(LATENCY_BUCKETS)
+            hist.observe(seconds)
+            self.version += 1
+
+    def record_restore(self, seconds):
+        with self._lock:
+            self.restore.observe(seconds)
+            self.version += 1
+
+    def set_sessions(self, resident, spilled):
+        with self._lock:
+            if self.sessions != (resident, spilled):
+                self.sessions = (resident, spilled)
+                self.version += 1
+
+    def set_thumbnails(self, hits, misses, evictions):
+        with self._lock:
+            if self.thumbnails != (hits, misses, evictions):
+                self.thumbnails = (hits, misses, evictions)
+                self.version += 1
+
+    def first_token(self, backend):
+        """Returns the time-to-first-token Histogram of a coach backend, or None."""
+        return self._first_token.get(backend)
+
+    def action_stats(self, action):
+        """Returns the handler-time Histogram of an action, or None if it hasn't run."""
+        return self._actions.get(action)
+
+    def page_stats(self, page):
+        """Returns the PageStats for a page, or None if it hasn't rendered."""
+        return self._pages.get(page)
+
+    def render_text(self):
+        """Returns all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            pages = sorted(self._pages.items())
+            backends = sorted(self._first_token.items())
+            actions = sorted(self._actions.items())
+            out = [
+                "# HELP zenith_page_render_seconds Time to render a page (one script run).",
+                "# TYPE zenith_page_render_seconds histogram",
+            ]
+            for page, stats in pages:
+                out.extend(stats.latency.lines("zenith_page_render_seconds", f'page="{page}"'))
+            out += [
+                "# HELP zenith_page_reruns_total Script runs that rendered a page.",
+                "# TYPE zenith_page_reruns_total counter",
+            ]
+            out.extend(f'zenith_page_reruns_total{{page="{page}"}} {stats.latency.count}' for page, stats in pages)
+            out += [
+                "# HELP zenith_page_errors_total Page renders that raised an exception.",
+                "# TYPE zenith_page_errors_total counter",
+            ]
+            out.extend(f'zenith_page_errors_total{{page="{page}"}} {stats.errors}' for page, stats in pages)
+            out += [
+                "# HELP zenith_page_forced_reruns_total Page renders cut short by st.rerun().",
+                "# TYPE zenith_page_forced_reruns_total counter",
+            ]
+            out.extend(f'zenith_page_forced_reruns_total{{page="{page}"}} {stats.forced_reruns}' for page, stats in pages)
+            out += [
+                "# HELP zenith_page_elements Elements and blocks emitted by one page render.",
+                "# TYPE zenith_page_elements histogram",
+            ]
+            for page, stats in pages:
+                out.extend(stats.elements.lines("zenith_page_elements", f'page="{page}"'))
+            out += [
+                "# HELP zenith_card_render_seconds Time spent rendering one card's contents.",
+                "# TYPE zenith_card_render_seconds histogram",
+            ]
+            for page, stats in pages:
+                out.extend(stats.cards.lines("zenith_card_render_seconds", f'page="{page}"'))
+            out += [
+                "# HELP zenith_coach_first_token_seconds Time from sending a chat message to the coach's first words.",
+                "# TYPE zenith_coach_first_token_seconds histogram",
+            ]
+            for backend, hist in backends:
+                out.extend(hist.lines("zenith_coach_first_token_seconds", f'backend="{backend}"'))
+            out += [
+                "# HELP zenith_action_seconds Time spent in a button action's handler (zenith.actions).",
+                "# TYPE zenith_action_seconds histogram",
+            ]
+            for action, hist in actions:
+                out.extend(hist.lines("zenith_action_seconds", f'action="{action}"'))
+            out += [
+                "# HELP zenith_session_restore_seconds Time to bring a spilled idle session back into memory.",
+                "# TYPE zenith_session_restore_seconds histogram",
+                *self.restore.lines("zenith_session_restore_seconds", ""),
+                "# HELP zenith_sessions Browser sessions in this process, by whether their state is in memory.",
+                "# TYPE zenith_sessions gauge",
+                f'zenith_sessions{{state="resident"}} {self.sessions[0]}',
+                f'zenith_sessions{{state="spilled"}} {self.sessions[1]}',
+                "# HELP zenith_thumbnail_lookups_total Thumbnail cache lookups, by whether the image was already rendered.",
+                "# TYPE zenith_thumbnail_lookups_total counter",
+                f'zenith_thumbnail_lookups_total{{result="hit"}} {self.thumbnails[0]}',
+                f'zenith_thumbnail_lookups_total{{result="miss"}} {self.thumbnails[1]}',
+                "# HELP zenith_thumbnail_evictions_total Thumbnails removed to keep the cache under its byte limit.",
+                "# TYPE zenith_thumbnail_evictions_total counter",
+                f"zenith_thumbnail_evictions_total {self.thumbnails[2]}",
+            ]
+        return "\n".join(out) + "\n"
+
+    def write(self, path):
+        """Atomically writes the exposition text to `path`."""
+        _write_text(path, self.render_text())
+
+    def start_flusher(self, directory, merged_path, interval=FLUSH_INTERVAL_SEC):
+        """
+        Every `interval` seconds, writes this process's snapshot into
+        `directory` (or touches it if nothing changed) and the merge of
+        every live snapshot to `merged_path`.
+        """
+        path = os.path.join(directory, f"{os.getpid()}.prom")
+
+        def run():
+            flushed = -1
+            while True:
+                time.sleep(interval)
+                if self.version != flushed or not os.path.exists(path):
+                    flushed = self.version
+                    self.write(path)
+                else:
+                    os.utime(path)
+                _write_text(merged_path, collect(directory))
+
+        threading.Thread(target=run, name="zenith-metrics-flush", daemon=True).start()
+
+
+def _write_text(path, text):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def merge_text(texts):
+    """
+    Merges exposition texts from several processes into one, summing the
+    samples of each series. Every metric here is a counter, a histogram or a
+    gauge that adds up across workers (sessions).
+    """
+    families = {}  # family -> (HELP/TYPE lines, {series: value})
+    for text in texts:
+        family = None
+        for line in text.splitlines():
+            if line.startswith("#"):
+                parts = line.split(" ", 3)
+                family = parts[2] if len(parts) > 2 else family
+                header, _ = families.setdefault(family, ([], {}))
+                if line not in header:
+                    header.append(line)
+            elif line:
+                series, _, value = line.rpartition(" ")
+                samples = families.setdefault(family, ([], {}))[1]
+                samples[series] = samples.get(series, 0) + float(value)
+    out = []
+    for header, samples in families.values():
+        out.extend(header)
+        out.extend(f"{series} {int(value) if value.is_integer() else repr(value)}" for series, value in samples.items())
+    return "\n".join(out) + "\n"
+
+
+def collect(directory, metrics=None, now=None):
+    """
+    Returns the merged exposition text of every live process's snapshot in
+    `directory`. With `metrics`, this process's live numbers are used
+    instead of its snapshot. Stale snapshots are removed.
+    """
+    now = time.time() if now is None else now
+    own = f"{os.getpid()}.prom"
+    texts = [metrics.render_text()] if metrics is not None else []
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(".prom") or (metrics is not None and entry.name == own):
+            continue
+        try:
+            if now - entry.stat().st_mtime > STALE_AFTER_SEC:
+                os.remove(entry.path)
+                continue
+            with open(entry.path) as f:
+                texts.append(f.read())
+        except FileNotFoundError:  # removed by another worker meanwhile
+            continue
+    return merge_text(texts)
+
+
+@st.cache_resource
+def get_render_metrics():
+    """
+    Returns the process-wide render metrics, flushed to
+    DATA_DIR/metrics/<pid>.prom and, merged over workers, DATA_DIR/metrics.prom.
+    """
+    metrics = RenderMetrics()
+    metrics.start_flusher(config.data_dir("metrics"), config.data_path("metrics.prom"))
+    return metrics
+
+
+@contextlib.contextmanager
+def track_page(page, metrics=None):
+    """
+    Times a page render and counts the elements it emits. Elements are
+    counted by wrapping the script run's message queue for the duration
+    of the render; without a script run context only time is recorded.
+    """
+    metrics = metrics or get_render_metrics()
+    ctx = get_script_run_ctx()
+    enqueue = getattr(ctx, "_enqueue", None)
+    emitted = [0]
+    if enqueue is not None:
+        def counting_enqueue(msg):
+            if msg.WhichOneof("type") == "delta":
+                emitted[0] += 1
+            enqueue(msg)
+
+        ctx._enqueue = counting_enqueue
+    _local.page, _local.metrics, _local.cards = page, metrics, []
+    error = rerun = False
+    start = time.perf_counter()
+    try:
+        yield
+    except RerunException:
+        # Not a render error, but the interaction cost an extra run.
+        rerun = True
+        raise
+    except ScriptControlException:
+        # st.rerun() / st.stop() end a run by raising (a BaseException);
+        # they are not render errors.
+        raise
+    except Exception:
+        error = True
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        _local.page = _local.metrics = None
+        if enqueue is not None:
+            ctx._enqueue = enqueue
+        metrics.record_page(page, elapsed, emitted[0] if enqueue is not None else None, error, rerun)
+
+
+def card_started():
+    """Marks the start of a card on the page being tracked (no-op otherwise)."""
+    if getattr(_local, "page", None) is not None:
+        _local.cards.append(time.perf_counter())
+
+
+def card_finished():
+    """Records the time since the matching card_started()."""
+    if getattr(_local, "page", None) is not None and _local.cards:
+        _local.metrics.record_card(_local.page, time.perf_counter() - _local.cards.pop())
@@ -0,0 +1,141 @@
+import datetime
+import sys
+
+from zenith.config import CAMPUS_TZ
+from zenith.event_times import DEFAULT_DURATION_MIN, parse_event_time
+
+# --- Compact Models ---
+# Events, resources and the Pomodoro timer as __slots__ classes instead of
+# dicts / SimpleNamespace: no per-object __dict__, so each object is a fixed
+# array of references. Strings that repeat across a catalog (categories,
+# locations, costs, read times) are interned, so all events in the same
+# building share one string object. Event times are stored as epoch seconds
+# (floats), which is what persisted state holds. The campus-time `start`/`end`
+# datetimes the pages format are built once, in __init__, and kept in
+# two more slots; a render only reads them.
+#
+# Events and resources are immutable, since one catalog is shared by every
+# session. Page code still reads them like the old dicts (event['title'],
+# event.get('lat'), 'lat' in event) through Record.
+
+
+class Record:
+    """
+    Read access by key for slotted models. A None field counts as absent.
+    FIELDS are the constructor arguments; other slots are derived from them.
+    """
+
+    __slots__ = ()
+    FIELDS = ()
+
+    def __getitem__(self, key):
+        value = getattr(self, key, None) if isinstance(key, str) else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __contains__(self, key):
+        return getattr(self, key, None) is not None
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, name) for name in self.FIELDS))
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id!r}, title={self.title!r})"
+
+    def as_dict(self):
+        """Returns the set fields as a plain dict."""
+        return {name: getattr(self, name) for name in self.FIELDS if getattr(self, name) is not None}
+
+
+def _intern(text):
+    return sys.intern(text) if text else ""
+
+
+class Event(Record):
+    """One catalog event. Times are epoch seconds."""
+
+    FIELDS = ("id", "cat", "title", "loc", "cost", "desc", "details", "lat", "lon", "start_ts", "end_ts")
+    __slots__ = FIELDS + ("start", "end")  # campus-time datetimes of start_ts / end_ts
+
+    def __init__(self, id, cat, title, loc, cost, desc, details, lat, lon, start_ts, end_ts):
+        init = object.__setattr__
+        init(self, "id", _intern(id))
+        init(self, "cat", _intern(cat))
+        init(self, "title", title)
+        init(self, "loc", _intern(loc))
+        init(self, "cost", _intern(cost))
+        init(self, "desc", desc)
+        init(self, "details", details)
+        init(self, "lat", lat)
+        init(self, "lon", lon)
+        init(self, "start_ts", float(start_ts))
+        init(self, "end_ts", float(end_ts))
+        init(self, "start", datetime.datetime.fromtimestamp(self.start_ts, CAMPUS_TZ))
+        init(self, "end", datetime.datetime.fromtimestamp(self.end_ts, CAMPUS_TZ))
+
+    @classmethod
+    def from_dict(cls, event, now):
+        """
+        Builds an Event from a catalog dict. Its "time" display string (or a
+        "start" datetime) is resolved against `now`.
+        """
+        start = event.get("start") or parse_event_time(event["time"], now)
+        end = event.get("end") or start + datetime.timedelta(minutes=event.get("duration_min", DEFAULT_DURATION_MIN))
+        return cls(
+            event["id"], event.get("cat", ""), event.get("title", ""), event.get("loc", ""),
+            event.get("cost", ""), event.get("desc", ""), event.get("details", ""),
+            event.get("lat"), event.get("lon"), start.timestamp(), end.timestamp(),
+        )
+
+
+class Resource(Record):
+    """One article in the Resources library."""
+
+    FIELDS = __slots__ = ("id", "cat", "title", "read_time", "body", "img")
+
+    def __init__(self, id, cat, title, read_time, body, img):
+        init = object.__setattr__
+        init(self, "id", _intern(id))
+        init(self, "cat", _intern(cat))
+        init(self, "title", title)
+        init(self, "read_time", _intern(read_time))
+        init(self, "body", body)
+        init(self, "img", img)
+
+    @classmethod
+    def from_dict(cls, resource):
+        return cls(
+            resource["id"], resource.get("cat", ""), resource.get("title", ""),
+            resource.get("read_time", ""), resource.get("body", ""), resource.get("img", ""),
+        )
+
+
+class TimerState:
+    """A session's Pomodoro timer. Mutable: the timer scheduler sets `finished`."""
+
+    __slots__ = ("running", "start_time", "task_name", "duration_min", "is_break", "break_duration_min", "finished")
+
+    def __init__(self, running=False, start_time=0.0, task_name="", duration_min=25,
+                 is_break=False, break_duration_min=5, finished=False):
+        self.running = running
+        self.start_time = start_time
+        self.task_name = task_name
+        self.duration_min = duration_min
+        self.is_break = is_break
+        self.break_duration_min = break_duration_min
+        self.finished = finished  # set by the timer scheduler when the phase ends
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"TimerState({fields})"
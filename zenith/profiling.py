@@ -0,0 +1,59 @@
+import contextlib
+import cProfile
+import datetime
+import os
+import random
+import re
+
+from zenith import config
+
+# --- Rerun Profiling ---
+# When switched on, a sampled fraction of reruns is run under cProfile. The
+# profiler is deterministic, so it sees every call of that one real rerun.
+# Each profiled rerun writes DATA_DIR/profiles/<page>/<time>-<session>.prof.
+# Open it with `python -m pstats` or snakeviz. Only the newest PROFILE_KEEP
+# files per page are kept. When off, profile_rerun() returns a shared null
+# context, so the cost is one function call per rerun.
+
+_NULL = contextlib.nullcontext()
+
+
+def _slug(page):
+    return re.sub(r"[^a-z0-9]+", "-", page.lower()).strip("-")
+
+
+def profile_rerun(page, session_id, enabled=None, rate=None):
+    """Returns a context manager that profiles this rerun if it is sampled."""
+    enabled = config.PROFILE_ENABLED if enabled is None else enabled
+    rate = config.PROFILE_SAMPLE_RATE if rate is None else rate
+    if not enabled or random.random() >= rate:
+        return _NULL
+    return _profiled(page, session_id)
+
+
+@contextlib.contextmanager
+def _profiled(page, session_id):
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # another profiler is active on this interpreter (3.12+)
+        yield
+        return
+    try:
+        yield
+    finally:
+        profiler.disable()
+        out_dir = config.data_dir("profiles", _slug(page))
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S.%f")
+        profiler.dump_stats(os.path.join(out_dir, f"{stamp}-{session_id[:8]}.prof"))
+        _prune(out_dir, config.PROFILE_KEEP)
+
+
+def _prune(out_dir, keep):
+    """Deletes all but the newest `keep` profiles in a page's directory."""
+    files = sorted(f for f in os.listdir(out_dir) if f.endswith(".prof"))
+    for name in files[:-keep] if keep > 0 else files:
+        try:
+            os.remove(os.path.join(out_dir, name))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,91 @@
+import collections
+import threading
+
+from zenith.search import BM25Index
+
+# --- Resource Library ---
+# The article catalog plus a BM25 full-text index over each article's title,
+# category and body. It is built once and shared by every session, and it is
+# updated in place when articles are added or removed. The category list for
+# the filter box is kept as counts, so it is never rebuilt from the whole
+# catalog on a rerun.
+
+FIELD_WEIGHTS = {"title": 3.0, "cat": 2.0, "body": 1.0}
+
+
+class ResourceLibrary:
+    """Article catalog with a category index and a full-text search index."""
+
+    def __init__(self, resources=()):
+        self._by_id = {}
+        self._by_category = collections.defaultdict(dict)
+        self._categories = None  # sorted category names, rebuilt after a category appears or empties
+        self._lock = threading.Lock()
+        self.index = BM25Index(FIELD_WEIGHTS)
+        for resource in resources:
+            self.add(resource)
+
+    def add(self, resource):
+        """Adds (or replaces) an article and indexes its text."""
+        with self._lock:
+            self._remove(resource["id"])
+            self._by_id[resource["id"]] = resource
+            bucket = self._by_category[resource.get("cat", "")]
+            if not bucket:
+                self._categories = None
+            bucket[resource["id"]] = resource
+        self.index.add(
+            resource["id"],
+            {field: resource.get(field, "") for field in FIELD_WEIGHTS},
+            tag=resource.get("cat", ""),
+        )
+
+    def remove(self, resource_id):
+        """Removes an article from the catalog and the index. Returns it or None."""
+        with self._lock:
+            resource = self._remove(resource_id)
+        self.index.remove(resource_id)
+        return resource
+
+    def _remove(self, resource_id):
+        resource = self._by_id.pop(resource_id, None)
+        if resource is not None:
+            category = resource.get("cat", "")
+            bucket = self._by_category[category]
+            del bucket[resource_id]
+            if not bucket:
+                del self._by_category[category]
+                self._categories = None
+        return resource
+
+    def get(self, resource_id):
+        """Returns the article with this id, or None."""
+        return self._by_id.get(resource_id)
+
+    def __iter__(self):
+        return iter(self.in_category())
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, resource_id):
+        return resource_id in self._by_id
+
+    def categories(self):
+        """Returns the categories present in the catalog, sorted."""
+        categories = self._categories
+        if categories is None:
+            with self._lock:
+                categories = self._categories = sorted(self._by_category)
+        return categories
+
+    def in_category(self, category=None):
+        """Returns the articles in a category (None = all), in catalog order."""
+        with self._lock:
+            source = self._by_id if category is None else self._by_category.get(category, {})
+            return list(source.values())
+
+    def search(self, query, category=None, k=20):
+        """Returns the top-k articles matching `query`, best first, optionally within one category."""
+        hits = self.index.search(query, k=k, tag=category)
+        return [self._by_id[resource_id] for resource_id, _ in hits if resource_id in self._by_id]
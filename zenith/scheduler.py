@@ -0,0 +1,177 @@
+import itertools
+import logging
+import threading
+import time
+
+# --- Timer Scheduler ---
+# One in-process scheduler holds the deadlines of every session's timers
+# (Pomodoro phases, wind-down timers). Deadlines live in an indexed binary
+# heap: `key -> heap position` lets us cancel or reschedule a timer in
+# O(log n) without scanning, and a single worker thread sleeps until the
+# earliest deadline instead of every session polling time.time().
+
+logger = logging.getLogger(__name__)
+
+
+class TimerScheduler:
+    """Fires callbacks at wall-clock deadlines. Thread-safe."""
+
+    def __init__(self, clock=time.time, start=True):
+        self._clock = clock
+        self._heap = []  # entries: [deadline, seq, key, callback]
+        self._index = {}  # key -> position of its entry in self._heap
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = None
+        if start:
+            self.start()
+
+    # --- Heap internals (caller holds self._cond) ---
+    def _swap(self, i, j):
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._index[heap[i][2]] = i
+        self._index[heap[j][2]] = j
+
+    def _sift_up(self, i):
+        heap = self._heap
+        while i > 0:
+            parent = (i - 1) // 2
+            if heap[i] < heap[parent]:
+                self._swap(i, parent)
+                i = parent
+            else:
+                break
+
+    def _sift_down(self, i):
+        heap = self._heap
+        n = len(heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and heap[child] < heap[smallest]:
+                    smallest = child
+            if smallest == i:
+                break
+            self._swap(i, smallest)
+            i = smallest
+
+    def _remove_at(self, i):
+        heap = self._heap
+        last = len(heap) - 1
+        if i != last:
+            self._swap(i, last)
+        entry = heap.pop()
+        del self._index[entry[2]]
+        if i < len(heap):
+            self._sift_down(i)
+            self._sift_up(i)
+        return entry
+
+    # --- Public API ---
+    def schedule(self, key, deadline, callback):
+        """
+        Schedules `callback(key)` to run at `deadline` (seconds since epoch).
+        Re-scheduling an existing key replaces its deadline and callback.
+        """
+        with self._cond:
+            if key in self._index:
+                self._remove_at(self._index[key])
+            entry = [deadline, next(self._seq), key, callback]
+            self._heap.append(entry)
+            self._index[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            if self._heap[0] is entry:
+                self._cond.notify()  # new earliest deadline: wake the worker
+
+    def cancel(self, key):
+        """Cancels a pending timer. Returns True if one was pending."""
+        with self._cond:
+            i = self._index.get(key)
+            if i is None:
+                return False
+            self._remove_at(i)
+            return True
+
+    def deadline(self, key):
+        """Returns the pending deadline for `key`, or None."""
+        with self._cond:
+            i = self._index.get(key)
+            return None if i is None else self._heap[i][0]
+
+    def __len__(self):
+        with self._cond:
+            return len(self._heap)
+
+    def __contains__(self, key):
+        with self._cond:
+            return key in self._index
+
+    def pop_due(self, now=None):
+        """Removes and returns `(key, callback)` for every timer due by `now`."""
+        now = self._clock() if now is None else now
+        due = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now:
+                entry = self._remove_at(0)
+                due.append((entry[2], entry[3]))
+        return due
+
+    def run_pending(self, now=None):
+        """Fires every timer due by `now`. Returns how many fired."""
+        due = self.pop_due(now)
+        for key, callback in due:
+            try:
+                callback(key)
+            except Exception:
+                # One bad callback must not take down every session's timers.
+                logger.exception("Timer callback for %r failed", key)
+        return len(due)
+
+    # --- Worker thread ---
+    def start(self):
+        """Starts the background worker (idempotent)."""
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="zenith-timer-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stops the background worker; pending timers are kept."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - self._clock()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._stopped:
+                    return
+            self.run_pending()
+
+
+def check_heap(scheduler):
+    """Asserts the heap and index invariants. Used by the stress benchmark."""
+    heap = scheduler._heap
+    for i, entry in enumerate(heap):
+        assert scheduler._index[entry[2]] == i
+        for child in (2 * i + 1, 2 * i + 2):
+            if child < len(heap):
+                assert not heap[child] < entry
+    assert len(scheduler._index) == len(heap)
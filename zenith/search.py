@@ -0,0 +1,191 @@
+import array
+import collections
+import math
+import re
+import threading
+
+import numpy as np
+
+# --- Full-Text Search ---
+# An inverted index with BM25 ranking. Documents are added and removed
+# incrementally. Each term's postings are NumPy arrays that add and remove
+# update in place (append, or move the last posting into the hole), so a
+# query never rebuilds them. Scoring a query is a few array operations per
+# term, accumulated over the matching documents only, instead of a Python
+# loop over every matching document. The index is shared across sessions, so
+# updates and queries take a lock.
+
+DENSE_FRACTION = 16  # accumulate over every slot once candidates pass 1/16 of them
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from how if in into is it of on or so "
+    "that the their this to vs was what when why with you your".split()
+)
+
+
+def tokenize(text):
+    """Lowercases and splits text into index terms, dropping stopwords."""
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class _Postings:
+    """One term's postings: parallel slot and tf arrays, plus slot -> position."""
+
+    __slots__ = ("slots", "tfs", "pos")
+
+    def __init__(self):
+        self.slots = array.array("q")
+        self.tfs = array.array("d")
+        self.pos = {}
+
+    def __len__(self):
+        return len(self.slots)
+
+    def add(self, slot, tf):
+        self.pos[slot] = len(self.slots)
+        self.slots.append(slot)
+        self.tfs.append(tf)
+
+    def remove(self, slot):
+        i = self.pos.pop(slot)
+        moved, tf = self.slots.pop(), self.tfs.pop()
+        if i != len(self.slots):
+            self.slots[i] = moved
+            self.tfs[i] = tf
+            self.pos[moved] = i
+
+    def arrays(self):
+        """Zero-copy NumPy views; drop them before the postings change again."""
+        return np.frombuffer(self.slots, dtype=np.int64), np.frombuffer(self.tfs)
+
+
+class BM25Index:
+    """Incremental inverted index with BM25 scoring over weighted fields."""
+
+    def __init__(self, field_weights=None, k1=1.2, b=0.75):
+        self.field_weights = field_weights or {"text": 1.0}
+        self.k1 = k1
+        self.b = b
+        self._slot_of = {}  # doc id -> slot
+        self._doc_at = []  # slot -> doc id (None when free)
+        self._free = []
+        self._doc_len = np.zeros(16)
+        self._tag = np.full(16, -1, dtype=np.int32)
+        self._tag_codes = {}
+        self._total_len = 0.0
+        self._terms = {}  # doc id -> Counter of weighted term frequencies
+        self._postings = collections.defaultdict(_Postings)  # term -> _Postings
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._slot_of
+
+    def _grow(self):
+        size = len(self._doc_len) * 2
+        self._doc_len = np.resize(self._doc_len, size)
+        self._doc_len[len(self._doc_at):] = 0
+        tags = np.full(size, -1, dtype=np.int32)
+        tags[:len(self._tag)] = self._tag
+        self._tag = tags
+
+    def add(self, doc_id, fields, tag=None):
+        """Indexes a document; `fields` maps field name -> text. Replaces any previous version."""
+        with self._lock:
+            self._remove(doc_id)
+            self._add(doc_id, fields, tag)
+
+    def remove(self, doc_id):
+        """Removes a document. Returns True if it was indexed."""
+        with self._lock:
+            return self._remove(doc_id)
+
+    def _add(self, doc_id, fields, tag):
+        terms = collections.Counter()
+        for field, text in fields.items():
+            weight = self.field_weights.get(field, 1.0)
+            for term in tokenize(text):
+                terms[term] += weight
+
+        if self._free:
+            slot = self._free.pop()
+            self._doc_at[slot] = doc_id
+        else:
+            slot = len(self._doc_at)
+            self._doc_at.append(doc_id)
+            if slot >= len(self._doc_len):
+                self._grow()
+        self._slot_of[doc_id] = slot
+        self._terms[doc_id] = terms
+        length = sum(terms.values())
+        self._doc_len[slot] = length
+        self._total_len += length
+        self._tag[slot] = -1 if tag is None else self._tag_codes.setdefault(tag, len(self._tag_codes))
+        for term, tf in terms.items():
+            self._postings[term].add(slot, tf)
+
+    def _remove(self, doc_id):
+        slot = self._slot_of.pop(doc_id, None)
+        if slot is None:
+            return False
+        for term in self._terms.pop(doc_id):
+            postings = self._postings[term]
+            postings.remove(slot)
+            if not postings:
+                del self._postings[term]
+        self._total_len -= self._doc_len[slot]
+        self._doc_len[slot] = 0
+        self._tag[slot] = -1
+        self._doc_at[slot] = None
+        self._free.append(slot)
+        return True
+
+    def search(self, query, k=10, tag=None):
+        """Returns [(doc id, score)] for the top-k matches, best first."""
+        terms = set(tokenize(query))
+        if not terms or k <= 0:
+            return []
+        with self._lock:
+            return self._search(terms, k, tag)
+
+    def _search(self, terms, k, tag):
+        n = len(self._slot_of)
+        if not n or (tag is not None and tag not in self._tag_codes):
+            return []
+        avgdl = self._total_len / n
+        code = None if tag is None else self._tag_codes[tag]
+        matched, parts = [], []
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            slots, tfs = postings.arrays()
+            idf = math.log(1 + (n - len(slots) + 0.5) / (len(slots) + 0.5))
+            if code is not None:
+                keep = self._tag[slots] == code
+                slots, tfs = slots[keep], tfs[keep]
+            norm = self.k1 * (1 - self.b + self.b * self._doc_len[slots] / avgdl)
+            matched.append(slots)
+            parts.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+        if not matched:
+            return []
+        if len(matched) == 1:  # a term's slots are distinct
+            hits, scores = matched[0], parts[0]
+        else:
+            slots, contributions = np.concatenate(matched), np.concatenate(parts)
+            if len(slots) * DENSE_FRACTION < len(self._doc_at):
+                hits, where = np.unique(slots, return_inverse=True)
+                scores = np.zeros(len(hits))
+                np.add.at(scores, where, contributions)
+            else:  # common terms: summing over all slots beats sorting the candidates
+                scores = np.bincount(slots, contributions, minlength=len(self._doc_at))
+                hits = np.flatnonzero(scores)
+                scores = scores[hits]
+        if len(hits) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            hits, scores = hits[top], scores[top]
+        order = np.lexsort((hits, -scores))  # best first, ties by slot
+        return [(self._doc_at[slot], float(scores[i])) for i, slot in zip(order, hits[order])]
@@ -0,0 +1,255 @@
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+import weakref
+import zlib
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from zenith import config, metrics, state_store, timers
+
+# --- Idle Session Spill ---
+# A tab left open overnight keeps its Streamlit session, and with it all of
+# its session state. SessionSpiller tracks when each session of this process
+# last ran. A sweeper thread spills sessions idle for IDLE_TIMEOUT_SEC:
+# their app keys (SPILLED) are written to one small zlib-compressed file and
+# deleted from st.session_state, along with state_store's copy of the
+# persisted bytes (state_saved), which is reloaded from the state backend on
+# restore. Widget values and the tiny keys the timer scheduler writes to
+# (session_id, timer_events) stay.
+#
+# The sweeper never touches a session that is running: it skips sessions
+# whose last script thread is still alive, and decides under the session's
+# lock, which a run takes before it reads state (ensure_resident()). It
+# keeps the last run's st.session_state (ctx.session_state) and lets go of
+# it once the session is spilled.
+#
+# Restoring is lazy. ensure_resident() runs at the top of every script run,
+# of the countdown and wind-down fragments, and of every button action
+# (zenith.actions), since callbacks run before the script. If the session
+# was spilled, it reads the file back and fills in the missing keys, then
+# re-arms a Pomodoro phase or wind-down timer that was running. A
+# per-session lock keeps a sweep from racing a restore. If the file is
+# gone, the durable keys come back from the state backend
+# (zenith.state_store) instead.
+#
+# Each process spills into its own directory, DATA_DIR/spill/<pid>.
+# Directories left by processes that are gone are removed on startup.
+#
+# A visible countdown ticks the fragment every second and so keeps its
+# session resident. A timer running while the user sits on another page
+# does not; its phase is re-armed, or marked finished, on restore.
+
+# App-owned keys only: widget-backed keys (like "page") belong to Streamlit's
+# widget state and stay put.
+SPILLED = ("user_location", "user_goals", "timer_state", "my_schedule", "read_resources", "events_page",
+           "coach_pages", "breathing_active", "wind_down_active", "wind_down_until", "show_modal",
+           "selected_event_details")
+SWEEP_INTERVAL_SEC = 60
+ENTRY_KEY = "spill_entry"
+DROPPED = ("state_saved",)  # rebuilt by state_store.restore(), so not written out
+
+logger = logging.getLogger(__name__)
+
+
+class _Session:
+    """
+    A session's spill bookkeeping. It is stored in the session's own state
+    (ENTRY_KEY) and the spiller holds only a weak reference to it, so the
+    entry goes away with the session.
+    """
+
+    __slots__ = ("key", "state", "thread", "lock", "last_active", "spilled", "__weakref__")
+
+    def __init__(self, state, now):
+        self.key = uuid.uuid4().hex  # names the spill file
+        self.state = state  # the last run's session state; None while spilled
+        self.thread = None  # the script thread that last touched the session
+        self.lock = threading.Lock()
+        self.last_active = now
+        self.spilled = False
+
+
+class SessionSpiller:
+    """Tracks this process's sessions; spills idle ones to disk and restores them on use."""
+
+    def __init__(self, directory, idle_timeout, interval=SWEEP_INTERVAL_SEC, scheduler=None,
+                 metrics=None, clock=time.time, start=True):
+        self.directory = directory
+        self.idle_timeout = idle_timeout
+        self.interval = interval
+        self._scheduler = scheduler
+        self._metrics = metrics
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions = {}  # _Session.key -> weakref to the _Session
+        for entry in os.scandir(directory):  # left by a previous process; its sessions are gone
+            os.remove(entry.path)
+        if start:
+            threading.Thread(target=self._run, name="zenith-session-spill", daemon=True).start()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.z")
+
+    def touch(self, state):
+        """
+        Marks a session active from its script thread. If it was spilled,
+        restores its keys into `state` first and returns how long that took
+        (seconds), else None.
+        """
+        entry = state[ENTRY_KEY] if ENTRY_KEY in state else None
+        if entry is None:
+            entry = state[ENTRY_KEY] = _Session(state, self._clock())
+            with self._lock:
+                self._sessions[entry.key] = weakref.ref(entry)
+        with entry.lock:
+            entry.state = state
+            entry.thread = threading.current_thread()
+            entry.last_active = self._clock()
+            if not entry.spilled:
+                return None
+            start = time.perf_counter()
+            self._restore(entry.key, state)
+            entry.spilled = False
+            elapsed = time.perf_counter() - start
+        if self._metrics is not None:
+            self._metrics.record_restore(elapsed)
+        return elapsed
+
+    def _restore(self, session_key, state):
+        path = self._path(session_key)
+        try:
+            with open(path, "rb") as f:
+                saved = state_store.decode(zlib.decompress(f.read()))
+        except (OSError, ValueError, zlib.error):
+            return  # no usable spill file: state_store.restore() reloads the durable keys
+        for name, value in saved.items():
+            if name not in state:  # a widget may have set it already this run
+                state[name] = value
+        os.remove(path)
+
+    def spill(self, session_key, now=None):
+        """
+        Spills a session if it has been idle for idle_timeout and is not
+        running. Returns the spill file's size in bytes, or None if it was
+        not spilled.
+        """
+        now = self._clock() if now is None else now
+        ref = self._sessions.get(session_key)
+        entry = ref and ref()
+        if entry is None:
+            return None
+        with entry.lock:
+            state = entry.state
+            if (entry.spilled or state is None or now - entry.last_active < self.idle_timeout
+                    or (entry.thread is not None and entry.thread.is_alive())):
+                return None
+            saved = {name: state[name] for name in SPILLED if name in state}
+            blob = zlib.compress(state_store.encode(saved))
+            tmp = f"{self._path(session_key)}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, self._path(session_key))
+            for name in (*saved, *DROPPED):
+                if name in state:
+                    del state[name]
+            if self._scheduler is not None and "session_id" in state:
+                # Both are re-armed (or marked finished) on restore.
+                timers.cancel_focus_phase(state["session_id"], self._scheduler)
+                timers.cancel_wind_down(state["session_id"], self._scheduler)
+            entry.spilled = True
+            entry.state = entry.thread = None  # the next run hands in its own
+        return len(blob)
+
+    def sweep(self, now=None):
+        """Spills every idle session and forgets closed ones. Returns how many were spilled."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            sessions = list(self._sessions.items())
+        spilled = 0
+        for session_key, ref in sessions:
+            if ref() is None:  # the session was closed
+                with self._lock:
+                    del self._sessions[session_key]
+                try:
+                    os.remove(self._path(session_key))
+                except FileNotFoundError:
+                    pass
+            elif self.spill(session_key, now) is not None:
+                spilled += 1
+        if self._metrics is not None:
+            self._metrics.set_sessions(*self.counts())
+        return spilled
+
+    def counts(self):
+        """Returns (resident, spilled) session counts."""
+        with self._lock:
+            entries = [ref() for ref in self._sessions.values()]
+        spilled = sum(entry.spilled for entry in entries if entry is not None)
+        return len(entries) - spilled, spilled
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.sweep()
+            except Exception:
+                # A failed sweep only leaves sessions resident; try again next interval.
+                logger.exception("Idle-session sweep failed")
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)  # signal 0: existence check only
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # someone else's process
+    return True
+
+
+def prune_stale_dirs(root):
+    """
+    Removes the spill directories under `root` of processes that are gone.
+    Returns how many. POSIX only: os.kill(pid, 0) is not a probe elsewhere.
+    """
+    if os.name != "posix":
+        return 0
+    removed = 0
+    for entry in os.scandir(root):
+        if entry.is_dir() and entry.name.isdigit() and int(entry.name) != os.getpid() \
+                and not _pid_alive(int(entry.name)):
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+@st.cache_resource
+def get_spiller():
+    """Returns the idle-session spiller for this process."""
+    prune_stale_dirs(config.data_dir("spill"))
+    return SessionSpiller(
+        config.data_dir("spill", str(os.getpid())), config.IDLE_TIMEOUT_SEC,
+        scheduler=timers.get_scheduler(), metrics=metrics.get_render_metrics(),
+    )
+
+
+def ensure_resident():
+    """
+    Marks this session active and brings its state back into memory if it
+    was spilled, then loads saved state if this process hasn't yet
+    (zenith.state_store). Call before reading session state in a run,
+    fragment or callback.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    if get_spiller().touch(ctx.session_state) is not None:
+        if "timer_state" in st.session_state:
+            timers.resume_focus_phase(st.session_state.timer_state)
+        timers.resume_wind_down(st.session_state.get("wind_down_until"))
+    state_store.restore()
@@ -0,0 +1,107 @@
+import collections
+import threading
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+# --- Sleep Trends Chart ---
+# The trend chart's Vega-Lite spec is built once per (user, data version) and
+# reused on every rerun until the user logs a new night. The data version is
+# the number of stored nights, which only changes on a new log. Long
+# histories are downsampled with LTTB (Largest-Triangle-Three-Buckets) so the
+# payload sent to the browser stays bounded no matter how many years of
+# nights a user has.
+
+MAX_POINTS = 180
+TARGET_HOURS = 8.0
+
+
+def lttb(x, y, threshold):
+    """
+    Returns the indices of `threshold` points that preserve the visual shape
+    of the (sorted) series x, y. Always keeps the first and last points.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # threshold - 2 buckets over the interior points 1 .. n-2
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def build_spec(history, max_points=MAX_POINTS):
+    """Builds the Vega-Lite spec for a sleep_store.SleepHistory."""
+    order = np.argsort(history.night, kind="stable")
+    nights = np.asarray(history.night)[order]
+    hours = history.hours()[order]
+    keep = lttb(nights, hours, max_points)
+    df = pd.DataFrame({"Night": nights[keep].astype("datetime64[D]"), "Hours": hours[keep].round(2)})
+
+    # Target is a constant: add it and reshape client-side instead of
+    # shipping a melted copy of the data.
+    base = alt.Chart(df).transform_calculate(
+        Target=str(TARGET_HOURS)
+    ).transform_fold(
+        ["Hours", "Target"], as_=["Metric", "Sleep Duration"]
+    ).encode(
+        x=alt.X('Night:T', title=None),
+        y=alt.Y('Sleep Duration:Q', title='Hours of Sleep', scale=alt.Scale(zero=False)),
+        color=alt.Color('Metric:N',
+                        scale=alt.Scale(domain=['Hours', 'Target'],
+                                        range=['#6A11CB', '#D1C4E9']),
+                        legend=alt.Legend(title="Legend"))
+    ).properties(
+        title="Sleep Duration vs. Target"
+    )
+
+    hours_line = base.transform_filter(alt.datum.Metric == 'Hours').mark_line(point=len(keep) <= 60)
+    target_line = base.transform_filter(alt.datum.Metric == 'Target').mark_line(strokeDash=[5, 5])
+    return (hours_line + target_line).interactive().to_dict()
+
+
+class SleepChartCache:
+    """LRU of chart specs keyed by user, invalidated by the store's data version."""
+
+    def __init__(self, store, max_entries=1024):
+        self.store = store
+        self.max_entries = max_entries
+        self._specs = collections.OrderedDict()  # user_id -> (version, spec)
+        self._lock = threading.Lock()
+
+    def spec(self, user_id):
+        """Returns the user's chart spec, or None if they have no logs."""
+        version = self.store.count(user_id)
+        if not version:
+            return None
+        with self._lock:
+            cached = self._specs.get(user_id)
+            if cached is not None and cached[0] == version:
+                self._specs.move_to_end(user_id)
+                # Shallow copy: st.vega_lite_chart pops "datasets" off the spec.
+                return dict(cached[1])
+        spec = build_spec(self.store.load(user_id))
+        with self._lock:
+            self._specs[user_id] = (version, spec)
+            self._specs.move_to_end(user_id)
+            while len(self._specs) > self.max_entries:
+                self._specs.popitem(last=False)
+        return dict(spec)
@@ -0,0 +1,189 @@
+import math
+import threading
+
+import numpy as np
+
+from zenith.sleep_store import to_minutes, to_night
+
+# --- Sleep Analytics ---
+# Sleep Score, Duration, Consistency and average bedtime for the Sleep page.
+#
+# Bedtimes are clock times, so they are averaged on a circle: 11:30 PM and
+# 12:30 AM average to midnight, not noon. Each night becomes an angle on a
+# 24h clock and we keep the sums of sin/cos; the mean direction gives the
+# average bedtime and the resultant length R gives the spread
+# (circular std = sqrt(-2 ln R)). Durations wrap past midnight the same way:
+# (wake - bed) mod 24h.
+#
+# Everything is additive sums, so `NightStats.add` is O(1) and bulk loads
+# are a handful of vectorized bincounts over the stored columns.
+
+DAY_MIN = 24 * 60
+TARGET_MIN = 8 * 60
+_RAD_PER_MIN = 2 * math.pi / DAY_MIN
+
+
+def durations_min(bed_min, wake_min):
+    """Vectorized sleep duration in minutes, wrapping past midnight."""
+    return (np.asarray(wake_min, dtype=np.int32) - np.asarray(bed_min, dtype=np.int32)) % DAY_MIN
+
+
+def week_of(night):
+    """Monday-based week number for a night (days since 1970-01-01, a Thursday)."""
+    return (np.asarray(night) + 3) // 7
+
+
+def circular_mean_min(minutes):
+    """Circular mean of clock times given in minutes after midnight."""
+    angles = np.asarray(minutes, dtype=np.float64) * _RAD_PER_MIN
+    return (math.atan2(np.sin(angles).sum(), np.cos(angles).sum()) / _RAD_PER_MIN) % DAY_MIN
+
+
+class NightStats:
+    """Additive aggregates over a set of nights."""
+
+    __slots__ = ("n", "dur_sum", "sin_sum", "cos_sum", "quality_sum")
+
+    def __init__(self, n=0, dur_sum=0.0, sin_sum=0.0, cos_sum=0.0, quality_sum=0.0):
+        self.n = n
+        self.dur_sum = dur_sum
+        self.sin_sum = sin_sum
+        self.cos_sum = cos_sum
+        self.quality_sum = quality_sum
+
+    def add(self, bed_min, wake_min, quality):
+        """Adds one night in O(1)."""
+        angle = bed_min * _RAD_PER_MIN
+        self.n += 1
+        self.dur_sum += (wake_min - bed_min) % DAY_MIN
+        self.sin_sum += math.sin(angle)
+        self.cos_sum += math.cos(angle)
+        self.quality_sum += quality
+
+    @property
+    def mean_duration_min(self):
+        return self.dur_sum / self.n if self.n else None
+
+    @property
+    def mean_bedtime_min(self):
+        if not self.n:
+            return None
+        return (math.atan2(self.sin_sum, self.cos_sum) / _RAD_PER_MIN) % DAY_MIN
+
+    @property
+    def bedtime_spread_min(self):
+        """Circular standard deviation of bedtimes, in minutes."""
+        if not self.n:
+            return None
+        r = min(1.0, math.hypot(self.sin_sum, self.cos_sum) / self.n)
+        return math.sqrt(-2 * math.log(r)) / _RAD_PER_MIN if r > 0 else DAY_MIN / 2
+
+    @property
+    def consistency_pct(self):
+        """100% when bedtimes never move; 0% at a 2-hour spread or worse."""
+        if not self.n:
+            return None
+        return max(0.0, 1 - self.bedtime_spread_min / 120) * 100
+
+    @property
+    def score(self):
+        """0-100 blend of duration vs. target, bedtime consistency and quality."""
+        if not self.n:
+            return None
+        duration = max(0.0, 1 - abs(self.mean_duration_min - TARGET_MIN) / 240)
+        quality = (self.quality_sum / self.n - 1) / 4
+        return round(100 * (0.5 * duration + 0.3 * self.consistency_pct / 100 + 0.2 * quality))
+
+
+class SleepAggregates:
+    """All-time and per-week NightStats for one user."""
+
+    def __init__(self):
+        self.total = NightStats()
+        self.weeks = {}
+
+    @classmethod
+    def from_columns(cls, night, bed_min, wake_min, quality):
+        """Builds aggregates for a whole history with vectorized NumPy."""
+        agg = cls()
+        if not len(night):
+            return agg
+        weeks, idx = np.unique(week_of(night), return_inverse=True)
+        angles = np.asarray(bed_min, dtype=np.float64) * _RAD_PER_MIN
+        sums = {
+            "n": np.bincount(idx),
+            "dur_sum": np.bincount(idx, weights=durations_min(bed_min, wake_min)),
+            "sin_sum": np.bincount(idx, weights=np.sin(angles)),
+            "cos_sum": np.bincount(idx, weights=np.cos(angles)),
+            "quality_sum": np.bincount(idx, weights=np.asarray(quality, dtype=np.float64)),
+        }
+        for i, week in enumerate(weeks.tolist()):
+            agg.weeks[week] = NightStats(**{k: v[i].item() for k, v in sums.items()})
+        agg.total = NightStats(**{k: v.sum().item() for k, v in sums.items()})
+        return agg
+
+    @classmethod
+    def from_history(cls, history):
+        """Builds aggregates from a sleep_store.SleepHistory."""
+        return cls.from_columns(history.night, history.bed_min, history.wake_min, history.quality)
+
+    def add(self, night, bed_min, wake_min, quality):
+        """Adds one night in O(1)."""
+        self.total.add(bed_min, wake_min, quality)
+        self.weeks.setdefault(int(week_of(night)), NightStats()).add(bed_min, wake_min, quality)
+
+    def week(self, night):
+        """Returns the stats for the week containing `night` (may be empty)."""
+        return self.weeks.get(int(week_of(night)), NightStats())
+
+
+class SleepStatsCache:
+    """Per-user SleepAggregates, kept in step with a SleepLogStore."""
+
+    def __init__(self, store):
+        self.store = store
+        self._by_user = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        """Returns up-to-date aggregates, rebuilding only if the store moved on."""
+        with self._lock:
+            agg = self._by_user.get(user_id)
+            if agg is None or agg.total.n != self.store.count(user_id):
+                agg = self._by_user[user_id] = SleepAggregates.from_history(self.store.load(user_id))
+            return agg
+
+    def append(self, user_id, date, bed_time, wake_time, quality):
+        """Saves a night to the store and folds it into the cached aggregates."""
+        with self._lock:
+            self.store.append(user_id, date, bed_time, wake_time, quality)
+            agg = self._by_user.get(user_id)
+            if agg is None:
+                return
+            if agg.total.n == self.store.count(user_id) - 1:
+                agg.add(to_night(date), to_minutes(bed_time), to_minutes(wake_time), quality)
+            else:
+                del self._by_user[user_id]  # out of step: rebuild on next get()
+
+
+# --- Display helpers ---
+def score_label(score):
+    if score >= 85:
+        return "Great"
+    if score >= 70:
+        return "Good"
+    if score >= 50:
+        return "Fair"
+    return "Poor"
+
+
+def format_duration(minutes):
+    """Formats minutes as e.g. '7h 24m'."""
+    h, m = divmod(int(round(minutes)), 60)
+    return f"{h}h {m:02d}m"
+
+
+def format_clock(minutes):
+    """Formats minutes after midnight as e.g. '11:42 PM'."""
+    h, m = divmod(int(round(minutes)) % DAY_MIN, 60)
+    return f"{(h - 1) % 12 + 1}:{m:02d} {'AM' if h < 12 else 'PM'}"
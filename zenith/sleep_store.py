@@ -0,0 +1,132 @@
+import datetime
+import fcntl
+import os
+import threading
+import urllib.parse
+
+import numpy as np
+
+# --- Sleep Log Store ---
+# Append-only, columnar sleep logs: each user has a directory with one
+# little-endian binary file per column. Saving a night appends a few bytes to
+# each file; loading a history memory-maps the files, so the trend chart
+# reads NumPy views straight off the page cache instead of rebuilding rows.
+#
+# Times are stored as minutes after midnight and nights as days since
+# 1970-01-01, so a column is a plain fixed-width array.
+#
+# Appends take an flock on the user's lock file, so the columns stay in step
+# when several worker processes log for the same user. A crash mid-append
+# leaves some columns a row longer; readers ignore the extra rows and the
+# next append cuts them off before writing.
+
+COLUMNS = (
+    ("night", np.dtype("<i4")),     # date the night started, days since epoch
+    ("bed_min", np.dtype("<i2")),   # bedtime, minutes after midnight
+    ("wake_min", np.dtype("<i2")),  # wake time, minutes after midnight
+    ("quality", np.dtype("i1")),    # 1-5 self-rating
+)
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def to_night(date):
+    """Converts a datetime.date to days since epoch."""
+    return date.toordinal() - _EPOCH_ORDINAL
+
+
+def to_minutes(t):
+    """Converts a datetime.time to minutes after midnight."""
+    return t.hour * 60 + t.minute
+
+
+class SleepHistory:
+    """Read-only column arrays for one user's sleep logs, oldest first."""
+
+    def __init__(self, columns):
+        n = min((len(col) for col in columns.values()), default=0)
+        for name, col in columns.items():
+            setattr(self, name, col[:n])
+        self._n = n
+
+    def __len__(self):
+        return self._n
+
+    def dates(self):
+        """Returns the nights as a datetime64[D] array."""
+        return self.night.astype("datetime64[D]")
+
+    def hours(self):
+        """Returns sleep duration per night in hours (handles past-midnight bedtimes)."""
+        return ((self.wake_min.astype(np.int32) - self.bed_min) % (24 * 60)) / 60
+
+
+class SleepLogStore:
+    """Per-user columnar sleep log files under `root`."""
+
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _user_dir(self, user_id):
+        return os.path.join(self.root, urllib.parse.quote(user_id, safe=""))
+
+    def _column_path(self, user_id, name):
+        return os.path.join(self._user_dir(user_id), f"{name}.bin")
+
+    def _rows(self, user_id):
+        """Returns the number of complete rows: the length of the shortest column."""
+        rows = []
+        for name, dtype in COLUMNS:
+            try:
+                rows.append(os.path.getsize(self._column_path(user_id, name)) // dtype.itemsize)
+            except FileNotFoundError:
+                return 0
+        return min(rows)
+
+    def append(self, user_id, night, bed_time, wake_time, quality):
+        """Appends one night. Accepts a date and two times from the log form."""
+        self.append_many(
+            user_id,
+            night=[to_night(night)],
+            bed_min=[to_minutes(bed_time)],
+            wake_min=[to_minutes(wake_time)],
+            quality=[quality],
+        )
+
+    def append_many(self, user_id, **columns):
+        """Appends equal-length arrays for every column in COLUMNS."""
+        arrays = [np.asarray(columns[name], dtype=dtype) for name, dtype in COLUMNS]
+        if len({len(a) for a in arrays}) != 1:
+            raise ValueError("All sleep log columns must have the same length.")
+        with self._lock:
+            os.makedirs(self._user_dir(user_id), exist_ok=True)
+            with open(os.path.join(self._user_dir(user_id), ".lock"), "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)  # released when the file closes
+                rows = self._rows(user_id)
+                for (name, dtype), array in zip(COLUMNS, arrays):
+                    with open(self._column_path(user_id, name), "ab") as f:
+                        f.truncate(rows * dtype.itemsize)  # drop a partial row left by a crash
+                        f.write(array.tobytes())
+
+    def count(self, user_id):
+        """Returns how many nights the user has logged (cheap: one stat call)."""
+        name, dtype = COLUMNS[-1]
+        try:
+            return os.path.getsize(self._column_path(user_id, name)) // dtype.itemsize
+        except FileNotFoundError:
+            return 0
+
+    def load(self, user_id):
+        """
+        Memory-maps the user's full history, truncated to the shortest column.
+        No rows are copied.
+        """
+        n = self._rows(user_id)
+        columns = {}
+        for name, dtype in COLUMNS:
+            if n == 0:
+                columns[name] = np.empty(0, dtype=dtype)
+            else:
+                columns[name] = np.memmap(self._column_path(user_id, name), dtype=dtype, mode="r", shape=(n,))
+        return SleepHistory(columns)
@@ -0,0 +1,395 @@
+import abc
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import weakref
+
+import streamlit as st
+
+from zenith import config, events, models, timers
+
+# --- Externalized Session State ---
+# A browser session's durable keys (PERSISTED) are stored in a StateBackend
+# as one hash per session: field = state key, value = encoded bytes. The
+# session is identified by a random key in the URL (?sid=...). If a load
+# balancer sends the next connection to another worker process, that worker
+# loads the state from the backend instead of starting the user over.
+#
+# A URL gets shared and bookmarked, so the key alone does not grant the
+# state. Each browser gets a random secret in a cookie (BROWSER_COOKIE, set
+# from the page since Streamlit can't set cookies from the server), and a
+# session is bound to the hash of the secret of the browser that created it
+# (OWNER_KEY). A link opened in another browser starts a new session. Two
+# tabs of one browser on the same link (a duplicated tab) are told apart
+# within a worker process: the second tab continues from a copy under a
+# new key. Duplicates served by different workers still share one session.
+#
+# st.session_state is the write-through cache. restore() fills it from the
+# backend on a session's first run in a process. sync() runs after every
+# button action (zenith.actions) and at the end of every run, including
+# runs cut short by st.rerun(), st.stop() or an error (synced()). It writes
+# only the keys whose encoded value changed since they were last loaded or
+# written (dirty tracking by value, so in-place changes like Schedule.add
+# are caught too). A rerun that changes nothing makes no writes. Transient UI state (open dialogs, the breathing modal) is not
+# persisted, and neither are the catalogs, which every worker builds itself
+# (zenith.stores).
+#
+# Backends: SQLite (default) and a directory of JSON files for one host or
+# shared storage, and Redis for many hosts. Pick one with
+# ZENITH_STATE_BACKEND.
+
+PERSISTED = ("page", "user_location", "user_goals", "timer_state", "my_schedule",
+             "read_resources", "events_page", "coach_pages", "wind_down_until")
+SID_PARAM = "sid"
+BROWSER_COOKIE = "zenith_browser"
+OWNER_KEY = "$owner"  # backend field: hash of the owning browser's secret
+_TOKEN = re.compile(r"[0-9a-f]{32}")
+
+
+# --- Encoding ---
+# JSON with tags for the few non-JSON types, so a shared store never holds
+# pickles that another process would have to trust.
+def _tag(value):
+    if isinstance(value, events.Schedule):
+        return {"$schedule": list(value)}
+    if isinstance(value, models.TimerState):
+        return {"$timer": {name: getattr(value, name) for name in models.TimerState.__slots__}}
+    if isinstance(value, models.Event):
+        return {"$event": [getattr(value, name) for name in models.Event.FIELDS]}
+    if isinstance(value, (set, frozenset)):
+        return {"$set": sorted(value)}
+    raise TypeError(f"Can't persist {type(value).__name__} in session state")
+
+
+def _untag(obj):
+    if len(obj) == 1:
+        if "$schedule" in obj:
+            return events.Schedule(obj["$schedule"])
+        if "$timer" in obj:
+            return models.TimerState(**obj["$timer"])
+        if "$event" in obj:
+            return models.Event(*obj["$event"])
+        if "$set" in obj:
+            return set(obj["$set"])
+    return obj
+
+
+def encode(value):
+    """Encodes a state value as compact JSON bytes (tuples become lists)."""
+    return json.dumps(value, default=_tag, separators=(",", ":")).encode()
+
+
+def decode(blob):
+    """Decodes bytes from encode(). Raises ValueError on bad data."""
+    return json.loads(blob, object_hook=_untag)
+
+
+# --- Backends ---
+class StateBackend(abc.ABC):
+    """Interface for session state stores: one hash of {key: bytes} per session."""
+
+    @abc.abstractmethod
+    def load(self, sid):
+        """Returns the session's {key: bytes} (empty if it has none)."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def save(self, sid, changes):
+        """Writes the given {key: bytes}; the session's other keys are kept."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, sid):
+        """Forgets the session."""
+        raise NotImplementedError
+
+    def prune(self, max_age):
+        """Forgets sessions not written in `max_age` seconds. Returns how many."""
+        return 0
+
+
+class SQLiteStateBackend(StateBackend):
+    """SQLite (WAL) table keyed by (sid, key). Per-thread connections."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS session_state (
+        sid     TEXT NOT NULL,
+        key     TEXT NOT NULL,
+        value   BLOB NOT NULL,
+        updated REAL NOT NULL,
+        PRIMARY KEY (sid, key)
+    ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def load(self, sid):
+        rows = self._conn().execute("SELECT key, value FROM session_state WHERE sid = ?", (sid,))
+        return {key: bytes(value) for key, value in rows}
+
+    def save(self, sid, changes):
+        now = time.time()
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT INTO session_state VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (sid, key) DO UPDATE SET value = excluded.value, updated = excluded.updated",
+                [(sid, key, value, now) for key, value in changes.items()],
+            )
+
+    def delete(self, sid):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM session_state WHERE sid = ?", (sid,))
+
+    def prune(self, max_age):
+        with self._conn() as conn:
+            return conn.execute(
+                "DELETE FROM session_state WHERE sid IN "
+                "(SELECT sid FROM session_state GROUP BY sid HAVING MAX(updated) < ?)",
+                (time.time() - max_age,),
+            ).rowcount
+
+
+class FileStateBackend(StateBackend):
+    """One JSON file per session in a directory, replaced atomically on save."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def _path(self, sid):
+        return os.path.join(self.directory, f"{sid}.json")
+
+    def _read(self, sid):
+        try:
+            with open(self._path(sid), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def load(self, sid):
+        return {key: value.encode() for key, value in self._read(sid).items()}
+
+    def save(self, sid, changes):
+        with self._lock:
+            data = self._read(sid)
+            data.update((key, value.decode()) for key, value in changes.items())
+            tmp = f"{self._path(sid)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self._path(sid))
+
+    def delete(self, sid):
+        try:
+            os.remove(self._path(sid))
+        except FileNotFoundError:
+            pass
+
+    def prune(self, max_age):
+        cutoff = time.time() - max_age
+        removed = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        return removed
+
+
+class RedisStateBackend(StateBackend):
+    """
+    A Redis hash per session (HGETALL / HSET). `client` is a redis-py client
+    or anything with the same hgetall/hset/expire/delete/pipeline methods.
+    Idle sessions expire after `ttl` seconds, so prune() has nothing to do.
+    """
+
+    def __init__(self, client, ttl, prefix="zenith:session:"):
+        self.client = client
+        self.ttl = int(ttl)
+        self.prefix = prefix
+
+    def load(self, sid):
+        return {key.decode() if isinstance(key, bytes) else key: value
+                for key, value in self.client.hgetall(self.prefix + sid).items()}
+
+    def save(self, sid, changes):
+        pipe = self.client.pipeline()
+        pipe.hset(self.prefix + sid, mapping=changes)
+        pipe.expire(self.prefix + sid, self.ttl)
+        pipe.execute()
+
+    def delete(self, sid):
+        self.client.delete(self.prefix + sid)
+
+
+def _redis_backend():
+    import redis  # optional: only needed for ZENITH_STATE_BACKEND=redis
+
+    return RedisStateBackend(redis.Redis.from_url(config.REDIS_URL), config.STATE_TTL_SEC)
+
+
+BACKENDS = {
+    "sqlite": lambda: SQLiteStateBackend(config.data_path("sessions.db")),
+    "file": lambda: FileStateBackend(config.data_dir("sessions")),
+    "redis": _redis_backend,
+}
+
+
+@st.cache_resource
+def get_backend():
+    """Returns the configured state backend (ZENITH_STATE_BACKEND), pruned of expired sessions."""
+    backend = BACKENDS[config.STATE_BACKEND]()
+    backend.prune(config.STATE_TTL_SEC)
+    return backend
+
+
+# --- Session glue ---
+class _Claim:
+    """Held in a session's state while it uses a session key in this process."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Claims:
+    """The session keys in use by live sessions of this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._claims = weakref.WeakValueDictionary()  # sid -> _Claim; gone with the session
+
+    def take(self, sid, claim):
+        """Claims `sid` for `claim`. Returns False if another live session holds it."""
+        with self._lock:
+            holder = self._claims.setdefault(sid, claim)
+            return holder is claim
+
+
+@st.cache_resource
+def _get_claims():
+    return _Claims()
+
+
+def _new_session_key():
+    sid = os.urandom(16).hex()
+    st.query_params[SID_PARAM] = sid
+    return sid
+
+
+def _session_key():
+    """Returns this browser session's key from the URL, adding one if missing."""
+    sid = st.query_params.get(SID_PARAM, "")
+    return sid if _TOKEN.fullmatch(sid) else _new_session_key()
+
+
+def _browser_cookie():
+    """Returns the browser secret sent with this session's connection, or None."""
+    secret = st.context.cookies.get(BROWSER_COOKIE)
+    # Not a str without a real connection (AppTest mocks the runtime).
+    return secret if isinstance(secret, str) and _TOKEN.fullmatch(secret) else None
+
+
+def _browser_owner(state):
+    """
+    Returns the owner hash for this browser. A browser without the cookie
+    gets a new secret, set from the page for its next connections.
+    """
+    secret = _browser_cookie() or state.get("state_browser")
+    if secret is None:
+        secret = state.state_browser = os.urandom(16).hex()
+        st.html(
+            f"<script>document.cookie = '{BROWSER_COOKIE}={secret}; path=/; "
+            f"max-age={int(config.STATE_TTL_SEC)}; SameSite=Strict'"
+            " + (location.protocol === 'https:' ? '; Secure' : '');</script>",
+            unsafe_allow_javascript=True,
+        )
+    return hashlib.sha256(secret.encode()).hexdigest().encode()
+
+
+def restore(backend=None):
+    """
+    Loads the session's saved state on its first run in this process, or
+    after an idle spill dropped state_saved (zenith.session_spill); call it
+    before the session-state defaults are filled in. An in-flight Pomodoro
+    phase loaded here is rescheduled on this process's timer scheduler.
+    """
+    state = st.session_state
+    if "state_saved" in state:
+        return
+    backend = backend or get_backend()
+    owner = _browser_owner(state)
+    sid = _session_key()
+    stored = backend.load(sid)
+    stored_owner = stored.pop(OWNER_KEY, None)
+    if stored_owner is not None and stored_owner != owner:
+        # A link from another browser (shared or bookmarked): start over.
+        sid, stored, stored_owner = _new_session_key(), {}, None
+    claim = state.state_claim if "state_claim" in state else _Claim()
+    if not _get_claims().take(sid, claim):
+        # Another live tab uses this key (a duplicated tab): continue from a copy.
+        sid, stored_owner = _new_session_key(), None
+        _get_claims().take(sid, claim)
+        if stored:
+            backend.save(sid, stored)
+    if stored_owner is None:
+        backend.save(sid, {OWNER_KEY: owner})
+    state.state_claim = claim
+    saved = {}
+    loaded = set()
+    for key, blob in stored.items():
+        if key not in PERSISTED:
+            continue
+        if key not in state:  # a value already set (a widget, a callback, a spill restore) is newer
+            try:
+                state[key] = decode(blob)
+            except (ValueError, TypeError):
+                continue  # unreadable (e.g. an older format): the default is used
+            loaded.add(key)
+        saved[key] = blob  # what the backend holds, for sync() to compare against
+    state.state_sid = sid
+    state.state_saved = saved
+    if loaded & {"timer_state", "wind_down_until"}:
+        timers.init_session()
+    if "timer_state" in loaded:
+        timers.resume_focus_phase(state.timer_state)
+    if "wind_down_until" in loaded:
+        timers.resume_wind_down(state.wind_down_until)
+
+
+@contextlib.contextmanager
+def synced(backend=None):
+    """Runs a block, then sync(), even if the block ends the run early."""
+    try:
+        yield
+    finally:
+        sync(backend)
+
+
+def sync(backend=None):
+    """Writes the persisted keys whose value changed. Returns {key: bytes} written."""
+    state = st.session_state
+    saved = state.state_saved
+    changes = {}
+    for key in PERSISTED:
+        if key in state:
+            blob = encode(state[key])
+            if blob != saved.get(key):
+                changes[key] = blob
+    if changes:
+        (backend or get_backend()).save(state.state_sid, changes)
+        saved.update(changes)
+    return changes
@@ -0,0 +1,81 @@
+import datetime
+
+import streamlit as st
+
+from zenith import catalog, config
+
+# --- Shared Stores ---
+# Created once per server process and shared by every session. Each getter
+# imports its store's module, so a page only loads the stores (and their
+# NumPy, Pillow or SQLite dependencies) that it uses.
+
+
+@st.cache_resource
+def get_checkin_store():
+    """Returns the Daily Check-In store."""
+    from zenith import checkins
+    return checkins.CheckinStore(config.data_path("checkins.db"))
+
+
+@st.cache_resource
+def get_sleep_store():
+    """Returns the columnar sleep log store."""
+    from zenith import sleep_store
+    return sleep_store.SleepLogStore(config.data_dir("sleep"))
+
+
+@st.cache_resource
+def get_sleep_stats():
+    """Returns the per-user sleep aggregates, kept in step with the sleep store."""
+    from zenith import sleep_stats
+    return sleep_stats.SleepStatsCache(get_sleep_store())
+
+
+@st.cache_resource(max_entries=2)
+def _event_catalog(day):
+    from zenith import events
+    return events.EventStore(catalog.get_default_events()).freeze()
+
+
+def get_event_catalog():
+    """
+    Returns the shared, read-only event catalog. Catalog times like
+    "Today, 6:00 PM" are resolved when it is built, so it is rebuilt once
+    per campus day.
+    """
+    return _event_catalog(datetime.datetime.now(config.CAMPUS_TZ).date())
+
+
+@st.cache_resource
+def get_resource_library():
+    """Returns the Resources catalog and its full-text search index (entries are read-only)."""
+    from zenith import models, resources
+    return resources.ResourceLibrary(models.Resource.from_dict(r) for r in catalog.get_default_resources())
+
+
+@st.cache_resource
+def get_thumbnails():
+    """Returns the on-disk thumbnail cache for resource and profile images."""
+    from zenith import metrics, thumbnails
+    return thumbnails.ThumbnailCache(config.THUMBS_DIR, config.THUMBS_URL, metrics=metrics.get_render_metrics())
+
+
+@st.cache_resource
+def get_chat_history():
+    """Returns the persisted coach conversations."""
+    from zenith import chat_history
+    return chat_history.ChatHistoryStore(config.data_path("chat.db"))
+
+
+@st.cache_resource
+def get_focus_log():
+    """Returns the log of completed focus sessions."""
+    from zenith import focus_log
+    return focus_log.FocusLog(config.data_path("focus.db"))
+
+
+@st.cache_resource
+def get_insights():
+    """Returns the per-user insight engine over check-ins, sleep and focus."""
+    from zenith import insights
+    return insights.InsightEngine(get_checkin_store(), get_sleep_store(), get_focus_log())
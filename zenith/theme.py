@@ -0,0 +1,43 @@
+import glob
+import hashlib
+import os
+import re
+
+# --- Theme Stylesheet ---
+# The theme used to be sent inline, as a ~7 KB <style> block, on every rerun
+# of every session. It is now minified once into static/theme.<hash>.css.
+# The hash is of the minified content, so a theme edit gets a new URL and
+# browsers can cache each version indefinitely.
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE = re.compile(r"\s+")
+_AROUND_PUNCT = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def minify(css):
+    """Strips comments and redundant whitespace from a stylesheet."""
+    css = _COMMENT.sub("", css)
+    css = _SPACE.sub(" ", css)
+    css = _AROUND_PUNCT.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def build_stylesheet(source, static_dir, static_url):
+    """
+    Minifies `source` into static_dir/theme.<hash>.css (if not already there),
+    removes older builds, and returns its URL.
+    """
+    with open(source, encoding="utf-8") as f:
+        css = minify(f.read()).encode("utf-8")
+    name = f"theme.{hashlib.sha256(css).hexdigest()[:12]}.css"
+    path = os.path.join(static_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(static_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(css)
+        os.replace(tmp, path)
+    for old in glob.glob(os.path.join(static_dir, "theme.*.css")):
+        if os.path.basename(old) != name:
+            os.remove(old)
+    return static_url + name
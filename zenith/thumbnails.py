@@ -0,0 +1,187 @@
+import collections
+import hashlib
+import io
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+# --- Image Thumbnails ---
+# Resource cards and the profile avatar used to point at remote placehold.co
+# URLs. The browser re-fetched them on every visit, and a slow upstream stalled
+# the page. Images are now rendered once, at the size they are shown, into
+# an on-disk cache under static/, and served by the app itself.
+# - placehold.co URLs are drawn locally with Pillow, so no network is needed.
+# - Local files are resized.
+# - Other URLs are fetched once, falling back to a drawn placeholder when offline.
+#   A failed fetch is remembered for FAILURE_TTL_SEC, so reruns in between get
+#   the placeholder at once instead of blocking on the network again.
+# File names are a hash of (source, size), so a URL never changes meaning and
+# browsers can cache it indefinitely. The cache is bounded in bytes and
+# evicts the least recently used thumbnail. LRU order survives restarts
+# through file mtimes. Hit, miss and eviction counts are exported with the
+# render metrics (zenith.metrics).
+
+PLACEHOLDER_HOST = "placehold.co"
+FETCH_TIMEOUT_SEC = 3
+FAILURE_TTL_SEC = 300  # don't retry a source that failed to load for this long
+TOUCH_INTERVAL_SEC = 3600  # refresh a hit's mtime at most this often
+_DEFAULT_BG, _DEFAULT_FG = "EDE7F6", "4A148C"
+_FALLBACK = f"https://{PLACEHOLDER_HOST}/{_DEFAULT_BG}/{_DEFAULT_FG}?text=Zenith"
+
+
+def _parse_placeholder(src):
+    """Returns (bg, fg, text) for a placehold.co URL, or None."""
+    url = urllib.parse.urlsplit(src)
+    if url.hostname != PLACEHOLDER_HOST:
+        return None
+    parts = [p for p in url.path.split("/") if p]
+    bg = parts[1] if len(parts) > 1 else "CCCCCC"
+    fg = parts[2] if len(parts) > 2 else "969696"
+    text = urllib.parse.parse_qs(url.query).get("text", [parts[0] if parts else ""])[0]
+    return bg, fg, text
+
+
+def draw_placeholder(size, bg=_DEFAULT_BG, fg=_DEFAULT_FG, text=""):
+    """Draws a flat-colour image with centred text, like placehold.co."""
+    image = Image.new("RGB", size, f"#{bg}")
+    if text:
+        draw = ImageDraw.Draw(image)
+        font = ImageFont.load_default(size=max(10, min(size[1] // 3, size[0] // max(len(text), 1) * 3 // 2)))
+        draw.text((size[0] / 2, size[1] / 2), text, fill=f"#{fg}", font=font, anchor="mm")
+    return image
+
+
+class ThumbnailCache:
+    """Pre-sized PNG thumbnails in a byte-bounded on-disk LRU."""
+
+    def __init__(self, root, url_prefix, max_bytes=64 * 1024 * 1024, metrics=None):
+        self.root = root
+        self.url_prefix = url_prefix
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.evictions = 0
+        self._metrics = metrics  # zenith.metrics.RenderMetrics, or None
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()  # file name -> [bytes, last touch]
+        self._failed = {}  # file name -> time to retry loading its source
+        self._bytes = 0
+        os.makedirs(root, exist_ok=True)
+        files = []
+        for entry in os.scandir(root):
+            if entry.is_file() and entry.name.endswith(".png"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        for mtime, name, size in sorted(files):
+            self._entries[name] = [size, mtime]
+            self._bytes += size
+        self._evict()
+
+    @staticmethod
+    def _name(src, size):
+        key = f"{src}|{size[0]}x{size[1]}"
+        if os.path.isfile(src):
+            stat = os.stat(src)
+            key += f"|{stat.st_mtime_ns}|{stat.st_size}"
+        return hashlib.sha1(key.encode()).hexdigest()[:20] + ".png"
+
+    def url(self, src, size):
+        """Returns the app URL of `src` (URL or local path) resized to `size` (w, h)."""
+        name = self._name(src, size)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                self.hits += 1
+                self._publish()
+                self._entries.move_to_end(name)
+                if now - entry[1] > TOUCH_INTERVAL_SEC:
+                    entry[1] = now
+                    try:
+                        os.utime(os.path.join(self.root, name), (now, now))
+                    except FileNotFoundError:  # removed behind our back
+                        self._bytes -= entry[0]
+                        del self._entries[name]
+                        entry = None
+                if entry is not None:
+                    return self.url_prefix + name
+            failed = self._failed.get(name, 0) > now
+            if not failed:
+                self.misses += 1
+                self._publish()
+        if failed:
+            return self.url(_FALLBACK, size)
+
+        image = self._render(src, size)
+        if image is None:
+            # Unreachable remote image: serve a drawn stand-in, but don't
+            # cache it under this source, so it is retried after the TTL.
+            with self._lock:
+                for key in [key for key, retry in self._failed.items() if retry <= now]:
+                    del self._failed[key]
+                self._failed[name] = now + FAILURE_TTL_SEC
+            return self.url(_FALLBACK, size)
+        buf = io.BytesIO()
+        image.save(buf, "PNG")
+        data = buf.getvalue()
+        path = os.path.join(self.root, name)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            if name not in self._entries:
+                self._bytes += len(data)
+            self._entries[name] = [len(data), now]
+            self._entries.move_to_end(name)
+            self._failed.pop(name, None)
+            self._evict()
+        return self.url_prefix + name
+
+    @staticmethod
+    def _render(src, size):
+        """Returns `src` as a `size` image, or None if it can't be loaded."""
+        placeholder = _parse_placeholder(src)
+        if placeholder is not None:
+            return draw_placeholder(size, *placeholder)
+        try:
+            if os.path.isfile(src):
+                image = Image.open(src)
+            else:
+                with urllib.request.urlopen(src, timeout=FETCH_TIMEOUT_SEC) as resp:
+                    image = Image.open(io.BytesIO(resp.read()))
+            image.load()
+        except (OSError, ValueError):
+            return None
+        return ImageOps.fit(image.convert("RGB"), size, Image.LANCZOS)
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            name, (size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            self._publish()
+            try:
+                os.remove(os.path.join(self.root, name))
+            except FileNotFoundError:
+                pass
+
+    def _publish(self):
+        """Hands the counters to the render metrics. Called with the lock held."""
+        if self._metrics is not None:
+            self._metrics.set_thumbnails(self.hits, self.misses, self.evictions)
+
+    def stats(self):
+        """Returns hit/miss/eviction counts, the hit rate, and the cache's size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
@@ -0,0 +1,109 @@
+import collections
+import time
+import uuid
+
+import streamlit as st
+
+from zenith.scheduler import TimerScheduler
+
+# --- Session Timers ---
+# Glue between the process-wide TimerScheduler and one browser session.
+# Scheduler callbacks run on the scheduler thread, outside any script run,
+# so they never touch st.session_state directly: they flip flags on objects
+# the session already holds (timer_state) or append to the session's
+# `timer_events` deque, which the next script run drains. While a wind-down
+# is pending, a small fragment (zenith.ui.wind_down_watch) polls for it, so
+# that next run comes when the timer fires, not on the user's next click.
+#
+# Deadlines live in session state (timer_state, wind_down_until), which is
+# spilled and persisted, so a timer lost with a spill or a move to another
+# worker process is re-armed from it (resume_focus_phase, resume_wind_down).
+
+WIND_DOWN_MINUTES = 30
+
+
+@st.cache_resource
+def get_scheduler():
+    """Returns the timer scheduler shared by every session in this process."""
+    return TimerScheduler()
+
+
+def init_session():
+    """Gives the session an id and an event mailbox for fired timers."""
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    if 'timer_events' not in st.session_state:
+        st.session_state.timer_events = collections.deque()
+
+
+def _key(kind, session_id=None):
+    return (session_id or st.session_state.session_id, kind)
+
+
+def schedule_focus_phase(ts):
+    """(Re)schedules the end of the current Pomodoro phase."""
+    duration_min = ts.break_duration_min if ts.is_break else ts.duration_min
+    ts.finished = False
+
+    def _phase_done(key, ts=ts):
+        ts.finished = True
+
+    get_scheduler().schedule(_key("focus"), ts.start_time + duration_min * 60, _phase_done)
+
+
+def cancel_focus_phase(session_id=None, scheduler=None):
+    """
+    Cancels the pending Pomodoro phase, if any. Outside a script run, pass
+    the session's id and the scheduler.
+    """
+    (scheduler or get_scheduler()).cancel(_key("focus", session_id))
+
+
+def resume_focus_phase(ts):
+    """
+    Re-arms a running phase whose timer was lost: restored from the state
+    backend by another process, or from an idle-session spill. A phase that
+    ended in the meantime is marked finished instead.
+    """
+    if not ts.running or ts.finished:
+        return
+    duration_min = ts.break_duration_min if ts.is_break else ts.duration_min
+    if ts.start_time + duration_min * 60 <= time.time():
+        ts.finished = True
+    else:
+        schedule_focus_phase(ts)
+
+
+def start_wind_down(now):
+    """Starts the session's wind-down timer."""
+    st.session_state.wind_down_until = now + WIND_DOWN_MINUTES * 60
+    resume_wind_down(st.session_state.wind_down_until)
+
+
+def resume_wind_down(deadline):
+    """
+    (Re)arms the wind-down timer for `deadline`, if one is pending. A
+    deadline that passed in the meantime fires on the scheduler's next tick.
+    """
+    if not deadline:
+        return
+    events = st.session_state.timer_events
+
+    def _wind_down_done(key, events=events):
+        events.append("wind_down")
+
+    get_scheduler().schedule(_key("wind_down"), deadline, _wind_down_done)
+
+
+def cancel_wind_down(session_id=None, scheduler=None):
+    """Cancels the pending wind-down timer, if any (see cancel_focus_phase)."""
+    (scheduler or get_scheduler()).cancel(_key("wind_down", session_id))
+
+
+def drain_events():
+    """Returns (and clears) the timer events fired since the last run."""
+    events = st.session_state.timer_events
+    fired = []
+    while events:
+        fired.append(events.popleft())
+    return fired
@@ -0,0 +1,160 @@
+import math
+import time
+
+import streamlit as st
+
+from zenith import actions, event_times, geo, metrics, session_spill
+
+# --- Shared UI ---
+# Card helpers, navigation, the dialogs that more than one page opens and
+# their actions (zenith.actions). The pages themselves live in zenith.views.
+
+PLACEHOLDER_MODALS = {
+    "Privacy Policy": "Your data is anonymized and used only for campus wellness research. We never sell your data.",
+    "Help & Support": "Please contact zenith-support@campus.edu for any issues.",
+    "Logout": "Are you sure you want to log out?",
+}
+
+
+WIND_DOWN_TICK_SECONDS = 5
+
+
+@st.fragment(run_every=WIND_DOWN_TICK_SECONDS)
+def wind_down_watch():
+    """
+    Shows the minutes left on a pending wind-down timer. Re-runs on its own
+    every WIND_DOWN_TICK_SECONDS and hands control back to the full app
+    (one rerun, which shows the toast) once the timer has fired.
+    """
+    session_spill.ensure_resident()
+    if st.session_state.timer_events:
+        st.rerun()
+    until = st.session_state.wind_down_until
+    if until:
+        st.caption(f"Wind-down timer: {max(0, math.ceil((until - time.time()) / 60))} min left")
+
+
+# --- Helper Functions for Card UI ---
+def card_start():
+    """Starts a custom card div."""
+    metrics.card_started()
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+
+
+def card_end():
+    """Ends a custom card div."""
+    st.markdown("</div>", unsafe_allow_html=True)
+    metrics.card_finished()
+
+
+def card_highlight_start():
+    """Starts a custom highlighted card div."""
+    metrics.card_started()
+    st.markdown("<div class='card-highlight'>", unsafe_allow_html=True)
+
+
+def card_highlight_end():
+    """Ends a custom highlighted card div."""
+    st.markdown("</div>", unsafe_allow_html=True)
+    metrics.card_finished()
+
+
+def event_distance(event):
+    """Returns how far an event is from the user, e.g. '0.3 mi'."""
+    if event.lat is None:
+        return "–"
+    lat, lon = st.session_state.user_location
+    return geo.format_miles(geo.haversine_m(lat, lon, event.lat, event.lon))
+
+
+@actions.action
+def set_page(page_name):
+    """Helper function to set the page state."""
+    st.session_state.page = page_name
+
+
+# --- Shared Actions ---
+@actions.action
+def rsvp(event_id):
+    """Adds an event to the user's schedule and closes its details dialog."""
+    st.session_state.my_schedule.add(event_id)
+    st.session_state.selected_event_details = None
+    actions.notify("Added to your schedule!")
+
+
+@actions.action
+def cancel_rsvp(event_id, title):
+    """Removes an event from the user's schedule."""
+    st.session_state.my_schedule.discard(event_id)
+    actions.notify(f"Removed '{title}' from schedule.")
+
+
+@actions.action
+def show_details(event):
+    """Opens the Event Details dialog for `event`."""
+    st.session_state.selected_event_details = event
+
+
+@actions.action
+def close_details():
+    st.session_state.selected_event_details = None
+
+
+@actions.action
+def open_modal(title):
+    """Opens one of the PLACEHOLDER_MODALS."""
+    st.session_state.show_modal = title
+
+
+@actions.action
+def close_modal():
+    st.session_state.show_modal = None
+
+
+# --- Shared Dialogs ---
+@st.dialog("Event Details")
+def show_event_details_dialog():
+    """
+    Renders the Event Details modal (st.dialog).
+    Uses st.session_state.selected_event_details.
+    """
+    event = st.session_state.selected_event_details
+    if not event:
+        # Closed by one of its buttons: one app run dismisses the dialog.
+        st.rerun()
+
+    st.markdown(f"### {event.title}")
+    st.markdown(f"**{event_times.format_event_time(event.start)}**")
+    st.markdown(f"Location: {event.loc} • Cost: {event.cost} • Distance: {event_distance(event)}")
+    st.markdown("---")
+    st.markdown(f"**About this event:**\n\n{event.details}")
+    
+    # Check if already RSVP'd
+    already_rsvpd = event.id in st.session_state.my_schedule
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("RSVP", disabled=already_rsvpd, key=f"rsvp_modal_{event.id}", on_click=rsvp, args=(event.id,))
+    with col2:
+        st.button("Close", type="secondary", on_click=close_details)
+
+
+def show_placeholder_modal(title, message):
+    """
+    Renders a generic placeholder modal for non-functional buttons.
+    """
+    st.markdown(f"### {title}")
+    st.markdown(message)
+    st.button("Close", type="secondary", on_click=close_modal)
+
+
+def show_modal_dialog():
+    """Opens the placeholder modal named by st.session_state.show_modal."""
+    @st.dialog(st.session_state.show_modal)
+    def _show_modal():
+        title = st.session_state.show_modal
+        if title not in PLACEHOLDER_MODALS:
+            # Closed by its button: one app run dismisses the dialog.
+            st.rerun()
+        show_placeholder_modal(title, PLACEHOLDER_MODALS[title])
+    _show_modal()
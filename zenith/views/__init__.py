@@ -0,0 +1,24 @@
+"""
+The app's pages. cs330.py routes through PAGES, a dispatch table from
+navigation label to (module, render function). A page's module, and with
+it any heavy dependency only that page needs, is imported the first time
+the page is visited.
+"""
+import importlib
+
+PAGES = {
+    "Today": ("zenith.views.today", "page_today"),
+    "Focus": ("zenith.views.focus", "page_focus"),
+    "Sleep": ("zenith.views.sleep", "page_sleep"),
+    "Events": ("zenith.views.events_hub", "page_events"),
+    "My Schedule": ("zenith.views.my_schedule", "page_my_schedule"),
+    "Resources": ("zenith.views.library", "page_resources"),
+    "AI Coach": ("zenith.views.coach", "page_coach"),
+    "Profile": ("zenith.views.profile", "page_profile"),
+}
+
+
+def get_page(name):
+    """Returns the render function for a page, importing its module on first use."""
+    module_name, func_name = PAGES[name]
+    return getattr(importlib.import_module(module_name), func_name)
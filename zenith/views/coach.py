@@ -0,0 +1,67 @@
+import streamlit as st
+
+from zenith import actions, catalog, coach
+from zenith.stores import get_chat_history, get_insights
+from zenith.ui import card_highlight_end, card_highlight_start
+
+COACH_AVATAR = ":material/self_improvement:"
+USER_AVATAR = ":material/person:"
+
+
+@actions.action
+def load_earlier():
+    """Shows one more page of earlier chat messages."""
+    st.session_state.coach_pages += 1
+
+
+# --- 7. AI COACH / MESSAGES PAGE ---
+def page_coach():
+    """Renders the 'AI Coach' chat interface."""
+    st.title("Your AI Wellness Coach")
+    st.markdown("Here are personalized insights and tips just for you.")
+
+    # --- Insight Card ---
+    card_highlight_start()
+    st.subheader("This week's insight:")
+    # Precomputed in the background from your logs (see zenith.insights)
+    insight = get_insights().get(st.session_state.user_id)
+    if insight:
+        st.markdown(f'"Hey Alex! {insight.summary}\n\n{insight.detail}\n\n{insight.suggestion}"')
+    else:
+        st.markdown("Your coach is looking over your week. Check back in a moment.")
+    card_highlight_end()
+
+    # --- Chat Interface ---
+    st.subheader("Chat with your Coach")
+
+    # Persisted conversation (see zenith.chat_history): only the newest turns
+    # are drawn, plus however many earlier pages were asked for.
+    history = get_chat_history()
+    user_id = st.session_state.user_id
+    history.seed(user_id, catalog.get_default_chat())
+    turns, has_earlier = history.window(user_id, st.session_state.coach_pages)
+
+    if has_earlier:
+        st.button("Load earlier messages", type="secondary", key="coach_earlier",
+                  on_click=load_earlier)
+    else:
+        summaries = history.summaries(user_id)
+        if summaries:
+            with st.expander(f"Earlier conversations ({sum(s.turns for s in summaries)} messages, summarized)"):
+                for summary in summaries:
+                    st.markdown(f"- {summary.describe()}")
+
+    for turn in turns:
+        avatar = COACH_AVATAR if turn.role == "assistant" else USER_AVATAR
+        st.chat_message(turn.role, avatar=avatar).markdown(turn.text)
+
+    # User input
+    if prompt := st.chat_input("Reply to your coach..."):
+        st.session_state.coach_pages = 0
+        history.append(user_id, "user", prompt)
+        st.chat_message("user", avatar=USER_AVATAR).markdown(prompt)
+
+        # The reply streams in as the backend generates it (see zenith.coach)
+        with st.chat_message("assistant", avatar=COACH_AVATAR):
+            reply = st.write_stream(coach.stream_reply(history.context(user_id)))
+        history.append(user_id, "assistant", reply)
@@ -0,0 +1,101 @@
+import streamlit as st
+
+from zenith import actions, event_times, geo
+from zenith.stores import get_event_catalog
+from zenith.ui import (card_end, card_highlight_end, card_highlight_start, card_start, event_distance, rsvp,
+                       show_details, show_event_details_dialog)
+
+EVENT_CATEGORIES = ["All", "Wellness", "Academic", "Social", "Fitness"]
+EVENTS_PER_PAGE = 10
+
+
+@actions.action
+def set_events_page(page_no):
+    st.session_state.events_page = page_no
+
+
+# --- 4. EVENTS HUB PAGE (UPGRADED) ---
+def page_events():
+    """Renders the 'Events' page, handles RSVP, and shows Details modal."""
+    
+    # This check is crucial: if a dialog is open, we show it.
+    if st.session_state.selected_event_details:
+        show_event_details_dialog()
+        # Do not render the rest of the page while dialog is open
+        return
+
+    st.title("Campus Events")
+    st.markdown("Find wellness activities happening near you.")
+
+    # --- Nearest to you (grid index + vectorized haversine, see zenith.geo) ---
+    store = get_event_catalog()
+    nearby = store.nearest(*st.session_state.user_location, k=3)
+    if nearby:
+        st.markdown("Closest to you: " + " • ".join(f"**{e.title}** ({geo.format_miles(m)})" for e, m in nearby))
+
+    # Event filters
+    category = st.selectbox(
+        "Filter by Category",
+        EVENT_CATEGORIES,
+        label_visibility="collapsed",
+        key="event_category",
+        on_change=set_events_page,
+        args=(0,)
+    )
+    category = None if category == "All" else category
+
+    # --- Featured Event ---
+    featured_event = store.featured()
+    card_highlight_start()
+    st.subheader("Featured Event")
+    st.markdown(f"### {featured_event.title}")
+    st.markdown(f"**{event_times.format_event_time(featured_event.start)}** @ {featured_event.loc}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        # Check if already RSVP'd
+        already_rsvpd = featured_event.id in st.session_state.my_schedule
+        st.button("RSVP Now", key="rsvp_featured", disabled=already_rsvpd, on_click=rsvp, args=(featured_event.id,))
+    with col2:
+        st.button("Details", type="secondary", key="det_featured", on_click=show_details, args=(featured_event,))
+    card_highlight_end()
+
+    st.subheader("All Events")
+    # Display *other* events as cards, one page at a time. The featured
+    # event is first in the catalog, so it is skipped by offsetting the slice.
+    skip = 1 if category is None or featured_event.cat == category else 0
+    total = store.count(category) - skip
+    num_pages = max(1, -(-total // EVENTS_PER_PAGE))
+    page_no = min(st.session_state.events_page, num_pages - 1)
+    start = skip + page_no * EVENTS_PER_PAGE
+    visible_events = store.slice(category, start, start + EVENTS_PER_PAGE)
+
+    if not visible_events:
+        st.markdown("No other events in this category right now.")
+
+    for event in visible_events:
+        card_start()
+        st.markdown(f"### {event.title}")
+        st.markdown(f"**{event_times.format_event_time(event.start)}**")
+        st.markdown(f"Location: **{event.loc}** • Cost: **{event.cost}** • Distance: **{event_distance(event)}**")
+        
+        c1, c2, c3 = st.columns([1, 1, 1.5])
+        with c1:
+            already_rsvpd = event.id in st.session_state.my_schedule
+            st.button("RSVP", type="secondary", key=f"rsvp_{event.id}", disabled=already_rsvpd,
+                      on_click=rsvp, args=(event.id,))
+        with c2:
+            st.button("Details", type="secondary", key=f"det_{event.id}", on_click=show_details, args=(event,))
+        card_end()
+
+    # --- Pager ---
+    if num_pages > 1:
+        c1, c2, c3 = st.columns([1, 2, 1])
+        with c1:
+            st.button("Previous", type="secondary", key="events_prev", disabled=page_no == 0,
+                      on_click=set_events_page, args=(page_no - 1,))
+        with c2:
+            st.markdown(f"<p style='text-align: center;'>Page {page_no + 1} of {num_pages}</p>", unsafe_allow_html=True)
+        with c3:
+            st.button("Next", type="secondary", key="events_next", disabled=page_no >= num_pages - 1,
+                      on_click=set_events_page, args=(page_no + 1,))
@@ -0,0 +1,87 @@
+import streamlit as st
+
+from zenith import actions, focus_timer, timers
+from zenith.stores import get_focus_log, get_insights
+from zenith.ui import card_end, card_highlight_end, card_highlight_start, card_start
+
+
+# helper: stop timer cleanly (replaces ts.update which doesn't exist)
+@actions.action
+def stop_timer():
+    ts = st.session_state.timer_state
+    ts.running = False
+    ts.is_break = False
+    timers.cancel_focus_phase()
+
+
+@actions.action
+def start_session():
+    """Starts a focus phase with the task and lengths from the settings screen."""
+    ts = st.session_state.timer_state
+    ts.duration_min = st.session_state.focus_duration
+    ts.break_duration_min = st.session_state.focus_break
+    ts.task_name = st.session_state.focus_task
+    focus_timer.start_focus()
+
+
+# --- 2. FOCUS / STUDY PAGE (UPGRADED) ---
+def page_focus():
+    """Renders the 'Focus Hub' page with a complete Pomodoro loop."""
+    st.title("Focus Hub")
+    ts = st.session_state.timer_state
+
+    if ts.running and ts.finished:
+        # --- TIMER FINISHED ---
+        st.balloons()
+        ts.running = False
+
+        if ts.is_break:
+            # Break finished
+            st.header(f"Break's over!")
+            st.markdown(f"Ready for another focus session?")
+            # Callbacks run before the next script run, so the click isn't
+            # lost now that ts.running is False.
+            st.button("Start Next Focus", on_click=focus_timer.start_focus)
+        else:
+            # Focus session finished
+            get_focus_log().log(st.session_state.user_id, ts.duration_min)
+            get_insights().refresh(st.session_state.user_id)
+            st.header(f"Time's up!")
+            st.markdown(f"You completed your focus session for **{ts.task_name}**.")
+            st.button(f"Start {ts.break_duration_min}-min Break", on_click=focus_timer.start_break)
+
+        # fixed: use stop_timer instead of ts.update(...)
+        st.button("Stop for Now", type="secondary", on_click=stop_timer)
+
+    elif ts.running:
+        # --- TIMER IS ACTIVELY COUNTING DOWN ---
+        # Only the countdown fragment refreshes each second; the rest of the
+        # app is not re-run until the phase ends.
+        card_highlight_start()
+        focus_timer.countdown()
+        card_highlight_end()
+
+        st.button("Stop Session", type="secondary", on_click=stop_timer)
+
+    else:
+        # --- TIMER IS NOT RUNNING (Settings Screen) ---
+        st.markdown("Let's get in the zone. What are you working on?")
+        card_start()
+        
+        st.text_input("Task:", "Read Chapter 3 (Stats 210)", key="focus_task")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.number_input("Focus time (minutes):", 5, 120, 25, 5, key="focus_duration")
+        with col2:
+            st.number_input("Break time (minutes):", 5, 30, 5, 5, key="focus_break")
+
+        # The inputs are read from session state by the callback, before the run.
+        st.button("Start Focus Session", on_click=start_session)
+        
+        card_end()
+        
+        card_start()
+        st.subheader("Why use a focus timer?")
+        st.markdown("The Pomodoro Technique breaks work into focused intervals (usually 25 mins) separated by short breaks. It's proven to boost productivity and reduce burnout.")
+        card_end()
@@ -0,0 +1,67 @@
+import streamlit as st
+
+from zenith import actions
+from zenith.stores import get_resource_library, get_thumbnails
+
+RESOURCE_THUMB_SIZE = (1440, 300)  # 2x the card image box (~720 x 150 px)
+
+
+@actions.action
+def open_resource(res):
+    """Marks a resource as read for this session (see the overlay in cs330.py)."""
+    st.session_state.read_resources.add(res.id)
+    actions.notify(f"Opening '{res.title}'...")
+
+
+# --- 6. NEW PAGE: RESOURCES ---
+def page_resources():
+    """Renders the 'Resources' page with searchable, filterable articles."""
+    st.title("Resources")
+    st.markdown("Explore articles and tools for your wellness.")
+    
+    library = get_resource_library()
+    query = st.text_input(
+        "Search articles",
+        placeholder="Search articles, e.g. exam stress, sleep, focus",
+        label_visibility="collapsed"
+    )
+    selected_cat = st.selectbox(
+        "Filter by Category",
+        ["All"] + library.categories(),
+        label_visibility="collapsed"
+    )
+    category = None if selected_cat == "All" else selected_cat
+
+    # Search (ranked) or browse (catalog order)
+    if query.strip():
+        filtered_resources = library.search(query, category)
+        if not filtered_resources:
+            where = "" if category is None else f" in '{selected_cat}'"
+            st.warning(f"No resources match '{query}'{where}.")
+            return
+    else:
+        filtered_resources = library.in_category(category)
+        if not filtered_resources:
+            st.warning(f"No resources found in '{selected_cat}'.")
+            return
+
+    # Display resources
+    thumbs = get_thumbnails()
+    for res in filtered_resources:
+        st.markdown(
+            f"""
+            <div class="resource-card">
+                <img src="{thumbs.url(res.img, RESOURCE_THUMB_SIZE)}" alt="{res.title}">
+                <div class="resource-card-content">
+                    <small>{res.cat.upper()}</small>
+                    <h3>{res.title}</h3>
+                    <small>{res.read_time}</small>
+                </div>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+        read = res.id in st.session_state.read_resources
+        st.button("Read Again" if read else "Read More", key=f"read_{res.id}", type="secondary",
+                  on_click=open_resource, args=(res,))
+            
@@ -0,0 +1,42 @@
+import streamlit as st
+
+from zenith import event_times
+from zenith.stores import get_event_catalog
+from zenith.ui import cancel_rsvp, card_end, card_start, show_details
+
+
+# --- 5. NEW PAGE: MY SCHEDULE ---
+def page_my_schedule():
+    """Renders the user's personal schedule of RSVP'd events."""
+    st.title("My Schedule")
+    
+    if not st.session_state.my_schedule:
+        st.markdown("You haven't RSVP'd for any events yet.")
+        st.markdown("Go to the **Events** page to find activities!")
+        return
+
+    st.markdown("Here are your upcoming events.")
+
+    # Events in start order; overlaps found in one sweep (see zenith.event_times)
+    store = get_event_catalog()
+    conflicts = store.conflicts(st.session_state.my_schedule)
+    if conflicts:
+        st.warning("Some of the events on your schedule overlap.")
+
+    for event_id in store.intervals().sort_ids(st.session_state.my_schedule):
+        event = store.get(event_id)
+        if event:
+            card_start()
+            st.markdown(f"### {event.title}")
+            st.markdown(f"**{event_times.format_event_time(event.start)}**")
+            st.markdown(f"Location: **{event.loc}**")
+            if event_id in conflicts:
+                st.markdown("**Time conflict** with another event on your schedule.")
+            
+            col1, col2, col3 = st.columns([1.2, 1, 1])
+            with col1:
+                st.button("View Details", type="secondary", key=f"detail_sched_{event_id}", on_click=show_details, args=(event,))
+            with col2:
+                st.button("Cancel RSVP", type="secondary", key=f"cancel_sched_{event_id}",
+                          on_click=cancel_rsvp, args=(event_id, event.title))
+            card_end()
@@ -0,0 +1,108 @@
+import time
+
+import streamlit as st
+
+from zenith import actions, checkins
+from zenith.stores import get_checkin_store, get_thumbnails
+from zenith.ui import card_end, card_start, open_modal, show_modal_dialog
+
+AVATAR_SIZE = (200, 200)
+
+
+@actions.action
+def add_goal():
+    """Adds the goal typed into the "Add a new goal" box, unless it is empty or a repeat."""
+    new_goal = st.session_state.new_goal
+    if new_goal and new_goal not in st.session_state.user_goals:
+        st.session_state.user_goals.append(new_goal)
+
+
+@actions.action
+def remove_goal(goal):
+    if goal in st.session_state.user_goals:
+        st.session_state.user_goals.remove(goal)
+
+
+# --- 8. PROFILE / SETTINGS PAGE (UPGRADED) ---
+def page_profile():
+    """Renders the 'Profile & Settings' page."""
+    
+    # --- Check for placeholder modals ---
+    if st.session_state.show_modal:
+        show_modal_dialog()
+        
+    st.title("Profile & Settings")
+
+    # --- User Info Card ---
+    card_start()
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        avatar = get_thumbnails().url("https://placehold.co/100x100/6A11CB/FFFFFF?text=A&font=inter", AVATAR_SIZE)
+        st.markdown(f'<img src="{avatar}" width="100" alt="Profile photo">', unsafe_allow_html=True)
+    with col2:
+        st.subheader("Alex Johnson")
+        st.markdown("B.S. Computer Science")
+        st.markdown("Joined: Nov 2024")
+    card_end()
+    
+    # --- Your Stats Card ---
+    card_start()
+    st.subheader("Your Stats (Last 7 Days)")
+    week = 7 * checkins.DAY_SECONDS
+    now = time.time()
+    store = get_checkin_store()
+    mood, stress, _ = store.averages(st.session_state.user_id, now - week, now + 1)
+    prev_mood, prev_stress, _ = store.averages(st.session_state.user_id, now - 2 * week, now - week)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            "Avg. Mood",
+            f"{mood:.1f} / 5" if mood is not None else "–",
+            f"{mood - prev_mood:+.1f}" if mood is not None and prev_mood is not None else None,
+        )
+    with col2:
+        st.metric(
+            "Avg. Stress",
+            f"{stress:.1f} / 5" if stress is not None else "–",
+            f"{stress - prev_stress:+.1f}" if stress is not None and prev_stress is not None else None,
+            delta_color="inverse",
+        )
+    with col3:
+        st.metric("Focus Hours", "12.5", "Up 3.0")
+    card_end()
+
+    # --- Your Goals Card ---
+    card_start()
+    st.subheader("Your Wellness Goals")
+    
+    # Display existing goals
+    for i, goal in enumerate(st.session_state.user_goals):
+        col1, col2 = st.columns([0.9, 0.1])
+        with col1:
+            st.markdown(f"<span style='margin-left: 5px;'>{goal}</span>", unsafe_allow_html=True)
+        with col2:
+            st.button("Remove", key=f"del_{i}", help="Remove goal", on_click=remove_goal, args=(goal,))
+    
+    # Add new goal
+    st.markdown("---")
+    st.text_input("Add a new goal:", key="new_goal")
+    st.button("Add Goal", type="secondary", on_click=add_goal)
+    card_end()
+
+    # --- Settings Card ---
+    card_start()
+    st.subheader("App Settings")
+    st.toggle("Enable Push Notifications", value=True)
+    st.toggle("Sync with Calendar", value=True)
+    st.toggle("Personalize AI Coach", value=True)
+    
+    st.subheader("Data & Privacy")
+    st.toggle("Share Anonymized Data for Research", value=True)
+    st.button("View Privacy Policy", type="secondary", key="privacy", on_click=open_modal, args=("Privacy Policy",))
+    card_end()
+    
+    # --- Actions ---
+    card_start()
+    st.button("Help & Support", key="help", on_click=open_modal, args=("Help & Support",))
+    st.button("Logout", type="secondary", key="logout", on_click=open_modal, args=("Logout",))
+    card_end()
@@ -0,0 +1,167 @@
+import datetime
+import time
+
+import streamlit as st
+
+from zenith import actions, sleep_chart, sleep_stats, sleep_store, timers
+from zenith.stores import get_insights, get_sleep_stats, get_sleep_store
+from zenith.ui import card_end, card_highlight_end, card_highlight_start, card_start
+
+# The Sleep page is the only user of the chart stack (Altair, pandas), so
+# those are imported the first time someone opens it, not at app start.
+
+
+@st.cache_resource
+def get_sleep_charts():
+    """Returns the per-user Sleep Trends chart specs, rebuilt only on a new log."""
+    return sleep_chart.SleepChartCache(get_sleep_store())
+
+
+@actions.action
+def set_wind_down(active):
+    """Opens or closes the wind-down routine on the Sleep page."""
+    st.session_state.wind_down_active = active
+
+
+@actions.action
+def start_wind_down_timer():
+    """Starts the 30-minute wind-down timer; the app shows its countdown from the next run."""
+    timers.start_wind_down(time.time())
+    actions.notify("Wind-down timer started. See you in 30!")
+
+
+def show_wind_down_routine():
+    """
+    Renders the full-page wind-down modal.
+    Replaces the content of the 'Sleep' page when active.
+    """
+    card_highlight_start()
+    st.subheader("Start Your Wind-Down")
+    st.markdown("Try this 30-minute routine to prepare your mind for sleep.")
+    
+    st.markdown(
+        """
+        <div class="wind-down-item">
+            <span>Put phone on charger (away from bed)</span>
+        </div>
+        <div class="wind-down-item">
+            <span>Read a physical book for 15 mins</span>
+        </div>
+        <div class="wind-down-item">
+            <span>Sip some non-caffeinated tea</span>
+        </div>
+        <div class="wind-down-item">
+            <span>Do a 5-minute guided meditation</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    
+    st.button("Start 30-Min Timer", on_click=start_wind_down_timer)
+    
+    st.button("Close", type="secondary", on_click=set_wind_down, args=(False,))
+    card_highlight_end()
+
+
+# --- 3. SLEEP TRACKER PAGE (UPGRADED) ---
+def page_sleep():
+    """Renders the 'Sleep' page or its sub-modals."""
+    
+    # Check if a sub-page (like wind-down) is active
+    if st.session_state.wind_down_active:
+        show_wind_down_routine()
+        return # Stop rendering the rest of the page
+
+    # --- If no sub-page, render the main 'Sleep' page ---
+    st.title("Sleep Tracker")
+    st.markdown("Good sleep is the foundation of wellness.")
+
+    # --- Metric Cards ---
+    # Saving a log happens further down the page, so read the aggregates
+    # through a placeholder that is filled in once the page is done.
+    metrics = st.empty()
+    st.markdown("---") # Visual separator
+
+    # --- Log Your Sleep Card ---
+    card_start()
+    st.subheader("Log Your Sleep")
+    with st.expander("Tap to open log"):
+        log_date = st.date_input("Night of:", datetime.date.today() - datetime.timedelta(days=1))
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            bed_time = st.time_input("Went to bed:", datetime.time(23, 30))
+        with col2:
+            wake_time = st.time_input("Woke up:", datetime.time(7, 15))
+        
+        quality = st.slider("Sleep Quality (1 = Poor, 5 = Great)", 1, 5, 4)
+        
+        if st.button("Save Log", type="secondary"):
+            get_sleep_stats().append(st.session_state.user_id, log_date, bed_time, wake_time, quality)
+            get_insights().refresh(st.session_state.user_id)
+            st.toast("Sleep log saved!")
+    card_end()
+
+    # --- Sleep Trends Chart ---
+    card_start()
+    st.subheader("Your Sleep Trends")
+
+    # Cached per user until a new night is logged (see zenith.sleep_chart)
+    spec = get_sleep_charts().spec(st.session_state.user_id)
+    if spec is None:
+        st.markdown("Log a night above to see your trends here.")
+    else:
+        st.vega_lite_chart(spec, use_container_width=True)
+    card_end()
+
+    # --- Wind-down Card ---
+    today = sleep_store.to_night(datetime.date.today())
+    stats = get_sleep_stats().get(st.session_state.user_id)
+    this_week, last_week = stats.week(today), stats.week(today - 7)
+
+    card_highlight_start()
+    st.subheader("Wind-down Routine")
+    if this_week.n:
+        bedtime = f"Your average bedtime this week was **{sleep_stats.format_clock(this_week.mean_bedtime_min)}**. "
+    else:
+        bedtime = ""
+    st.markdown(f"{bedtime}Students who wind-down 30 minutes before bed report better sleep quality.")
+    st.button("Start Wind-down Routine", type="secondary", key="wind_down", on_click=set_wind_down, args=(True,))
+    card_highlight_end()
+
+    with metrics.container():
+        render_sleep_metrics(this_week, last_week)
+
+
+def render_sleep_metrics(this_week, last_week):
+    """Renders the Sleep Score / Duration / Consistency cards for this week."""
+    if this_week.n:
+        score = this_week.score
+        score_text, score_sub = str(score), sleep_stats.score_label(score)
+        duration_text = sleep_stats.format_duration(this_week.mean_duration_min)
+        consistency_text = f"{this_week.consistency_pct:.0f}%"
+    else:
+        score_text, score_sub, duration_text, consistency_text = "–", "No logs this week", "–", "–"
+    if this_week.n and last_week.n:
+        change = this_week.consistency_pct - last_week.consistency_pct
+        consistency_text = f"{'↑' if change >= 0 else '↓'} {abs(change):.0f}%"
+        consistency_sub = "vs. last week"
+    else:
+        consistency_sub = "this week"
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(
+            f"<div class='metric-card'><h3>Sleep Score</h3><p>{score_text}</p><small>{score_sub}</small></div>",
+            unsafe_allow_html=True
+        )
+    with col2:
+        st.markdown(
+            f"<div class='metric-card'><h3>Duration</h3><p>{duration_text}</p><small>Target: 8h</small></div>",
+            unsafe_allow_html=True
+        )
+    with col3:
+        st.markdown(
+            f"<div class='metric-card'><h3>Consistency</h3><p>{consistency_text}</p><small>{consistency_sub}</small></div>",
+            unsafe_allow_html=True
+        )
@@ -0,0 +1,102 @@
+import datetime
+
+import streamlit as st
+
+from zenith import actions, config, event_times
+from zenith.stores import get_checkin_store, get_event_catalog, get_insights
+from zenith.ui import card_end, card_highlight_end, card_highlight_start, card_start, event_distance, set_page
+
+
+@actions.action
+def set_breathing(active):
+    """Opens or closes the breathing exercise on the Today page."""
+    st.session_state.breathing_active = active
+
+
+def show_breathing_exercise():
+    """
+    Renders the full-page breathing exercise modal.
+    Replaces the content of the 'Today' page when active.
+    """
+    card_highlight_start()
+    st.subheader("60-Second Breathing Reset")
+    st.markdown(
+        """
+        <div class="breathing-container">
+            <div class="breathing-circle">
+                <span class="breathing-text"></span>
+            </div>
+            <p style="margin-top: 20px;">Follow the rhythm. Inhale as the circle grows, exhale as it shrinks.</p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    st.button("I'm Done", type="secondary", on_click=set_breathing, args=(False,))
+    card_highlight_end()
+
+
+# --- 1. TODAY / HOME PAGE ---
+def page_today():
+    """Renders the 'Today' (Home) page or its sub-modals."""
+    
+    # Check if a sub-page (like breathing) is active
+    if st.session_state.breathing_active:
+        show_breathing_exercise()
+        return  # Stop rendering the rest of the page
+
+    # --- If no sub-page, render the main 'Today' page ---
+    st.title("Good Afternoon, Alex!")
+    st.markdown("How are you feeling right now?")
+
+    # --- Check-In Card ---
+    card_start()
+    st.subheader("Daily Check-In")
+    mood = st.slider("Your Mood (1 = Low, 5 = Great)", 1, 5, 3)
+    stress = st.slider("Your Stress (1 = Low, 5 = High)", 1, 5, 2)
+    tags = st.multiselect(
+        "What's on your mind?",
+        ["Exams", "Homework", "Social", "Sleep", "Relationships", "Future"],
+        ["Exams"]
+    )
+    if st.button("Log Now", key="log_now"):
+        get_checkin_store().log(st.session_state.user_id, mood, stress, tags)
+        get_insights().refresh(st.session_state.user_id)
+        st.toast(f"Logged: Mood {mood}/5, Stress {stress}/5")
+    card_end()
+
+    # --- Breathing Reset Card ---
+    card_highlight_start()
+    st.subheader("Try a Breathing Reset")
+    st.markdown("Your stress levels seem to be trending up this morning.")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("Start 60-Sec Reset", key="start_breathing", on_click=set_breathing, args=(True,))
+    with col2:
+        st.button("Maybe Later", type="secondary", key="later_breathing")
+    card_highlight_end()
+
+    # --- Insight Card ---
+    card_start()
+    st.subheader("Your AI Coach Insight")
+    # Precomputed in the background from your logs (see zenith.insights)
+    insight = get_insights().get(st.session_state.user_id)
+    if insight:
+        st.markdown(f"{insight.summary} **{insight.suggestion}**")
+    else:
+        st.markdown("Your coach is looking over your week. Check back in a moment.")
+    st.button("Chat with Coach", type="secondary", key="chat_coach_home", on_click=set_page, args=("AI Coach",))
+    card_end()
+
+    # --- Event Card ---
+    card_start()
+    st.subheader("Upcoming Event")
+    next_event = get_event_catalog().next_event(datetime.datetime.now(config.CAMPUS_TZ))
+    if next_event:
+        st.markdown(f"### {next_event.title}")
+        st.markdown(f"**{event_times.format_event_time(next_event.start)}**")
+        st.markdown(f"Location: **{next_event.loc}** • Cost: **{next_event.cost}** • Distance: **{event_distance(next_event)} away**")
+        st.markdown(next_event.desc)
+    else:
+        st.markdown("No upcoming events right now. Check back soon!")
+    st.button("View All Events", key="view_events_home", on_click=set_page, args=("Events",))
+    card_end()